@@ -0,0 +1,69 @@
+"""
+순차 검색 vs 동시(asyncio) 검색 처리량 비교 벤치마크
+로컬 가짜 검색 서버를 띄워 실제 네이버에 요청하지 않음
+
+실행: python -m benchmarks.bench_async_fetch --keywords 40 --concurrency 4 8
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from benchmarks.fake_search_server import FakeSearchServer
+from src.async_scraper import AsyncNaverScraper
+from src.pacing import PacingController
+from src.scraper import NaverScraper
+
+
+def run_serial(scraper, keywords):
+    """기존 방식: 키워드마다 검색 페이싱 간격을 지키며 순차 검색"""
+    ok = 0
+    for keyword in keywords:
+        if scraper.get_search_results(keyword, page=1) is not None:
+            ok += 1
+    return ok
+
+
+def run_async(scraper, keywords, concurrency):
+    """AsyncNaverScraper.fetch_many 로 동시 검색"""
+    async_scraper = AsyncNaverScraper(scraper, concurrency=concurrency)
+    results = asyncio.run(async_scraper.fetch_many(keywords))
+    return sum(1 for soup in results.values() if soup is not None)
+
+
+def report(label, count, ok, elapsed):
+    per_minute = count / elapsed * 60 if elapsed else 0
+    print(f"{label:<28} {elapsed:8.2f}s  성공 {ok}/{count}  {per_minute:8.1f} 키워드/분")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='순차 vs 동시 검색 처리량 벤치마크')
+    parser.add_argument('--keywords', type=int, default=40, help='검색할 키워드 수')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[4, 8], help='동시 검색 수 목록')
+    parser.add_argument('--pacing-speed', type=float, default=1.0, help='페이싱 처리량 배수 (PACING_SPEED)')
+    parser.add_argument('--skip-serial', action='store_true', help='순차 검색 측정 생략')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    keywords = [f"벤치마크 키워드 {i}" for i in range(args.keywords)]
+
+    with FakeSearchServer() as server:
+        scraper = NaverScraper()
+        scraper.base_url = server.base_url
+        # 로컬 가짜 서버 대상이므로 다른 프로세스와 공유하는 요청 예산은 사용하지 않음
+        scraper.pacing = PacingController(speed=args.pacing_speed, shared_budget=False)
+
+        if not args.skip_serial:
+            started = time.perf_counter()
+            ok = run_serial(scraper, keywords)
+            report('순차 (기존 루프)', len(keywords), ok, time.perf_counter() - started)
+
+        for concurrency in args.concurrency:
+            started = time.perf_counter()
+            ok = run_async(scraper, keywords, concurrency)
+            report(f'동시 (concurrency={concurrency})', len(keywords), ok, time.perf_counter() - started)
+
+
+if __name__ == '__main__':
+    main()
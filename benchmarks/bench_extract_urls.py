@@ -0,0 +1,119 @@
+"""
+전체 URL 수집(extract_urls) 단일 패스 구현 vs 기존 구현 비교 벤치마크
+저장된 검색 결과 페이지와, 그 본문을 N배로 늘린 큰 페이지에서 두 구현의 결과(URL 과 순서)가 같은지 확인하고
+페이지당 시간을 출력. 결과가 다르면 종료 코드 1.
+
+실행: python -m benchmarks.bench_extract_urls [debug_search.html ...] --scale 1 2 4 8
+"""
+
+import argparse
+import logging
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+from src.scraper import NaverScraper
+
+
+def legacy_extract_urls(soup):
+    """기존 NaverScraper.extract_urls (전체 트리를 여러 번 탐색, 비교 기준용 사본)"""
+    urls = []
+
+    # 1. 모든 a 태그의 모든 속성
+    for a_tag in soup.find_all('a'):
+        for _, attr_value in a_tag.attrs.items():
+            if isinstance(attr_value, str) and ('http://' in attr_value or 'https://' in attr_value):
+                if 'naver.com' in attr_value:
+                    urls.append(attr_value)
+
+    # 2. nocr 속성 요소
+    for elem in soup.find_all(attrs={'nocr': True}):
+        if elem.name == 'a' and elem.has_attr('href'):
+            urls.append(elem['href'])
+        else:
+            for inner_a in elem.find_all('a', href=True):
+                urls.append(inner_a['href'])
+
+    # 3. 클래스 2개 이상 div 안의 링크
+    containers = [div for div in soup.find_all('div') if div.has_attr('class') and len(div['class']) >= 2]
+    for container in containers:
+        for a in container.find_all('a', href=True):
+            if 'naver.com' in a['href']:
+                urls.append(a['href'])
+
+    # 4. 키워드 텍스트의 부모 / 조부모 안의 링크
+    keywords = ["cafe", "blog", "카페", "블로그", "지식인", "포스트", "뉴스"]
+    for keyword in keywords:
+        for element in soup.find_all(string=lambda t: keyword in t.lower() if t else False):
+            parent = element.parent
+            for a in parent.find_all('a', href=True):
+                if 'naver.com' in a['href']:
+                    urls.append(a['href'])
+            if parent.parent:
+                for a in parent.parent.find_all('a', href=True):
+                    if 'naver.com' in a['href']:
+                        urls.append(a['href'])
+
+    normalized_urls = []
+    for url in urls:
+        if 'cafe.naver.com' in url or 'blog.naver.com' in url:
+            base_url = url.split('?')[0]
+            if '=' in base_url:
+                base_url = base_url.split('=')[0]
+            normalized_urls.append(base_url)
+        else:
+            normalized_urls.append(url)
+    return list(dict.fromkeys(normalized_urls))
+
+
+def scaled(html: str, scale: int) -> str:
+    """<body> 내용을 scale 배로 반복한 페이지"""
+    if scale <= 1:
+        return html
+    head, sep, rest = html.partition('<body')
+    open_end = rest.index('>') + 1
+    body, close, tail = rest[open_end:].rpartition('</body>')
+    return head + sep + rest[:open_end] + body * scale + close + tail
+
+
+def measure(func, soup, repeat: int):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func(soup)
+    return result, (time.perf_counter() - started) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='extract_urls 단일 패스 vs 기존 구현 벤치마크')
+    parser.add_argument('pages', nargs='*', default=['debug_search.html'], help='저장된 검색 결과 HTML 파일')
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 2, 4, 8], help='본문 반복 배수 목록')
+    parser.add_argument('--repeat', type=int, default=3, help='측정 반복 횟수')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    scraper = NaverScraper()
+    mismatches = 0
+    for page in args.pages:
+        with open(page, encoding='utf-8') as f:
+            html = f.read()
+        for scale in args.scale:
+            soup = BeautifulSoup(scaled(html, scale), 'html.parser')
+            nodes = sum(1 for _ in soup.descendants)
+            # 제한 시간 없이 전체 결과 비교
+            expected, legacy_ms = measure(legacy_extract_urls, soup, args.repeat)
+            result, new_ms = measure(lambda s: scraper.extract_urls(s), soup, args.repeat)
+            same = result == expected
+            print(f"{page} x{scale:<3} 노드 {nodes:>7}  URL {len(result):>4}개  "
+                  f"기존 {legacy_ms:9.1f} ms  단일 패스 {new_ms:7.1f} ms  "
+                  f"x{legacy_ms / new_ms if new_ms else 0:6.1f}  {'일치' if same else '불일치'}")
+            if not same:
+                mismatches += 1
+
+    if mismatches:
+        print(f"결과 불일치 {mismatches}건")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,216 @@
+"""
+파서/추출 함수 마이크로 벤치마크 (오프라인, 저장된 검색 결과 페이지 corpus 사용)
+benchmarks/corpus/manifest.json 의 페이지(상하단 분리 / 단일 블록 / 인기글 섹션 / 파워콘텐츠 / 봇 차단)마다
+파싱, 단일 패스 추출(ParsedSerp), normalize_url, extract_main_urls, extract_popular_post_urls,
+check_all_main_cafe, analyze_keyword_layout 의 호출당 시간(배치 최솟값)과 최대 메모리 할당량(tracemalloc)을 측정.
+
+예산 파일(benchmarks/extractor_budget.json)에 기록된 값보다 허용 비율 이상 느려지거나 메모리를 더 쓰면 종료 코드 1.
+시간 예산은 고정 파이썬 작업(calibrate)의 측정 시간 비율로 환산해 비교하므로 기계 속도/부하 차이는 어느 정도 상쇄됨
+(그래도 예산을 기록한 기계와 많이 다르면 그 기계에서 --save-budget 으로 다시 기록해 둘 것).
+
+실행: python -m benchmarks.bench_extractors [--backend lxml] [--tolerance 0.25] [--save-budget]
+"""
+
+import argparse
+import gc
+import gzip
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+from src.config import HTML_PARSER_BACKEND
+from src.parser_backend import get_parser
+from src.scraper import NaverScraper
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), 'corpus')
+BUDGET_FILE = os.path.join(os.path.dirname(__file__), 'extractor_budget.json')
+
+# 측정 잡음 때문에 이보다 작은 차이는 회귀로 보지 않음
+MIN_REGRESSION_MS = 0.25
+MIN_REGRESSION_KIB = 16.0
+
+
+def load_corpus(corpus_dir: str = CORPUS_DIR) -> list:
+    """manifest.json 순서대로 [(이름, HTML 문자열), ...]"""
+    with open(os.path.join(corpus_dir, 'manifest.json'), encoding='utf-8') as f:
+        manifest = json.load(f)
+    pages = []
+    for entry in manifest:
+        path = os.path.join(corpus_dir, entry['file'])
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'rb') as f:
+            pages.append((entry['name'], f.read().decode('utf-8')))
+    return pages
+
+
+def page_cases(scraper, parser, html: str) -> dict:
+    """측정 대상 이름 → 인자 없는 호출 함수 (추출 함수는 ParsedSerp 를 만들어 둔 문서로 측정)"""
+    doc = parser.parse(html)
+    parsed = doc.parsed()
+    hrefs = parsed.main_links + parsed.fallback_links + [href for href, _ in parsed.popular_links]
+    scraper.get_search_results = lambda *args, **kwargs: doc
+
+    def normalize_all():
+        for href in hrefs:
+            scraper.normalize_url(href)
+
+    return {
+        'parse': lambda: parser.parse(html),
+        'parsed_serp': lambda: parser.parse(html).parsed(),
+        'normalize_url': normalize_all,
+        'extract_main_urls': lambda: scraper.extract_main_urls(doc),
+        'extract_popular_post_urls': lambda: scraper.extract_popular_post_urls(doc),
+        'check_all_main_cafe': lambda: scraper.check_all_main_cafe(doc),
+        'analyze_keyword_layout': lambda: scraper.analyze_keyword_layout('bench'),
+    }
+
+
+def time_call(func, min_seconds: float, batches: int = 5) -> float:
+    """
+    호출당 시간 (ms) — 배치별 평균 중 최솟값 (timeit 과 같이 GC 를 끄고 측정, 다른 프로세스 간섭 최소화),
+    배치 크기는 배치 1개가 min_seconds 이상 걸리도록 조정
+    """
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _time_batches(func, min_seconds, batches)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _time_batches(func, min_seconds: float, batches: int) -> float:
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_seconds or loops >= 1 << 20:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, min(10, int(min_seconds / elapsed) + 1))
+    samples = [elapsed / loops]
+    for _ in range(batches - 1):
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - started) / loops)
+    return min(samples) * 1000
+
+
+def calibrate() -> None:
+    """기계 속도 기준 작업 (문자열/딕셔너리/정렬 — 파싱·추출과 비슷한 순수 파이썬 작업)"""
+    table = {}
+    for i in range(20000):
+        table[str(i)] = i * 2
+    sorted(table.items(), key=lambda kv: -kv[1])
+
+
+def peak_kib(func) -> float:
+    """1회 호출 중 최대 메모리 할당량 (KiB, tracemalloc)"""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(0, peak - base) / 1024
+
+
+def check_budget(results: dict, budget: dict, tolerance: float, speed: float = 1.0) -> list:
+    """
+    예산 대비 회귀 목록 [(항목, 지표, 예산값, 측정값), ...]
+
+    Args:
+        speed: 지금 기계의 기준 작업 시간 / 예산 기록 때 기준 작업 시간 (시간 예산에 곱함)
+    """
+    regressions = []
+    for key, measured in results.items():
+        limit = budget.get(key)
+        if not limit:
+            continue
+        limit_ms = round(limit['ms'] * speed, 4)
+        if measured['ms'] > limit_ms * (1 + tolerance) and measured['ms'] - limit_ms >= MIN_REGRESSION_MS:
+            regressions.append((key, 'ms', limit_ms, measured['ms']))
+        if measured['kib'] > limit['kib'] * (1 + tolerance) and measured['kib'] - limit['kib'] >= MIN_REGRESSION_KIB:
+            regressions.append((key, 'kib', limit['kib'], measured['kib']))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='파서/추출 함수 마이크로 벤치마크')
+    parser.add_argument('--backend', default=HTML_PARSER_BACKEND, help='HTML 파서 백엔드')
+    parser.add_argument('--corpus', default=CORPUS_DIR, help='manifest.json 이 있는 corpus 폴더')
+    parser.add_argument('--budget', default=BUDGET_FILE, help='예산 파일 (JSON)')
+    parser.add_argument('--tolerance', type=float, default=None, help='허용 회귀 비율 (기본: 예산 파일 값 또는 0.25)')
+    parser.add_argument('--min-seconds', type=float, default=0.05, help='측정 배치 1개의 최소 시간 (초)')
+    parser.add_argument('--save-budget', action='store_true', help='이번 측정값을 예산 파일로 저장')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    scraper = NaverScraper()
+    html_parser = get_parser(args.backend)
+    results = {}
+    calibration = [time_call(calibrate, args.min_seconds)]
+    print(f"백엔드 {html_parser.name}")
+    print(f"{'페이지/항목':<44} {'ms/호출':>10} {'최대 KiB':>10}")
+    for name, html in load_corpus(args.corpus):
+        for case, func in page_cases(scraper, html_parser, html).items():
+            key = f"{html_parser.name}/{name}/{case}"
+            results[key] = {
+                'ms': round(time_call(func, args.min_seconds), 4),
+                'kib': round(peak_kib(func), 1),
+            }
+            print(f"{name + '/' + case:<44} {results[key]['ms']:>10.3f} {results[key]['kib']:>10.1f}")
+    calibration.append(time_call(calibrate, args.min_seconds))
+    calibration_ms = round(sum(calibration) / len(calibration), 4)
+    print(f"기준 작업 {calibration_ms:.3f} ms")
+
+    budget_doc = {}
+    if os.path.exists(args.budget):
+        with open(args.budget, encoding='utf-8') as f:
+            budget_doc = json.load(f)
+    tolerance = args.tolerance if args.tolerance is not None else budget_doc.get('tolerance', 0.25)
+
+    if args.save_budget:
+        # 백엔드별로 따로 기록할 수 있도록 기준 작업 시간도 백엔드별로 보관
+        budget_doc.setdefault('results', {}).update(results)
+        budget_doc.setdefault('calibration_ms', {})[html_parser.name] = calibration_ms
+        budget_doc['tolerance'] = tolerance
+        with open(args.budget, 'w', encoding='utf-8') as f:
+            json.dump(budget_doc, f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"예산 저장: {args.budget} ({len(results)}개 항목)")
+        return
+
+    budget = budget_doc.get('results', {})
+    if not budget:
+        print(f"예산 파일 없음 ({args.budget}) — --save-budget 으로 기록")
+        return
+    budget_calibration = budget_doc.get('calibration_ms', {}).get(html_parser.name)
+    speed = calibration_ms / budget_calibration if budget_calibration else 1.0
+    regressions = check_budget(results, budget, tolerance, speed)
+    if regressions:
+        # 일시적인 부하로 느려진 것일 수 있으므로 회귀 항목만 한 번 더 측정해 더 빠른 값으로 판정
+        cases = {}
+        for name, html in load_corpus(args.corpus):
+            for case, func in page_cases(scraper, html_parser, html).items():
+                cases[f"{html_parser.name}/{name}/{case}"] = func
+        for key in {key for key, metric, _, _ in regressions if metric == 'ms'}:
+            results[key]['ms'] = min(results[key]['ms'], round(time_call(cases[key], args.min_seconds), 4))
+        regressions = check_budget(results, budget, tolerance, speed)
+    for key, metric, limit, measured in regressions:
+        print(f"회귀: {key} {metric} {limit} → {measured} (허용 {tolerance:.0%})")
+    if regressions:
+        sys.exit(1)
+    print(f"예산 이내 (허용 {tolerance:.0%}, 기계 속도 보정 x{speed:.2f}, "
+          f"비교 {sum(1 for k in results if k in budget)}개 항목)")
+
+
+if __name__ == '__main__':
+    main()
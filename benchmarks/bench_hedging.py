@@ -0,0 +1,60 @@
+"""
+검색 요청 헤징 효과 벤치마크
+일부 요청이 크게 늦는(tail latency) 가짜 검색 서버에 순차 검색을 실행해
+헤징 사용/미사용 시 전체 소요 시간과 추가 요청 수를 비교
+
+실행: python -m benchmarks.bench_hedging --keywords 60 --tail-ratio 0.08 --tail-delay 3
+"""
+
+import argparse
+import logging
+import time
+
+from benchmarks.fake_search_server import FakeSearchServer
+from src.hedging import HedgedFetcher
+from src.pacing import PacingController
+from src.scraper import NaverScraper
+
+
+def run(server, keywords, hedging, max_ratio, min_samples):
+    """순차 검색 1회 실행 후 (소요 시간, 성공 수, 서버가 받은 요청 수, 헤징 통계) 반환"""
+    scraper = NaverScraper()
+    scraper.base_url = server.base_url
+    scraper.pacing = PacingController(speed=100, shared_budget=False)
+    scraper.hedger = HedgedFetcher(scraper._fetch_search_requests, max_ratio=max_ratio, min_samples=min_samples,
+                                   acquire_slot=scraper.pacing.budget('search').try_acquire) if hedging else None
+
+    before = server.request_count
+    started = time.perf_counter()
+    ok = sum(1 for _, soup in scraper.iter_search_results(keywords) if soup is not None)
+    elapsed = time.perf_counter() - started
+    stats = scraper.hedger.stats() if scraper.hedger else None
+    return elapsed, ok, server.request_count - before, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='검색 요청 헤징 효과 벤치마크')
+    parser.add_argument('--keywords', type=int, default=60, help='검색할 키워드 수')
+    parser.add_argument('--tail-ratio', type=float, default=0.08, help='크게 늦는 요청 비율')
+    parser.add_argument('--tail-delay', type=float, default=3.0, help='늦는 요청의 추가 지연 (초)')
+    parser.add_argument('--max-ratio', type=float, default=0.1, help='헤지 요청 비율 상한')
+    parser.add_argument('--min-samples', type=int, default=10, help='헤지 시작 전 최소 표본 수')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    keywords = [f"벤치마크 키워드 {i}" for i in range(args.keywords)]
+
+    with FakeSearchServer(latency=(0.05, 0.15), tail=(args.tail_ratio, args.tail_delay)) as server:
+        for hedging in (False, True):
+            elapsed, ok, sent, stats = run(server, keywords, hedging, args.max_ratio, args.min_samples)
+            label = '헤징 사용' if hedging else '헤징 미사용'
+            print(f"{label:<10} {elapsed:7.2f}s  성공 {ok}/{len(keywords)}  서버 요청 {sent}건")
+            if stats:
+                print(f"           헤지 {stats['hedges_fired']}건 (승리 {stats['hedges_won']}건, "
+                      f"상한 초과 {stats['hedges_capped']}건, 페이싱 슬롯 없음 {stats['hedges_no_slot']}건), "
+                      f"절약 {stats['saved_seconds']}초, "
+                      f"p90 {stats['p90_seconds']}초")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+"""
+monitor_keywords 대규모(1만 키워드 이상) 부하 테스트
+합성 검색 결과를 주는 로컬 가짜 검색 서버 + 메모리 DB 로 KeywordMonitor.monitor_keywords 1회차를 실행하고,
+처리량과 함께 모든 행의 노출/순위/삭제 판정을 생성기의 정답과 비교.
+
+Chrome 이 필요한 단계(삭제 확인, 레이아웃 측정)는 정답을 돌려주는 모의 브라우저로 대신하고,
+--browser-seconds 로 URL 1개당 브라우저 작업 시간을 흉내 냄 (삭제 확인 횟수도 함께 출력).
+삭제 확인 캐시는 임시 파일을 쓰며, --cycles 로 여러 회차를 연달아 실행하면 회차별 삭제 확인 횟수를 비교할 수 있음.
+
+실행: python -m benchmarks.bench_monitor_scale --keywords 10000 --rows-per-keyword 2
+      (동시 검색은 SEARCH_CONCURRENCY, 파싱 워커는 PARSE_WORKERS 환경변수로 지정)
+"""
+
+import argparse
+import logging
+import random
+import os
+import resource
+import tempfile
+import threading
+import time
+
+from benchmarks.fake_search_server import FakeSearchServer
+from benchmarks.memory_db import InMemoryDatabase
+from benchmarks.serp_generator import SyntheticSearchSite
+from src.monitor import KeywordMonitor
+from src.pacing import PacingController
+from src.parser_backend import get_parser
+from src.scraper import NaverScraper
+from src.verdict_cache import DeletionVerdictCache
+
+
+def build_scenario(keywords: int, rows_per_keyword: int, exposed_ratio: float, deleted_ratio: float,
+                   seed: int = 1):
+    """
+    키워드/행 구성 + 검색 결과에 배치할 URL
+
+    Returns:
+        (DB 행 목록, {키워드: {URL: 순위}}, 실제로 삭제된 URL 집합)
+    """
+    rng = random.Random(seed)
+    rows, targets, deleted = [], {}, set()
+    row_id = 0
+    for k in range(keywords):
+        keyword = f"합성 키워드 {k}"
+        ranks = rng.sample(range(1, 11), rows_per_keyword)
+        for rank in ranks:
+            row_id += 1
+            url = f"https://cafe.naver.com/fox5282/{1000000 + row_id}"
+            roll = rng.random()
+            if roll < deleted_ratio:
+                deleted.add(url)
+            elif roll < deleted_ratio + exposed_ratio:
+                targets.setdefault(keyword, {})[url] = rank
+            rows.append({'row': row_id, 'keyword_id': k + 1, 'keyword': keyword, 'target_url': url,
+                         'is_deleted': 'X', 'product': 'synthetic'})
+    return rows, targets, deleted
+
+
+class SimulatedBrowser:
+    """Chrome 이 필요한 NaverScraper 단계의 모의 구현 (정답 반환 + URL당 작업 시간 흉내)"""
+
+    def __init__(self, site: SyntheticSearchSite, deleted: set, seconds_per_url: float = 0.0):
+        self.site = site
+        self.deleted = deleted
+        self.seconds_per_url = seconds_per_url
+        self.checks = 0
+        self.layouts = 0
+        self._lock = threading.Lock()
+
+    def install(self, scraper: NaverScraper):
+        scraper.check_posts_deleted_parallel = self.check_posts_deleted_parallel
+        scraper.get_layout_metrics = self.get_layout_metrics
+
+    def check_posts_deleted_parallel(self, urls) -> dict:
+        unique_urls = list(dict.fromkeys(u for u in urls if u))
+        with self._lock:
+            self.checks += len(unique_urls)
+        if self.seconds_per_url:
+            time.sleep(self.seconds_per_url * len(unique_urls))
+        return {url: (url in self.deleted, '삭제된 게시글' if url in self.deleted else None) for url in unique_urls}
+
+    def get_layout_metrics(self, keyword: str, target_urls=None) -> dict:
+        with self._lock:
+            self.layouts += 1
+        serp = self.site.serp(keyword)
+        return {
+            'has_split_block': serp.has_split_block if serp else None,
+            'first_cafe_y_pct': None,
+            'url_metrics': {},
+        }
+
+
+def verify(db: InMemoryDatabase, site: SyntheticSearchSite, deleted: set) -> list:
+    """모든 행의 판정을 정답과 비교 — 다른 행 목록 [(row, 필드, 기대값, 결과값), ...]"""
+    mismatches = []
+    keyword, serp = None, None
+    # 행은 키워드별로 모여 있으므로 페이지를 키워드마다 한 번만 다시 생성 (전부 보관하지 않음)
+    for row in db.rows.values():
+        if row['keyword'] != keyword:
+            keyword = row['keyword']
+            serp = site.serp(keyword)
+        url = row['target_url']
+        expected_deleted = 'O' if url in deleted else 'X'
+        rank = None if url in deleted else serp.rank_of(url)
+        expected = {
+            # 노출로 존재를 추론한 행은 deletion_status 를 쓰지 않으므로 is_deleted 로 비교
+            'is_deleted': expected_deleted,
+            'rank': rank,
+            'exposure_status': 'O' if rank is not None else 'X',
+            'popular_status': 'O' if serp.popular_urls else 'X',
+        }
+        for field, value in expected.items():
+            if row.get(field) != value:
+                mismatches.append((row['row'], field, value, row.get(field)))
+        if db.main_cafe.get(row['keyword_id']) != serp.all_main_cafe:
+            mismatches.append((row['row'], 'is_main_cafe', serp.all_main_cafe, db.main_cafe.get(row['keyword_id'])))
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description='monitor_keywords 대규모 부하 테스트 (합성 검색 결과 + 메모리 DB)')
+    parser.add_argument('--keywords', type=int, default=10000, help='키워드 수')
+    parser.add_argument('--rows-per-keyword', type=int, default=2, help='키워드당 행(글) 수 (1~10)')
+    parser.add_argument('--exposed-ratio', type=float, default=0.7, help='검색 결과에 노출되는 글 비율')
+    parser.add_argument('--deleted-ratio', type=float, default=0.05, help='삭제된 글 비율')
+    parser.add_argument('--page-kib', type=int, default=0, help='검색 결과 페이지 크기 (KiB, 0이면 채움 없음)')
+    parser.add_argument('--latency', type=float, nargs=2, default=(0.0, 0.002), help='검색 응답 지연 범위 (초)')
+    parser.add_argument('--browser-seconds', type=float, default=0.0, help='삭제 확인 URL 1개당 브라우저 작업 시간 (초)')
+    parser.add_argument('--backend', default=None, help='HTML 파서 백엔드 (기본: HTML_PARSER_BACKEND)')
+    parser.add_argument('--seed', type=int, default=1, help='난수 시드')
+    parser.add_argument('--cycles', type=int, default=1, help='연달아 실행할 회차 수 (삭제 확인 캐시 효과 비교)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    rows, targets, deleted = build_scenario(args.keywords, args.rows_per_keyword, args.exposed_ratio,
+                                            args.deleted_ratio, args.seed)
+    site = SyntheticSearchSite(targets, page_kib=args.page_kib)
+    db = InMemoryDatabase(rows)
+    browser = SimulatedBrowser(site, deleted, args.browser_seconds)
+
+    cache_dir = tempfile.TemporaryDirectory()
+    with cache_dir, FakeSearchServer(page_factory=site.page, latency=tuple(args.latency)) as server:
+        scraper = NaverScraper()
+        scraper.base_url = server.base_url
+        # 로컬 가짜 서버 대상이므로 검색 간격/공유 요청 예산 없이 실행
+        scraper.pacing = PacingController(speed=10000, shared_budget=False)
+        if args.backend:
+            scraper.parser = get_parser(args.backend)
+        browser.install(scraper)
+        cache = DeletionVerdictCache(path=os.path.join(cache_dir.name, 'verdicts.sqlite3'), enabled=True,
+                                     normalize=scraper.normalize_url)
+        monitor = KeywordMonitor(scraper, db, verdict_cache=cache)
+
+        cycle_checks = []
+        started = time.perf_counter()
+        for _ in range(max(1, args.cycles)):
+            checks_before = browser.checks
+            updates = monitor.monitor_keywords()
+            cycle_checks.append(browser.checks - checks_before)
+        elapsed = (time.perf_counter() - started) / max(1, args.cycles)
+        scraper.parse_pool.close()
+
+    # 최대 RSS 는 검증(페이지 재생성) 전에 측정
+    peak_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    mismatches = verify(db, site, deleted)
+    print(f"키워드 {args.keywords}개 / 행 {len(rows)}개 ({scraper.parser.name})")
+    print(f"소요 {elapsed:.1f}s  ({args.keywords / elapsed * 60:.0f} 키워드/분), 결과 {len(updates)}건, "
+          f"검색 요청 {server.request_count}건")
+    print(f"삭제 확인(브라우저) {browser.checks}건, 레이아웃 측정 {browser.layouts}건, 최대 RSS {peak_mib:.0f} MiB")
+    if len(cycle_checks) > 1:
+        print(f"회차별 삭제 확인(브라우저) {cycle_checks}건 (소요는 회차 평균)")
+    for row, field, expected, actual in mismatches[:10]:
+        print(f"불일치: 행 {row} {field} 기대 {expected!r} / 결과 {actual!r}")
+    print(f"판정 불일치 {len(mismatches)}건")
+    if mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+검색 결과 파싱 프로세스 풀 처리량 벤치마크
+저장된 검색 결과 페이지를 여러 번 파싱해 직접 파싱(스레드 1개)과 워커 수별 ParsePool 처리량(페이지/초)을 비교.
+워커 결과가 직접 파싱한 ParsedSerp 와 다르면 종료 코드 1.
+
+실행: python -m benchmarks.bench_parse_pool [debug_search.html ...] --pages 64 --workers 1 2 4 8
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+from src.config import HTML_PARSER_BACKEND
+from src.parse_pool import ParsePool, parse_to_dict
+
+
+def report(label, count, elapsed, base=None):
+    per_second = count / elapsed if elapsed else 0
+    speedup = f"  x{base / elapsed:.2f}" if base else ''
+    print(f"{label:<24} {elapsed:8.2f}s  {per_second:8.1f} 페이지/초{speedup}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='검색 결과 파싱 프로세스 풀 처리량 벤치마크')
+    parser.add_argument('corpus', nargs='*', default=['debug_search.html'], help='저장된 검색 결과 HTML 파일')
+    parser.add_argument('--pages', type=int, default=64, help='파싱할 페이지 수 (corpus 를 반복)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8], help='워커 수 목록')
+    parser.add_argument('--backend', default=HTML_PARSER_BACKEND, help='HTML 파서 백엔드')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    corpus = []
+    for path in args.corpus:
+        with open(path, 'rb') as f:
+            corpus.append(f.read())
+    pages = [corpus[i % len(corpus)] for i in range(args.pages)]
+    print(f"페이지 {len(pages)}개 (corpus {len(corpus)}개), 백엔드 {args.backend}, CPU {os.cpu_count()}개")
+
+    started = time.perf_counter()
+    expected = [parse_to_dict(html, backend=args.backend) for html in pages]
+    inline = time.perf_counter() - started
+    report('직접 파싱 (스레드 1개)', len(pages), inline)
+
+    mismatches = 0
+    for workers in args.workers:
+        pool = ParsePool(workers=workers, backend=args.backend)
+        try:
+            # 워커 프로세스 시작/모듈 로딩은 측정에서 제외
+            for future in [pool.submit(html) for html in corpus * workers]:
+                future.result()
+            started = time.perf_counter()
+            results = [future.result() for future in [pool.submit(html) for html in pages]]
+            report(f'프로세스 풀 (워커 {workers}개)', len(pages), time.perf_counter() - started, inline)
+        finally:
+            pool.close()
+        if results != expected:
+            print(f"  워커 {workers}개 결과가 직접 파싱과 다름")
+            mismatches += 1
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+로컬 가짜 네이버 검색 서버 (벤치마크/부하 테스트용)
+/search.naver?query=... 요청에 저장된 검색결과 HTML을 지연 시간과 함께 반환
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PAGE_PATH = os.path.join(ROOT_DIR, 'debug_search.html')
+
+
+def load_default_page() -> bytes:
+    """debug_search.html 을 기본 검색결과 페이지로 사용"""
+    with open(DEFAULT_PAGE_PATH, 'rb') as f:
+        return f.read()
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    """클라이언트가 본문 수신 도중 연결을 끊는 경우(스트리밍 조기 종료)는 오류로 출력하지 않음"""
+
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        if isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            return
+        super().handle_error(request, client_address)
+
+
+class FakeSearchServer:
+    """백그라운드 스레드에서 동작하는 가짜 검색 서버"""
+
+    def __init__(self, page_factory=None, latency=(0.15, 0.35), port=0, tail=(0.0, 0.0)):
+        """
+        Args:
+            page_factory: keyword -> HTML bytes 함수 (None이면 debug_search.html 고정 반환)
+            latency: 응답 지연 범위 (초, (min, max))
+            port: 바인딩 포트 (0이면 임의 포트)
+            tail: (비율, 지연 초) — 요청 중 이 비율만큼은 지정한 시간만큼 더 늦게 응답 (tail latency 재현)
+        """
+        default_page = None if page_factory else load_default_page()
+        self.page_factory = page_factory or (lambda keyword: default_page)
+        self.latency = latency
+        self.tail = tail
+        self.request_count = 0
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # 헤더와 본문을 따로 보내므로 Nagle 알고리즘을 끄지 않으면 keep-alive 요청마다 ~40ms 지연 (delayed ACK)
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)
+                keyword = query.get('query', [''])[0]
+                with server._lock:
+                    server.request_count += 1
+                delay = random.uniform(*server.latency)
+                if random.random() < server.tail[0]:
+                    delay += server.tail[1]
+                time.sleep(delay)
+                body = server.page_factory(keyword)
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = _QuietHTTPServer(('127.0.0.1', port), Handler)
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """NaverScraper.base_url 에 넣을 검색 URL"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/search.naver"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
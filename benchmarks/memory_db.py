@@ -0,0 +1,113 @@
+"""
+메모리 DB (부하 테스트용 DatabaseClient 대역)
+KeywordMonitor 가 쓰는 DatabaseClient 메서드만 같은 형식으로 구현 — MySQL 없이 monitor_keywords / check_deleted_posts 실행
+"""
+
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+class InMemoryDatabase:
+    """keyword_results 행을 메모리에 보관하는 DatabaseClient 대역 (스레드 안전)"""
+
+    def __init__(self, rows: List[Dict]):
+        """
+        Args:
+            rows: [{'row', 'keyword_id', 'keyword', 'target_url', 'is_deleted'('O'/'X'), 'product'}, ...]
+        """
+        self._lock = threading.Lock()
+        self.rows = {row['row']: dict(row) for row in rows}
+        self.main_cafe = {}
+        self.layout = {}
+        self.update_calls = 0
+
+    def connect(self) -> bool:
+        return True
+
+    def disconnect(self):
+        pass
+
+    def get_keywords_for_monitoring(self, products: Optional[List[str]] = None) -> List[Dict]:
+        """DatabaseClient.get_keywords_for_monitoring 과 같은 형식 (id 순)"""
+        with self._lock:
+            return [
+                {
+                    'row': row['row'],
+                    'keyword_id': row['keyword_id'],
+                    'keyword': row['keyword'],
+                    'target_url': row.get('target_url', ''),
+                    'current_status': row.get('exposure_status', 'X'),
+                    'author_id': row.get('author_id', ''),
+                    'is_deleted': row.get('is_deleted', 'X'),
+                }
+                for _, row in sorted(self.rows.items())
+                if not products or row.get('product') in products
+            ]
+
+    def mark_rows_deleted(self, db_ids: List[int]):
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock:
+            self.update_calls += 1
+            for db_id in db_ids:
+                if db_id in self.rows:
+                    self.rows[db_id].update(is_deleted='O', updated_at=now)
+
+    def get_rows_for_deletion_check(self, limit: Optional[int] = None) -> List[Dict]:
+        """DatabaseClient.get_rows_for_deletion_check 과 같은 형식 (시도 시각 → checked_at 오래된 순, 없으면 먼저)"""
+        with self._lock:
+            rows = [
+                (row.get('deletion_attempted_at') or row.get('checked_at'),
+                 {'row': row['row'], 'target_url': row['target_url'], 'checked_at': row.get('checked_at')})
+                for row in self.rows.values()
+                if row.get('target_url') and row.get('is_deleted') != 'O'
+            ]
+        rows.sort(key=lambda r: (r[0] is not None, r[0] or '', r[1]['row']))
+        rows = [row for _, row in rows]
+        return rows[:limit] if limit else rows
+
+    def record_deletion_checks(self, results: List[Dict]):
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock:
+            self.update_calls += 1
+            for result in results:
+                row = self.rows.get(result['row'])
+                if row is None:
+                    continue
+                row['deletion_attempted_at'] = now
+                if result.get('is_deleted'):
+                    row.update(is_deleted='O', checked_at=now, updated_at=now)
+                elif result.get('is_deleted') is False and not result.get('cached'):
+                    row['checked_at'] = now
+
+    def batch_update_monitoring_results(self, results: List[Dict]):
+        """결과 항목을 row id 기준으로 행에 그대로 반영 (url 은 result_url 갱신)"""
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock:
+            self.update_calls += 1
+            for result in results:
+                row = self.rows.get(result.get('row'))
+                if row is None:
+                    continue
+                row.update({key: value for key, value in result.items() if key not in ('row', 'url')})
+                if result.get('url'):
+                    row['target_url'] = result['url']
+                if result.get('deletion_status'):
+                    # db_client 와 같이 삭제 여부를 기록할 때만 확인 시각 갱신
+                    row['is_deleted'] = result['deletion_status']
+                    row['checked_at'] = now
+                row['updated_at'] = now
+
+    def upsert_main_cafe_status(self, keyword_id: int, is_main_cafe: bool):
+        with self._lock:
+            self.main_cafe[keyword_id] = is_main_cafe
+
+    def upsert_layout_info(self, keyword_id: int, layout: dict):
+        with self._lock:
+            self.layout[keyword_id] = layout
+
+    def get_all_patrol_logs(self):
+        return [], []
+
+    def get_keyword_list_from_view(self):
+        return [], []
@@ -0,0 +1,251 @@
+"""
+HTML 파서 백엔드 일치 확인 + 속도 비교
+저장된 검색 결과 페이지(debug_search.html 등)를 백엔드별로 파싱해
+extract_main_urls / extract_popular_post_urls / check_all_main_cafe / analyze_keyword_layout 결과가
+기존 BeautifulSoup 구현(비교 기준용 사본)과 같은지 확인하고, 페이지당 파싱+추출 시간을 출력. 결과가 다르면 종료 코드 1.
+
+실행: python -m benchmarks.parser_parity [debug_search.html ...] [--corpus] [--repeat 20]
+"""
+
+import argparse
+import copy
+import logging
+import re
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+from benchmarks.bench_extractors import load_corpus
+from src.config import CAFE_URL_MAP
+from src.parser_backend import get_parser
+from src.scraper import NaverScraper
+
+BACKENDS = ('html.parser', 'lxml', 'selectolax')
+
+normalize_url = NaverScraper.normalize_url
+
+
+def _has_class(fragment):
+    """class 속성(문자열 또는 토큰 목록)에 fragment 가 들어 있는지 — 기존 class_=lambda 매칭"""
+    return lambda c: c and fragment in (c if isinstance(c, str) else ' '.join(c))
+
+
+def legacy_extract_main_urls(soup):
+    """기존 NaverScraper.extract_main_urls (관련 경험 카페글 섹션을 지운 사본에서 탐색, 비교 기준용 사본)"""
+    search_soup = copy.copy(soup)
+    for health_block in search_soup.find_all('div', class_=lambda c: c and 'fds-health-cafe-block-wrap' in c):
+        health_block.decompose()
+
+    urls = []
+    for a_tag in search_soup.find_all('a', attrs={'data-heatmap-target': lambda v: v in ('.link', '.imgtitlelink')}):
+        href = a_tag.get('href', '')
+        if href and ('http://' in href or 'https://' in href):
+            urls.append(href)
+
+    if not urls:
+        for a_tag in search_soup.find_all('a', attrs={'data-heatmap-target': True}):
+            if '.series' in a_tag.get('data-heatmap-target', ''):
+                continue
+            href = a_tag.get('href', '')
+            if href and 'naver.com' in href and ('http://' in href or 'https://' in href):
+                urls.append(href)
+    return list(dict.fromkeys(normalize_url(url) for url in urls))
+
+
+def legacy_extract_popular_post_urls(soup):
+    """기존 NaverScraper.extract_popular_post_urls (비교 기준용 사본)"""
+    popular_urls = set()
+    for header_title in soup.find_all('div', class_=lambda c: c and 'sds-comps-header-title' in c):
+        h2 = header_title.find('h2')
+        if not h2 or '인기글' not in h2.get_text():
+            continue
+        section = header_title.parent.parent
+        if section is None:
+            continue
+        for a_tag in section.find_all('a', attrs={'data-heatmap-target': '.link'}):
+            href = a_tag.get('href', '')
+            if href and ('http://' in href or 'https://' in href):
+                popular_urls.add(normalize_url(href))
+    return popular_urls
+
+
+def legacy_check_all_main_cafe(soup) -> bool:
+    """기존 NaverScraper.check_all_main_cafe (비교 기준용 사본)"""
+    for item in soup.find_all('div', attrs={'data-template-id': 'ugcItem'}):
+        if item.get('data-power-content-url'):
+            continue
+        if not item.find('a', href=lambda h: h and 'cafe.naver.com' in h):
+            continue
+        if not item.find('svg', attrs={'viewbox': '0 0 20 15'}):
+            return False
+    return True
+
+
+def legacy_analyze_keyword_layout(soup) -> dict:
+    """기존 NaverScraper.analyze_keyword_layout 의 분석 부분 (검색 대신 soup 을 받음, 비교 기준용 사본)"""
+    result = {'has_split_block': False, 'main_results': [], 'popular_results': []}
+
+    def get_block(element):
+        node = element
+        while node:
+            classes = node.get('class') or []
+            if '_fsolid_head' in classes:
+                return 'head'
+            if '_fsolid_body' in classes:
+                return 'body'
+            node = node.parent
+        return 'single'
+
+    def get_cafe_name(ugc_item):
+        el = ugc_item.find('span', class_=_has_class('sds-comps-profile-info-title-text'))
+        return el.get_text(strip=True) if el else None
+
+    def get_display_name(cafe_name, url):
+        slug = url.split('cafe.naver.com/')[1].split('/')[0].split('?')[0] if 'cafe.naver.com/' in url else ''
+        return CAFE_URL_MAP.get(slug, cafe_name or '')
+
+    def get_published_at(ugc_item):
+        subtext = ugc_item.find('span', class_=_has_class('profile-info-subtext'))
+        if not subtext:
+            return ''
+        text = subtext.get_text(strip=True)
+        m = re.search(r'(\d{4}\.\d{2}\.\d{2})\.?', text)
+        if m:
+            return m.group(1)
+        m2 = re.search(r'(\d+[일시간분]+\s*전|어제|오늘)', text)
+        if m2:
+            return m2.group(1)
+        return text[:15]
+
+    result['has_split_block'] = soup.find(class_=_has_class('_fsolid_head')) is not None
+
+    popular_url_set = set()
+    for h_el in soup.find_all('div', class_=_has_class('sds-comps-header-title')):
+        h2 = h_el.find('h2')
+        if not h2 or '인기글' not in h2.get_text():
+            continue
+        section = h_el.parent.parent if h_el.parent else None
+        if not section:
+            continue
+        for a_tag in section.find_all('a', attrs={'data-heatmap-target': '.link'}):
+            href = a_tag.get('href', '')
+            if not href:
+                continue
+            norm_url = normalize_url(href)
+            if norm_url in popular_url_set:
+                continue
+            popular_url_set.add(norm_url)
+            item_el = a_tag.find_parent('div', attrs={'data-template-id': 'ugcItem'})
+            cafe_name = get_cafe_name(item_el) if item_el else None
+            result['popular_results'].append({
+                'rank': len(result['popular_results']) + 1,
+                'cafe_name': cafe_name,
+                'display_name': get_display_name(cafe_name, href),
+                'url': norm_url,
+                'published_at': get_published_at(item_el) if item_el else '',
+            })
+
+    # 메인 결과: 첫 인기글 섹션을 지운 사본에서 ugcItem 순서대로
+    analysis_soup = copy.copy(soup)
+    for h_el in analysis_soup.find_all('div', class_=_has_class('sds-comps-header-title')):
+        h2 = h_el.find('h2')
+        if h2 and '인기글' in h2.get_text():
+            section = h_el.parent.parent if h_el.parent else None
+            if section:
+                section.decompose()
+            break
+
+    for ugc_item in analysis_soup.find_all('div', attrs={'data-template-id': 'ugcItem'}):
+        if ugc_item.get('data-power-content-url'):
+            continue
+        cafe_link = ugc_item.find('a', attrs={'data-heatmap-target': '.link'},
+                                  href=lambda h: h and 'cafe.naver.com' in h)
+        if not cafe_link:
+            cafe_link = ugc_item.find('a', href=lambda h: h and 'cafe.naver.com' in h)
+        if not cafe_link:
+            continue
+        href = cafe_link.get('href', '')
+        cafe_name = get_cafe_name(ugc_item)
+        result['main_results'].append({
+            'rank': len(result['main_results']) + 1,
+            'cafe_name': cafe_name,
+            'display_name': get_display_name(cafe_name, href),
+            'url': normalize_url(href),
+            'block': get_block(ugc_item),
+            'published_at': get_published_at(ugc_item),
+        })
+    return result
+
+
+def legacy_extract_all(html):
+    """기존 구현(html.parser + BeautifulSoup 탐색)으로 extract_all 과 같은 형태의 결과"""
+    soup = BeautifulSoup(html, 'html.parser')
+    return {
+        'main': legacy_extract_main_urls(soup),
+        'popular': sorted(legacy_extract_popular_post_urls(soup)),
+        'is_main_cafe': legacy_check_all_main_cafe(soup),
+        'layout': legacy_analyze_keyword_layout(soup),
+    }
+
+
+def extract_all(scraper, parser, html):
+    """페이지 1개를 파싱해 모든 추출 함수 결과를 dict 로 반환"""
+    doc = parser.parse(html)
+    result = {
+        'main': scraper.extract_main_urls(doc),
+        'popular': sorted(scraper.extract_popular_post_urls(doc)),
+        'is_main_cafe': scraper.check_all_main_cafe(doc),
+    }
+    scraper.get_search_results = lambda *args, **kwargs: doc
+    result['layout'] = scraper.analyze_keyword_layout('parity')
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML 파서 백엔드 일치 확인 + 속도 비교')
+    parser.add_argument('pages', nargs='*', default=['debug_search.html'], help='저장된 검색 결과 HTML 파일')
+    parser.add_argument('--corpus', action='store_true', help='benchmarks/corpus 의 페이지도 함께 비교')
+    parser.add_argument('--repeat', type=int, default=20, help='속도 측정 반복 횟수')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    scraper = NaverScraper()
+    parsers = [get_parser(name) for name in BACKENDS]
+    # 설치되지 않아 html.parser 로 대체된 백엔드는 건너뜀
+    parsers = [p for name, p in zip(BACKENDS, parsers) if p.name == name]
+
+    mismatches = 0
+    pages = []
+    for page in args.pages:
+        with open(page, encoding='utf-8') as f:
+            pages.append((page, f.read()))
+    if args.corpus:
+        pages += load_corpus()
+
+    for page, html in pages:
+        expected = legacy_extract_all(html)
+        print(f"{page}: 메인 {len(expected['main'])}개, 인기글 {len(expected['popular'])}개, "
+              f"레이아웃 메인 {len(expected['layout']['main_results'])}개")
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            legacy_extract_all(html)
+        per_page = (time.perf_counter() - started) / args.repeat * 1000
+        print(f"  {'기존 구현':<12} {'기준':<3}  {per_page:8.1f} ms/페이지")
+        for p in parsers:
+            same = extract_all(scraper, p, html) == expected
+            started = time.perf_counter()
+            for _ in range(args.repeat):
+                extract_all(scraper, p, html)
+            per_page = (time.perf_counter() - started) / args.repeat * 1000
+            print(f"  {p.name:<12} {'일치' if same else '불일치'}  {per_page:8.1f} ms/페이지")
+            if not same:
+                mismatches += 1
+
+    if mismatches:
+        print(f"결과 불일치 {mismatches}건")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
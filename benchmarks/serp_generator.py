@@ -0,0 +1,381 @@
+"""
+합성 네이버 검색 결과(SERP) HTML 생성기 (부하 테스트/파서 벤치마크용)
+실제 페이지(debug_search.html)와 같은 클래스/속성 구조로 검색 결과를 만들어, 추출 함수가 실제 페이지처럼 동작함.
+
+조절 항목: ugcItem 수, 상하단 분리(_fsolid_head / _fsolid_body), 인기글 섹션, 파워콘텐츠(광고),
+대표카페 배지, 관련 경험 카페글(fds-health-cafe-block-wrap) 블록, 페이지 크기, 지정 URL 을 지정 순위에 배치.
+생성 결과(SyntheticSerp)에는 정답(메인 노출 URL 순서, 인기글 URL, 대표카페 여부)이 함께 있어 추출 결과 검증에 사용.
+
+- 파서 벤치마크: python -m benchmarks.serp_generator --out benchmarks/corpus_synthetic 로 corpus 폴더를 만든 뒤
+  python -m benchmarks.bench_extractors --corpus benchmarks/corpus_synthetic
+- 가짜 검색 서버: FakeSearchServer(page_factory=SyntheticSearchSite(...).page) — benchmarks.bench_monitor_scale 참고
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import zlib
+from html import escape
+from typing import Dict, List, Optional
+
+# 무작위 글에 쓰는 카페 (slug, 카페명)
+_CAFE_NAMES = (
+    ('fox5282', '여우카페'), ('zoozoocom', '주주컴'), ('luxury009', '가아사'), ('cancerfree', '암환우 모임'),
+    ('diabetesclub', '당뇨 이겨내기'), ('skincarelab', '피부관리 연구소'), ('healthtalk', '건강 수다방'),
+    ('momsholic', '맘스홀릭'), ('ssiccang', '씨씨앙'), ('pharmtalk', '약사랑'),
+)
+_PUBLISHED = ('1시간 전', '5시간 전', '어제', '2일 전', '6일 전', '1주 전', '4주 전', '2026.01.16.', '2025.12.29.')
+_POPULAR_TITLES = ('건강·의학 인기글', '육아·결혼 인기글', '생활·건강 인기글')
+_ART_TOKEN = 'ZXh0ZXJuYWwtc2VydmljZS1uYXZlci1zZWFyY2gtY2FmZS1wcg.eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.{payload}.sig'
+
+_BADGE_SVG = (
+    '<svg aria-hidden="true" class="fender-ui_08aaffd5 fender-ui_e04ddf22" fill="none" height="15" '
+    'viewbox="0 0 20 15" width="20" xmlns="http://www.w3.org/2000/svg"><path d="M10.862 14.7414L2.49428 12.7483'
+    'C1.01384 12.3042 0 10.9415 0 9.39589V1.5C0 0.671573 0.671574 0 1.5 0H18.5Z" fill="#03C75A"></path></svg>'
+)
+
+
+class SyntheticSerp:
+    """
+    생성한 검색 결과 페이지 + 정답
+
+    Attributes:
+        html: 페이지 HTML
+        main_urls: 메인 노출 URL (NaverScraper.extract_main_urls 결과와 같은 정규화 형식, 순위 순서)
+        popular_urls: 인기글 섹션 URL 집합 (정규화 형식)
+        has_split_block: 상하단 분리 블록 여부
+        all_main_cafe: 광고를 뺀 카페 항목이 모두 대표카페인지 (NaverScraper.check_all_main_cafe 정답)
+    """
+
+    def __init__(self, html: str, main_urls: List[str], popular_urls: set, has_split_block: bool,
+                 all_main_cafe: bool):
+        self.html = html
+        self.main_urls = main_urls
+        self.popular_urls = popular_urls
+        self.has_split_block = has_split_block
+        self.all_main_cafe = all_main_cafe
+
+    def rank_of(self, url: str) -> Optional[int]:
+        """정규화한 URL 의 메인 노출 순위 (1부터, 없으면 None)"""
+        try:
+            return self.main_urls.index(_normalize(url)) + 1
+        except ValueError:
+            return None
+
+
+def _normalize(url: str) -> str:
+    """NaverScraper.normalize_url 과 같은 결과 (scraper 모듈을 불러오지 않도록 생성기용으로 축약)"""
+    base = url.split('?')[0]
+    if '=' in base:
+        base = base.split('=')[0]
+    base = base.split('://', 1)[-1]
+    return base[2:] if base.startswith('m.') else base
+
+
+def _with_art_token(url: str, rng: random.Random) -> str:
+    """검색 결과 링크처럼 ?art= 토큰을 붙인 href (이미 쿼리가 있으면 그대로)"""
+    if '?' in url or 'cafe.naver.com' not in url:
+        return url
+    return f"{url}?art={_ART_TOKEN.format(payload='%016x' % rng.getrandbits(64))}"
+
+
+def _random_post_url(rng: random.Random) -> str:
+    slug, _ = rng.choice(_CAFE_NAMES)
+    return f"https://cafe.naver.com/{slug}/{rng.randint(100000, 9999999)}"
+
+
+def _ugc_item(rng: random.Random, url: str, keyword: str, badge: bool, series: int = 0) -> str:
+    """카페글 ugcItem 1개 (프로필 / 제목 .link / 본문 .link / 서브 노출 .series)"""
+    slug = url.split('cafe.naver.com/')[1].split('/')[0] if 'cafe.naver.com/' in url else ''
+    cafe_name = dict(_CAFE_NAMES).get(slug, slug or '블로그')
+    cafe_home = f"https://cafe.naver.com/{slug}" if slug else url
+    href = escape(_with_art_token(url, rng))
+    kw = escape(keyword)
+    series_links = ''.join(
+        f'<a class="fender-ui_228e3bd1 WEmckEp0BZx2S1BnT9UK" data-heatmap-target=".series" '
+        f'href="{escape(_with_art_token(_random_post_url(rng), rng))}" nocr="1" target="_blank">'
+        f'<span class="sds-comps-text sds-comps-text-ellipsis sds-comps-text-ellipsis-1"><mark>{kw}</mark> 관련 글 {i + 1}'
+        f'</span></a>'
+        for i in range(series)
+    )
+    return (
+        '<div class="sds-comps-vertical-layout sds-comps-full-layout xoTsRquthWbxDMmOvsPx" '
+        'data-template-devicetype="desk" data-template-id="ugcItem" data-template-type="searchBasic">'
+        '<div class="sds-comps-horizontal-layout sds-comps-full-layout sds-comps-profile type-basic size-lg" '
+        'data-sds-comp="Profile" data-template-id="articleSource">'
+        '<div class="sds-comps-horizontal-layout sds-comps-inline-layout sds-comps-profile-source">'
+        f'<div class="sds-comps-horizontal-layout sds-comps-inline-layout sds-comps-profile-source-thumb">'
+        f'<a class="fender-ui_228e3bd1" data-heatmap-target="articleSourceJSX_thumbnail" href="{escape(cafe_home)}" '
+        f'nocr="1" target="_blank"><img alt="" height="24" loading="lazy" '
+        f'src="https://search.pstatic.net/common/?src=thumb{rng.getrandbits(32):08x}.png" width="24"/></a></div>'
+        '<div class="sds-comps-horizontal-layout sds-comps-inline-layout sds-comps-profile-info-title">'
+        '<span class="sds-comps-text sds-comps-text-ellipsis sds-comps-text-ellipsis-1 sds-comps-text-type-body2 '
+        'sds-comps-profile-info-title-text">'
+        f'<a class="fender-ui_228e3bd1 fender-ui_475445f0" data-heatmap-target="articleSourceJSX_title" '
+        f'href="{escape(cafe_home)}" nocr="1" target="_blank">'
+        f'<span class="sds-comps-text sds-comps-text-ellipsis sds-comps-text-ellipsis-1">{escape(cafe_name)}</span>'
+        f'</a></span>{_BADGE_SVG if badge else ""}</div>'
+        '<div class="sds-comps-horizontal-layout sds-comps-inline-layout sds-comps-profile-info-subtexts">'
+        '<span class="sds-comps-text sds-comps-text-type-body2 sds-comps-text-weight-sm sds-comps-profile-info-subtext">'
+        f'{rng.choice(_PUBLISHED)}</span></div></div></div>'
+        '<div class="sds-comps-vertical-layout sds-comps-full-layout A5GqBhOGuhC_bKimUz8D">'
+        f'<a class="fender-ui_228e3bd1 yOcFpZ60Bu5ObMXRQyps" data-heatmap-target=".link" href="{href}" nocr="1" '
+        f'target="_blank"><span class="sds-comps-text sds-comps-text-ellipsis sds-comps-text-ellipsis-1 '
+        f'sds-comps-text-type-headline1"><mark>{kw}</mark> 후기 공유합니다</span></a>'
+        f'<a class="fender-ui_228e3bd1 _US3GQNQwS9qm9jBVhm6 fds-ugc-ellipsis3" data-heatmap-target=".link" '
+        f'href="{href}" nocr="1" target="_blank"><span class="sds-comps-text sds-comps-text-type-body1">'
+        f'<mark>{kw}</mark> 알아보다가 직접 다녀온 내용 정리해 봤어요. 도움이 되셨으면 좋겠습니다.</span></a>'
+        f'<div class="sds-comps-vertical-layout sds-comps-full-layout zlmALK2BXDUmpkCEoRIB">{series_links}</div>'
+        '</div></div>'
+    )
+
+
+def _power_content_item(rng: random.Random, keyword: str) -> str:
+    """파워콘텐츠(광고) ugcItem — .link 가 없어 메인 노출 순위에 들어가지 않음"""
+    ad = f"https://ader.naver.com/v1/{rng.getrandbits(96):024x}"
+    return (
+        '<div class="sds-comps-vertical-layout sds-comps-full-layout xoTsRquthWbxDMmOvsPx _fe_view_power_content" '
+        f'data-power-content-url="{ad}" data-template-devicetype="desk" data-template-id="ugcItem" '
+        'data-template-type="searchBasic">'
+        f'<a class="fender-ui_228e3bd1" data-heatmap-target="articleSourceJSX_title" href="{ad}" target="_blank">'
+        '<span class="sds-comps-text sds-comps-profile-info-title-text">파워콘텐츠</span></a>'
+        f'<a class="fender-ui_228e3bd1" data-heatmap-target=".tit" href="{ad}" target="_blank">'
+        f'<span class="sds-comps-text">{escape(keyword)} 전문 상담</span></a>'
+        f'<a class="fender-ui_228e3bd1" data-heatmap-target=".des" href="{ad}" target="_blank">'
+        '<span class="sds-comps-text">지금 무료 상담 신청하세요</span></a></div>'
+    )
+
+
+def _section(title: str, body: str, extra_class: str = '') -> str:
+    """섹션 제목(sds-comps-header-title > h2) + 본문 — 제목의 조부모가 섹션 요소 (인기글 판정 구조)"""
+    return (
+        f'<div class="sds-comps-vertical-layout sds-comps-full-layout {extra_class}">'
+        '<div class="sds-comps-vertical-layout sds-comps-full-layout sds-comps-header type-basic fds-header">'
+        '<div class="sds-comps-horizontal-layout sds-comps-full-layout sds-comps-header-title">'
+        '<div class="sds-comps-horizontal-layout sds-comps-inline-layout sds-comps-header-left">'
+        f'<h2 class="sds-comps-text sds-comps-text-ellipsis sds-comps-text-ellipsis-1">{escape(title)}</h2>'
+        '</div></div></div>'
+        f'<div class="sds-comps-vertical-layout sds-comps-full-layout fds-ugc-single-intention-item-list">{body}</div>'
+        '</div>'
+    )
+
+
+def _filler(rng: random.Random, keyword: str, size: int) -> str:
+    """페이지 크기를 맞추는 연관 검색어/스크립트 영역 (메인 노출 링크 없음)"""
+    parts = []
+    total = 0
+    while total < size:
+        block = (
+            '<div class="api_subject_bx _related_box"><ul class="lst_related_srch">'
+            + ''.join(
+                f'<li class="item"><a class="keyword" href="?where=nexearch&amp;query={escape(keyword)}+{rng.randint(0, 9999)}"'
+                f' nocr="1"><div class="tit">{escape(keyword)} 연관 {j}</div></a></li>'
+                for j in range(8)
+            )
+            + '</ul></div>'
+            f'<script type="application/json">{{"ts":{rng.getrandbits(40)},"pad":"{"x" * 256}"}}</script>'
+        )
+        parts.append(block)
+        total += len(block.encode('utf-8'))
+    return ''.join(parts)
+
+
+def generate_serp(keyword: str, items: int = 10, split_head: int = 0, popular_sections: int = 1,
+                  popular_items: int = 3, power_content: int = 1, main_badge_ratio: float = 0.5,
+                  health_items: int = 0, series: int = 1, targets: Optional[Dict[str, int]] = None,
+                  page_kib: int = 0, seed: Optional[int] = None) -> SyntheticSerp:
+    """
+    검색 결과 페이지 1개 생성
+
+    Args:
+        keyword: 검색어 (제목/본문/연관 검색어에 사용)
+        items: 메인 카페글 섹션의 ugcItem 수 (광고 제외)
+        split_head: 0보다 크면 메인 카페글 섹션을 상하단으로 분리하고 앞에서부터 이 수만큼 _fsolid_head 에 배치
+        popular_sections: 인기글 섹션 수 (메인 섹션보다 위, 섹션마다 popular_items 개)
+        popular_items: 인기글 섹션 1개의 ugcItem 수
+        power_content: 메인 섹션 맨 앞에 넣을 파워콘텐츠(광고) 수
+        main_badge_ratio: 대표카페 배지를 붙일 항목 비율 (0~1)
+        health_items: 관련 경험 카페글(fds-health-cafe-block-wrap) 블록의 ugcItem 수 (0이면 블록 없음)
+        series: 항목마다 넣을 서브 노출(.series) 링크 수
+        targets: {URL: 메인 노출 순위(1부터)} — 해당 순위 자리에 URL 배치 (인기글 섹션 항목도 순위에 포함)
+        page_kib: 0보다 크면 연관 검색어/스크립트 영역을 덧붙여 페이지를 이 크기(KiB) 이상으로 맞춤
+        seed: 난수 시드 (None이면 키워드로 결정 — 같은 키워드는 같은 페이지)
+
+    Raises:
+        ValueError: targets 의 순위가 페이지의 메인 노출 자리 수를 넘는 경우
+    """
+    rng = random.Random(zlib.crc32(keyword.encode('utf-8')) if seed is None else seed)
+    ranked_slots = popular_sections * popular_items + items
+    urls = [_random_post_url(rng) for _ in range(ranked_slots)]
+    for url, rank in (targets or {}).items():
+        if not 1 <= rank <= ranked_slots:
+            raise ValueError(f"순위 {rank} 가 메인 노출 자리 수({ranked_slots})를 벗어남: {url}")
+        urls[rank - 1] = url
+    badges = [rng.random() < main_badge_ratio for _ in range(ranked_slots)]
+
+    sections = []
+    popular_urls = set()
+    slot = 0
+    for s in range(popular_sections):
+        body = ''.join(_ugc_item(rng, urls[slot + i], keyword, badges[slot + i], series) for i in range(popular_items))
+        popular_urls.update(_normalize(url) for url in urls[slot:slot + popular_items])
+        sections.append(_section(_POPULAR_TITLES[s % len(_POPULAR_TITLES)], body))
+        slot += popular_items
+
+    ads = ''.join(_power_content_item(rng, keyword) for _ in range(power_content))
+    main_items = [_ugc_item(rng, urls[slot + i], keyword, badges[slot + i], series) for i in range(items)]
+    if split_head > 0:
+        main_body = (
+            ads
+            + f'<div class="sds-comps-vertical-layout _fsolid_head">{"".join(main_items[:split_head])}</div>'
+            + f'<div class="sds-comps-vertical-layout _fsolid_body">{"".join(main_items[split_head:])}</div>'
+        )
+    else:
+        main_body = ads + ''.join(main_items)
+    sections.append(_section('카페글', main_body))
+
+    # 관련 경험 카페글 항목도 ugcItem 이므로 대표카페 판정에는 포함됨
+    health_badges = [rng.random() < main_badge_ratio for _ in range(health_items)]
+    if health_items:
+        health_body = ''.join(_ugc_item(rng, _random_post_url(rng), keyword, badge) for badge in health_badges)
+        sections.append(_section('관련 경험 카페글', health_body, 'fds-health-cafe-block-wrap'))
+
+    body = ''.join(f'<div class="api_subject_bx sds-comps-section">{section}</div>' for section in sections)
+    head = (
+        '<!doctype html><html lang="ko"><head><meta charset="utf-8">'
+        f'<title>{escape(keyword)} : 네이버 검색</title></head><body>'
+        f'<div id="wrap"><div id="container"><div id="main_pack">{body}'
+    )
+    tail = '</div><div id="sub_pack"></div></div></div></body></html>'
+    # 채움 영역은 실제 페이지처럼 메인 영역(main_pack) 안에 둠 (스트리밍 수신도 이 크기만큼 받음)
+    filler = ''
+    if page_kib > 0:
+        filler = _filler(rng, keyword, page_kib * 1024 - len(head.encode('utf-8')) - len(tail))
+    html = head + filler + tail
+
+    main_urls = list(dict.fromkeys(_normalize(url) for url in urls))
+    return SyntheticSerp(
+        html=html,
+        main_urls=main_urls,
+        popular_urls=popular_urls,
+        has_split_block=split_head > 0,
+        all_main_cafe=all(health_badges) and all(
+            badge for url, badge in zip(urls, badges) if 'cafe.naver.com' in url
+        ),
+    )
+
+
+class SyntheticSearchSite:
+    """
+    키워드별 합성 검색 결과를 돌려주는 가짜 검색 사이트 (FakeSearchServer 의 page_factory)
+    키워드마다 지정한 URL 을 지정 순위에 배치하고, 나머지 페이지 구성은 키워드별로 고정된 난수로 다양하게 만듦.
+    """
+
+    def __init__(self, targets: Optional[Dict[str, Dict[str, int]]] = None, page_kib: int = 0,
+                 blocked_ratio: float = 0.0, **options):
+        """
+        Args:
+            targets: {키워드: {URL: 순위}} — 없는 키워드는 지정 URL 없이 생성
+            page_kib: 페이지 크기 (generate_serp 참고)
+            blocked_ratio: 봇 차단 페이지로 응답할 키워드 비율 (키워드별로 고정)
+            options: generate_serp 에 그대로 넘길 기본값 (items 등) — 지정하지 않은 항목은 키워드별로 무작위
+        """
+        self.targets = targets or {}
+        self.page_kib = page_kib
+        self.blocked_ratio = blocked_ratio
+        self.options = options
+
+    def serp(self, keyword: str) -> Optional[SyntheticSerp]:
+        """키워드의 합성 검색 결과 (봇 차단 키워드면 None)"""
+        rng = random.Random(zlib.crc32(keyword.encode('utf-8')) ^ 0x5EED)
+        if rng.random() < self.blocked_ratio:
+            return None
+        targets = self.targets.get(keyword, {})
+        popular_sections = rng.choice((0, 1, 1, 2))
+        options = {
+            'items': rng.randint(5, 15),
+            'split_head': rng.choice((0, 0, 3, 4)),
+            'popular_sections': popular_sections,
+            'popular_items': 3,
+            'power_content': rng.choice((0, 1, 1, 2)),
+            'main_badge_ratio': rng.choice((0.5, 1.0)),
+            'health_items': rng.choice((0, 0, 2)),
+        }
+        options.update(self.options)
+        # 지정 순위가 인기글 + 메인 자리 수보다 크면 메인 섹션 항목 수를 늘림
+        popular_slots = options['popular_sections'] * options['popular_items']
+        options['items'] = max(options['items'], max(targets.values(), default=0) - popular_slots)
+        return generate_serp(keyword, targets=targets, page_kib=self.page_kib, **options)
+
+    def page(self, keyword: str) -> bytes:
+        """FakeSearchServer page_factory — 키워드 → 검색 결과 HTML bytes"""
+        serp = self.serp(keyword)
+        return (serp.html if serp is not None else bot_block_page()).encode('utf-8')
+
+
+def bot_block_page() -> str:
+    """봇 차단(보안 확인) 페이지 — 검색 결과 요소 없음"""
+    return (
+        '<!doctype html><html lang="ko"><head><meta charset="utf-8"><title>네이버 : 보안 확인</title></head>'
+        '<body><div class="captcha_wrap"><h2>보안 확인을 완료해 주세요</h2>'
+        '<p>고객님의 네트워크에서 비정상적인 요청이 감지되었습니다.</p>'
+        '<form action="/captcha" method="post"><input name="answer" type="text"/></form></div></body></html>'
+    )
+
+
+# corpus 생성 기본 구성 (이름, 설명, generate_serp 인자)
+_CORPUS_PAGES = (
+    ('synthetic_split', '상하단 분리 (head 4 / body 8), 인기글 1, 광고 1',
+     dict(items=12, split_head=4, popular_sections=1, power_content=1)),
+    ('synthetic_single', '단일 블록, 인기글/광고 없음',
+     dict(items=10, popular_sections=0, power_content=0)),
+    ('synthetic_popular', '인기글 섹션 2개 + 광고 2 + 관련 경험 카페글',
+     dict(items=10, popular_sections=2, power_content=2, health_items=3)),
+    ('synthetic_all_main', '전부 대표카페',
+     dict(items=10, main_badge_ratio=1.0)),
+    ('synthetic_large', '항목 60개 + 1 MiB 페이지',
+     dict(items=60, split_head=10, popular_sections=2, series=3, page_kib=1024)),
+)
+
+
+def write_corpus(out_dir: str, page_kib: int = 400, seed: int = 1) -> list:
+    """
+    benchmarks.bench_extractors 에서 읽을 수 있는 corpus 폴더 생성 (manifest.json + .html.gz)
+
+    Args:
+        page_kib: 페이지 크기 (실제 검색 결과 페이지는 약 400 KiB, 구성에서 따로 지정한 페이지는 그 값 사용)
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = []
+    for name, kind, options in _CORPUS_PAGES:
+        options = dict({'page_kib': page_kib}, **options)
+        serp = generate_serp('암요양병원 실비', seed=seed, **options)
+        filename = f"{name}.html.gz"
+        with gzip.open(os.path.join(out_dir, filename), 'wb') as f:
+            f.write(serp.html.encode('utf-8'))
+        manifest.append({'name': name, 'file': filename, 'kind': f"{kind} (합성)"})
+    manifest.append({'name': 'synthetic_bot_block', 'file': 'synthetic_bot_block.html.gz', 'kind': '봇 차단 페이지 (합성)'})
+    with gzip.open(os.path.join(out_dir, 'synthetic_bot_block.html.gz'), 'wb') as f:
+        f.write(bot_block_page().encode('utf-8'))
+    with open(os.path.join(out_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='합성 검색 결과 페이지 corpus 생성')
+    parser.add_argument('--out', required=True, help='corpus 폴더 (manifest.json 과 페이지 파일 생성)')
+    parser.add_argument('--page-kib', type=int, default=400, help='페이지 크기 (KiB)')
+    parser.add_argument('--seed', type=int, default=1, help='난수 시드')
+    args = parser.parse_args()
+
+    for entry in write_corpus(args.out, args.page_kib, args.seed):
+        print(f"{entry['name']:<24} {entry['kind']}")
+    print(f"corpus 생성: {args.out}")
+
+
+if __name__ == '__main__':
+    main()
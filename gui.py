@@ -52,6 +52,7 @@ class MonitoringApp:
         self._loop_active = False  # 반복 실행 중 여부
         self._stopping = False     # 종료 중 여부
         self._analysis_running = False
+        self._scraper = None       # 회차 간 재사용하는 스크래퍼 (브라우저 유지)
 
         self._build_ui()
         self._setup_logging()
@@ -404,7 +405,10 @@ class MonitoringApp:
                 return
 
             mode = self.mode_var.get()
-            scraper = NaverScraper()
+            # 브라우저를 회차 간 재사용하기 위해 스크래퍼는 한 번만 생성
+            if self._scraper is None:
+                self._scraper = NaverScraper()
+            scraper = self._scraper
 
             if mode == '카페':
                 monitor = KeywordMonitor(scraper, db_client)
@@ -529,6 +533,8 @@ class MonitoringApp:
         self.root.after(1000, self._wait_and_restart, remaining_seconds - 1)
 
     def _exit_app(self):
+        if self._scraper is not None:
+            self._scraper.close_driver()
         self.root.destroy()
         sys.exit(0)
 
@@ -29,9 +29,24 @@ def main():
 
     parser = argparse.ArgumentParser(description='네이버 검색 노출 모니터링 도구 (DB)')
     parser.add_argument('--check-deleted', action='store_true',
-                        help='게시글 삭제 여부만 확인')
+                        help='게시글 삭제 여부만 확인 (마지막 확인이 오래된 글부터, 중단해도 다음 실행에서 이어서 진행)')
+    parser.add_argument('--time-budget', type=float, default=None,
+                        help='--check-deleted 최대 실행 시간 (분)')
+    parser.add_argument('--max-urls', type=int, default=None,
+                        help='--check-deleted 에서 확인할 최대 URL 수')
+    parser.add_argument('--budget-stats', action='store_true',
+                        help='프로세스 간 공유 요청 예산의 토큰 잔량/프로세스별 사용량 출력')
     args = parser.parse_args()
 
+    if args.budget_stats:
+        from src.shared_budget import SharedRequestBudget
+        budget = SharedRequestBudget(label='budget-stats', prune_on_open=False)
+        removed = budget.prune()
+        if removed:
+            print(f"7일 넘게 요청이 없던 프로세스 사용 기록 {removed}건 정리")
+        budget.print_stats()
+        return
+
     # DB 클라이언트 초기화
     logging.info("\n DB 연결 중...")
     db_client = DatabaseClient(
@@ -76,14 +91,21 @@ def main():
         keyword_list_sheets_client=keyword_list_sheets_client
     )
 
-    if args.check_deleted:
-        logging.info("\n게시글 삭제 여부 확인 중...")
-        monitor.check_deleted_posts()
-        return
+    try:
+        if args.check_deleted:
+            logging.info("\n게시글 삭제 여부 확인 중...")
+            monitor.check_deleted_posts(
+                time_budget=args.time_budget * 60 if args.time_budget else None,
+                max_urls=args.max_urls,
+            )
+            return
 
-    # 모니터링 실행
-    logging.info("\n키워드 모니터링 시작...")
-    results = monitor.monitor_keywords()
+        # 모니터링 실행
+        logging.info("\n키워드 모니터링 시작...")
+        results = monitor.monitor_keywords()
+    finally:
+        # 프로세스 종료 전 유지 중인 브라우저 정리
+        scraper.close_driver()
 
     logging.info(f"\n모니터링 완료! (처리 {len(results)}건)")
 
@@ -0,0 +1,124 @@
+"""
+비동기 검색 모듈 - 여러 키워드의 네이버 검색을 동시에 실행
+NaverScraper의 requests/Selenium 검색 로직을 그대로 재사용하므로
+반환되는 soup은 기존 추출 함수(extract_main_urls 등)에서 그대로 사용 가능
+PARSE_WORKERS > 0 이면 검색 스레드는 HTML 파싱을 워커 프로세스(src.parse_pool)에 맡기고 결과만 기다리므로
+파싱이 GIL 에 묶여 코어 1개로 제한되지 않음
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from src.circuit_breaker import DEFERRED
+from src.config import SEARCH_CONCURRENCY
+
+
+class AsyncNaverScraper:
+    """NaverScraper 검색을 asyncio로 동시 실행하는 래퍼"""
+
+    def __init__(self, scraper, concurrency: int = SEARCH_CONCURRENCY):
+        """
+        초기화
+
+        Args:
+            scraper: NaverScraper 인스턴스 (requests/Selenium 검색 로직, 페이싱 예산 재사용)
+            concurrency: 동시에 진행할 최대 검색 수
+        """
+        self.scraper = scraper
+        self.concurrency = max(1, concurrency)
+
+    async def _fetch(self, keyword: str, page: int, executor, semaphore, selenium_lock, allow_defer: bool):
+        """
+        키워드 1개 검색 (requests 우선, 실패 시 Selenium 폴백은 직렬로 실행).
+        서킷이 열려 있으면 requests는 생략하고, allow_defer이고 CIRCUIT_OPEN_ACTION=defer면 DEFERRED 반환.
+        """
+        loop = asyncio.get_running_loop()
+        url = self.scraper.build_search_url(keyword, page)
+        budget = self.scraper.pacing.budget('search')
+
+        breaker = self.scraper.search_breaker
+        attempted = False
+        async with semaphore:
+            # 서킷을 통과한 요청만 검색 예산 간격을 지킴 (열린 동안에는 대기 없이 폴백/미룸)
+            if breaker.allow_request():
+                attempted = True
+                soup = None
+                try:
+                    delay = budget.reserve()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    # 프로세스 간 공유 예산은 파일 잠금을 쓰므로 스레드에서 대기
+                    await loop.run_in_executor(executor, budget.acquire_shared)
+                    logging.info(f"'{keyword}' 검색 중 (페이지 {page}, 동시 검색)...")
+                    soup = await loop.run_in_executor(executor, self.scraper._fetch_search_requests_hedged, url)
+                except Exception as e:
+                    logging.info(f"'{keyword}' requests 검색 오류 ({e}), Selenium으로 전환")
+                finally:
+                    # 페이싱 예산에는 _fetch_search_requests 가 실제 차단 신호만 반영
+                    if soup is not None:
+                        breaker.record_success()
+                    else:
+                        breaker.record_failure()
+                if soup is not None:
+                    return soup
+
+        if self.scraper._should_defer(attempted, allow_defer):
+            logging.info(f"'{keyword}' 서킷 열림 — 검색을 회차 끝으로 미룸")
+            return DEFERRED
+
+        # Selenium 드라이버는 스레드 안전하지 않으므로 폴백은 한 번에 하나씩만 실행
+        async with selenium_lock:
+            try:
+                return await loop.run_in_executor(executor, self.scraper._fetch_search_selenium, url)
+            except Exception as e:
+                logging.error(f"키워드 '{keyword}' Selenium 검색 중 오류 발생: {e}")
+                return None
+
+    async def fetch_many(self, keywords: List[str], page: int = 1,
+                         allow_defer: bool = False) -> Dict[str, Optional[object]]:
+        """
+        여러 키워드를 동시에 검색
+
+        Args:
+            keywords: 검색할 키워드 목록
+            page: 검색 페이지
+            allow_defer: 서킷이 열렸을 때 CIRCUIT_OPEN_ACTION=defer면 검색 대신 DEFERRED 반환
+
+        Returns:
+            {keyword: soup or None or DEFERRED, ...}  -- 입력 순서 유지
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        selenium_lock = asyncio.Lock()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            soups = await asyncio.gather(*[
+                self._fetch(keyword, page, executor, semaphore, selenium_lock, allow_defer)
+                for keyword in keywords
+            ])
+        return dict(zip(keywords, soups))
+
+    def iter_search_results(self, keywords: List[str], page: int = 1, window: Optional[int] = None):
+        """
+        (keyword, soup) 를 입력 순서대로 반환하는 동기 제너레이터.
+        window개씩 묶어서 동시에 검색하므로 메모리에 올라가는 soup 수가 제한됨.
+        서킷이 열려 미뤄진 키워드는 마지막에 순차로 다시 검색해 반환.
+
+        Args:
+            keywords: 검색할 키워드 목록
+            page: 검색 페이지
+            window: 한 번에 동시 검색할 키워드 묶음 크기 (기본: concurrency * 4)
+        """
+        keywords = list(keywords)
+        window = window or self.concurrency * 4
+        deferred = []
+        for start in range(0, len(keywords), window):
+            chunk = keywords[start:start + window]
+            results = asyncio.run(self.fetch_many(chunk, page=page, allow_defer=True))
+            for keyword in chunk:
+                soup = results.get(keyword)
+                if soup is DEFERRED:
+                    deferred.append(keyword)
+                    continue
+                yield keyword, soup
+        yield from self.scraper._search_deferred(deferred, page=page)
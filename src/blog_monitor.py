@@ -71,14 +71,17 @@ class BlogMonitor:
                 url_to_keyword[norm] = item['keyword']
 
         batch_updates = []
+        # 이전 회차 브라우저는 재사용하되 캐시/쿠키는 비우고 시작
+        self.scraper.start_cycle()
 
         try:
             # 2. 키워드별 루프 (requests 우선, 실패 시 Selenium 폴백은 get_search_results 내부에서 처리)
-            for keyword, items in tqdm(keyword_groups.items(), desc="블로그 키워드별 모니터링 진행 중"):
+            # 해당 키워드의 네이버 검색 결과는 한 번만 가져옴 (SEARCH_CONCURRENCY > 1 이면 여러 키워드 동시 검색)
+            search_results = self.scraper.iter_search_results(list(keyword_groups.keys()), page=1)
+            for keyword, soup in tqdm(search_results, total=len(keyword_groups), desc="블로그 키워드별 모니터링 진행 중"):
+                items = keyword_groups[keyword]
                 try:
-                    # 해당 키워드의 네이버 검색 결과는 한 번만 가져옴
-                    # get_search_results: requests 시도 → 실패 시 Selenium 자동 전환
-                    soup = self.scraper.get_search_results(keyword, page=1)
+                    # requests 시도 → 실패 시 Selenium 자동 전환
                     if not soup:
                         logging.warning(f"키워드 '{keyword}' 검색 결과 가져오기 실패 (requests+Selenium 모두 실패), 건너뜀")
                         continue
@@ -153,8 +156,9 @@ class BlogMonitor:
                 self.db_client.batch_update_blog_results(batch_updates)
 
         finally:
-            # 드라이버 종료 (Selenium이 사용된 경우)
-            self.scraper.close_driver()
+            # 회차 종료 (Selenium이 사용된 경우 재시작 기준을 넘은 드라이버만 종료)
+            self.scraper.end_cycle()
+            self.scraper.log_stats()
 
             # 5. Google Sheets 동기화 — 순찰 성공/실패 무관하게 반드시 실행
             self._sync_blog_sheets()
@@ -0,0 +1,233 @@
+"""
+브라우저 안 검색 결과 추출 (Selenium 경로)
+- driver.page_source 로 HTML 전체를 WebDriver 로 받아 다시 파싱하는 대신,
+  페이지에 추출 스크립트 1개를 실행해 ParsedSerp 와 같은 구조의 작은 JSON 만 받음
+  (메인 URL / 인기글 링크 / ugcItem 정보 / 상하단 블록)
+- 선택자는 src.parser_backend.SELECTORS 를 그대로 넘기고, 판정 규칙은 src.parsed_serp.parse_serp 와 동일
+- BROWSER_EXTRACT_CROSSCHECK 비율만큼은 page_source 도 받아 HTML 추출 결과와 비교 (다르면 경고 + 집계)
+"""
+
+import logging
+import random
+import threading
+from collections import deque
+
+from src.config import BROWSER_EXTRACT, BROWSER_EXTRACT_CROSSCHECK
+from src.parsed_serp import ParsedSerp, parse_published_at
+from src.parser_backend import SELECTORS
+
+# CSS 선택자 (브라우저 HTML 문서에서 SVG 요소의 속성 이름은 대소문자를 구분하므로 viewBox 로 지정)
+_BROWSER_SELECTORS = {key: css for key, (css, _) in SELECTORS.items()}
+_BROWSER_SELECTORS['main_cafe_badge'] = 'svg[viewBox="0 0 20 15"]'
+
+# parse_serp 와 같은 규칙으로 ParsedSerp.to_dict() 형태 반환 (발행일은 원문 텍스트로 받아 파이썬에서 변환)
+_EXTRACT_SCRIPT = """
+var S = arguments[0];
+
+function text(el, strip) {
+    var walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+    var parts = [];
+    while (walker.nextNode()) {
+        var parent = walker.currentNode.parentNode;
+        var tag = parent && parent.tagName;
+        if (tag === 'SCRIPT' || tag === 'STYLE') continue;
+        parts.push(strip ? walker.currentNode.nodeValue.trim() : walker.currentNode.nodeValue);
+    }
+    return parts.join('');
+}
+function attr(el, name, def) {
+    var v = el.getAttribute(name);
+    return v === null ? def : v;
+}
+
+var nodes = Array.prototype.slice.call(document.querySelectorAll(S.serp_nodes));
+var result = {
+    blocked: true, has_split_block: document.querySelector(S.fsolid_head) !== null,
+    main_links: [], fallback_links: [], header_titles: [], popular_links: [], items: [],
+    fingerprint: ''
+};
+
+// 1) 섹션 제목 — h2 에 '인기글'이 있으면 조부모 요소가 인기글 섹션
+var popular = [];
+nodes.forEach(function (node) {
+    if (node.tagName === 'A' || attr(node, 'data-template-id') === 'ugcItem') return;
+    var h2 = node.querySelector(S.h2);
+    result.header_titles.push(h2 ? text(h2, true) : null);
+    if (!h2 || text(h2, false).indexOf('인기글') === -1) return;
+    var section = node.parentElement && node.parentElement.parentElement;
+    if (section) popular.push(section);
+});
+
+// 2) 상위 요소 소속 (요소 자신 포함) 메모
+var memo = new Map();
+var ROOT = {health: false, popular: false, firstPopular: false, ugc: null, block: 'single'};
+function ancestry(node) {
+    var path = [], state = ROOT;
+    while (node && node.nodeType === 1) {
+        if (memo.has(node)) { state = memo.get(node); break; }
+        path.push(node);
+        node = node.parentElement;
+    }
+    for (var i = path.length - 1; i >= 0; i--) {
+        var el = path[i], s = {health: state.health, popular: state.popular, firstPopular: state.firstPopular,
+                               ugc: state.ugc, block: state.block};
+        var idx = popular.indexOf(el);
+        if (idx !== -1) { s.popular = true; s.firstPopular = s.firstPopular || idx === 0; }
+        var cls = attr(el, 'class', '');
+        if (el.tagName === 'DIV') {
+            if (cls.indexOf('fds-health-cafe-block-wrap') !== -1) s.health = true;
+            if (attr(el, 'data-template-id') === 'ugcItem') s.ugc = el;
+        }
+        if (cls.indexOf('_fsolid_') !== -1) {
+            var tokens = cls.split(/\\s+/);
+            if (tokens.indexOf('_fsolid_head') !== -1) s.block = 'head';
+            else if (tokens.indexOf('_fsolid_body') !== -1) s.block = 'body';
+        }
+        memo.set(el, s);
+        state = s;
+    }
+    return state;
+}
+
+var itemIndex = new Map(), markers = {};
+nodes.forEach(function (node) {
+    if (node.tagName === 'A') {
+        var target = attr(node, 'data-heatmap-target', ''), href = attr(node, 'href', '');
+        var st = ancestry(node.parentElement);
+        markers.heatmap = true;
+        if (st.health) markers.health = true;
+        else if (target === '.series') markers.series = true;
+        var isHttp = href !== '' && (href.indexOf('http://') !== -1 || href.indexOf('https://') !== -1);
+        if (!st.health && isHttp) {
+            if (target === '.link' || target === '.imgtitlelink') {
+                result.main_links.push(href);
+                markers[target.slice(1)] = true;
+            }
+            if (target.indexOf('.series') === -1 && href.indexOf('naver.com') !== -1) result.fallback_links.push(href);
+        }
+        if (st.popular && target === '.link' && href) {
+            var index = st.ugc && itemIndex.has(st.ugc) ? itemIndex.get(st.ugc) : null;
+            result.popular_links.push([href, index]);
+        }
+    } else if (attr(node, 'data-template-id') === 'ugcItem') {
+        var st = ancestry(node);
+        var cafe = node.querySelector(S.cafe_link_targets) || node.querySelector(S.cafe_links);
+        var title = node.querySelector(S.profile_title), subtext = node.querySelector(S.profile_subtext);
+        itemIndex.set(node, result.items.length);
+        result.items.push({
+            cafe_href: cafe ? attr(cafe, 'href', '') : null,
+            cafe_name: title ? text(title, true) : null,
+            published_text: subtext ? text(subtext, true) : null,
+            block: st.block,
+            power_content: !!attr(node, 'data-power-content-url'),
+            main_badge: node.querySelector(S.main_cafe_badge) !== null,
+            in_first_popular: st.firstPopular
+        });
+        markers.ugc = true;
+    }
+});
+
+if (result.header_titles.length) markers.header = true;
+if (result.has_split_block) markers.split = true;
+result.fingerprint = Object.keys(markers).sort().join('+');
+result.blocked = !markers.heatmap && document.querySelector(S.sds_comps) === null;
+return result;
+"""
+
+def from_browser(data: dict) -> ParsedSerp:
+    """추출 스크립트 결과(JSON) → ParsedSerp (발행일 텍스트 변환, 링크 쌍은 튜플로)"""
+    items = []
+    for item in data['items']:
+        item = dict(item)
+        text = item.pop('published_text')
+        item['published_at'] = parse_published_at(text) if text is not None else ''
+        items.append(item)
+    data = dict(data, items=items, popular_links=[tuple(link) for link in data['popular_links']])
+    return ParsedSerp.from_dict(data)
+
+
+def diff_parsed(a: ParsedSerp, b: ParsedSerp) -> list:
+    """두 추출 결과에서 값이 다른 필드 이름 목록"""
+    left, right = a.to_dict(), b.to_dict()
+    return [name for name in ParsedSerp.__slots__ if left[name] != right[name]]
+
+
+class BrowserExtractor:
+    """Selenium 페이지에서 추출 스크립트 실행 + 표본 교차 확인 (스레드 안전)"""
+
+    def __init__(self, enabled: bool = BROWSER_EXTRACT, crosscheck_rate: float = BROWSER_EXTRACT_CROSSCHECK,
+                 recent: int = 10):
+        """
+        Args:
+            enabled: False면 Selenium 경로가 기존처럼 page_source 를 받아 파싱
+            crosscheck_rate: page_source 를 함께 받아 HTML 추출과 비교할 비율 (0~1)
+            recent: 최근 불일치 내역 보관 건수
+        """
+        self.enabled = enabled
+        self.crosscheck_rate = crosscheck_rate
+        self._lock = threading.Lock()
+        self._stats = {
+            'extracted': 0,
+            'script_failures': 0,
+            'crosschecks': 0,
+            'mismatches': 0,
+        }
+        self._recent_mismatches = deque(maxlen=recent)
+
+    def extract(self, driver, parse_page=None, target: str = ''):
+        """
+        페이지에서 추출 스크립트 실행 → ParsedSerp.
+        스크립트가 실패하면 parse_page(page_source) 결과로 대체 (parse_page 가 없으면 예외 전파).
+
+        Args:
+            driver: 검색 결과 페이지를 연 WebDriver
+            parse_page: (html) -> SerpDocument/ParsedSerp — 실패 대체 및 교차 확인용 HTML 파서
+            target: 로그/기록용 (검색 URL 등)
+        """
+        try:
+            parsed = from_browser(driver.execute_script(_EXTRACT_SCRIPT, _BROWSER_SELECTORS))
+        except Exception as e:
+            with self._lock:
+                self._stats['script_failures'] += 1
+            if parse_page is None:
+                raise
+            logging.info(f"브라우저 추출 스크립트 실패 ({e}) — page_source 파싱으로 대체")
+            return parse_page(driver.page_source)
+
+        with self._lock:
+            self._stats['extracted'] += 1
+        if parse_page is not None and random.random() < self.crosscheck_rate:
+            self.crosscheck(parsed, parse_page(driver.page_source).parsed(), target)
+        return parsed
+
+    def crosscheck(self, browser: ParsedSerp, html: ParsedSerp, target: str = '') -> list:
+        """브라우저 추출과 HTML 추출 결과 비교 — 다른 필드 이름 목록 반환 (다르면 경고)"""
+        fields = diff_parsed(browser, html)
+        with self._lock:
+            self._stats['crosschecks'] += 1
+            if fields:
+                self._stats['mismatches'] += 1
+                self._recent_mismatches.append({'target': target, 'fields': fields})
+        if fields:
+            logging.warning(f"브라우저 추출 / HTML 추출 결과 불일치 ({', '.join(fields)}): {target}")
+        return fields
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            {'extracted', 'script_failures', 'crosschecks', 'mismatches',
+             'recent_mismatches': [{'target', 'fields'}, ...]}
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['recent_mismatches'] = list(self._recent_mismatches)
+        return stats
+
+    def log_stats(self):
+        s = self.stats()
+        if not (s['extracted'] or s['script_failures']):
+            return
+        logging.info(
+            f"브라우저 추출 통계: 추출 {s['extracted']}건, 스크립트 실패 {s['script_failures']}건, "
+            f"교차 확인 {s['crosschecks']}건 (불일치 {s['mismatches']}건)"
+        )
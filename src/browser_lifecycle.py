@@ -0,0 +1,183 @@
+"""
+브라우저 수명 관리 모듈
+- 순찰 회차가 바뀌어도 Chrome을 종료하지 않고 재사용 (CDP 캐시/쿠키 초기화로 깨끗한 상태 보장)
+- 페이지 로딩 횟수 또는 메모리(RSS) 기준으로 브라우저 재시작(재활용)
+- ChromeDriverManager가 찾은 chromedriver 경로를 디스크에 캐시 → 오프라인에서도 시작 가능
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+from src.config import (
+    BROWSER_RECYCLE_PAGE_LOADS, BROWSER_RECYCLE_RSS_MB,
+    CHROMEDRIVER_PATH_CACHE, CHROMEDRIVER_PATH_CACHE_DAYS,
+)
+from src.process_tree import tree_rss_mb
+
+
+class BrowserLifecycle:
+    """드라이버별 사용량을 추적하고 재활용 시점을 결정하는 관리자"""
+
+    def __init__(self, max_page_loads: int = BROWSER_RECYCLE_PAGE_LOADS,
+                 max_rss_mb: float = BROWSER_RECYCLE_RSS_MB,
+                 path_cache_file: str = CHROMEDRIVER_PATH_CACHE):
+        """
+        초기화
+
+        Args:
+            max_page_loads: 이 횟수만큼 페이지를 로딩한 브라우저는 재시작 (0이면 비활성)
+            max_rss_mb: chromedriver+Chrome 프로세스 RSS 합계가 이 값(MB)을 넘으면 재시작 (0이면 비활성)
+            path_cache_file: chromedriver 경로 캐시 파일
+        """
+        self.max_page_loads = max_page_loads
+        self.max_rss_mb = max_rss_mb
+        self.path_cache_file = path_cache_file
+
+        self._lock = threading.Lock()
+        self._drivers = {}
+        self._stats = {
+            'cold_starts': 0,
+            'cold_starts_avoided': 0,
+            'recycles': 0,
+            'recycled_by_page_loads': 0,
+            'recycled_by_rss': 0,
+            'driver_path_cache_hits': 0,
+        }
+
+    # ─────────────────────────────────────────
+    # chromedriver 경로 캐시
+    # ─────────────────────────────────────────
+    def _read_path_cache(self) -> Optional[dict]:
+        try:
+            with open(self.path_cache_file, encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('path') and os.path.isfile(cached['path']):
+                return cached
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _write_path_cache(self, path: str):
+        try:
+            os.makedirs(os.path.dirname(self.path_cache_file) or '.', exist_ok=True)
+            with open(self.path_cache_file, 'w', encoding='utf-8') as f:
+                json.dump({'path': path, 'resolved_at': time.time()}, f)
+        except OSError as e:
+            logging.info(f"chromedriver 경로 캐시 저장 실패 (무시): {e}")
+
+    def resolve_chromedriver_path(self, install: Callable[[], str], refresh: bool = False) -> str:
+        """
+        chromedriver 경로 반환.
+        캐시가 유효 기간 안이면 네트워크 조회 없이 캐시 경로 사용,
+        기간이 지났거나 refresh=True면 install()로 다시 조회하되 실패 시 캐시 경로로 폴백.
+
+        Args:
+            install: 실제 경로 조회 함수 (ChromeDriverManager().install() 등, 네트워크 사용)
+            refresh: True면 캐시를 무시하고 다시 조회 (Chrome 버전 불일치 시)
+        """
+        cached = self._read_path_cache()
+        max_age = CHROMEDRIVER_PATH_CACHE_DAYS * 86400
+        if cached and not refresh and time.time() - cached.get('resolved_at', 0) < max_age:
+            with self._lock:
+                self._stats['driver_path_cache_hits'] += 1
+            return cached['path']
+
+        try:
+            path = install()
+        except Exception as e:
+            if cached and not refresh:
+                logging.warning(f"chromedriver 경로 조회 실패, 캐시 경로 사용: {cached['path']} ({e})")
+                with self._lock:
+                    self._stats['driver_path_cache_hits'] += 1
+                return cached['path']
+            raise
+        self._write_path_cache(path)
+        return path
+
+    # ─────────────────────────────────────────
+    # 드라이버 사용량 추적 / 재활용 판단
+    # ─────────────────────────────────────────
+    def register(self, driver):
+        """새로 시작한 드라이버 등록 (콜드 스타트 1회로 집계)"""
+        with self._lock:
+            self._drivers[id(driver)] = {'page_loads': 0, 'started_at': time.monotonic()}
+            self._stats['cold_starts'] += 1
+
+    def forget(self, driver):
+        """종료된 드라이버 등록 해제"""
+        with self._lock:
+            self._drivers.pop(id(driver), None)
+
+    def note_page_load(self, driver):
+        """페이지 로딩 1회 기록"""
+        with self._lock:
+            info = self._drivers.get(id(driver))
+            if info is not None:
+                info['page_loads'] += 1
+
+    def page_loads(self, driver) -> int:
+        """드라이버가 지금까지 로딩한 페이지 수"""
+        with self._lock:
+            return self._drivers.get(id(driver), {}).get('page_loads', 0)
+
+    @staticmethod
+    def driver_pid(driver) -> Optional[int]:
+        """드라이버의 chromedriver 프로세스 pid"""
+        try:
+            return driver.service.process.pid
+        except Exception:
+            return None
+
+    def should_recycle(self, driver) -> bool:
+        """
+        페이지 로딩 횟수/RSS 기준 초과 여부 판단.
+        True를 반환하면 재활용 이벤트로 집계되며, 호출 측은 드라이버를 종료해야 함.
+        """
+        page_loads = self.page_loads(driver)
+        reason = None
+        if self.max_page_loads and page_loads >= self.max_page_loads:
+            reason = 'page_loads'
+            detail = f"페이지 로딩 {page_loads}회"
+        elif self.max_rss_mb:
+            pid = self.driver_pid(driver)
+            rss = tree_rss_mb(pid) if pid else None
+            if rss is not None and rss >= self.max_rss_mb:
+                reason = 'rss'
+                detail = f"RSS {rss}MB"
+        if reason is None:
+            return False
+
+        with self._lock:
+            self._stats['recycles'] += 1
+            self._stats[f'recycled_by_{reason}'] += 1
+        logging.info(f"브라우저 재활용: {detail} — 종료 후 다음 사용 시 새로 시작")
+        return True
+
+    def start_cycle(self, pool, clear_state: Callable):
+        """
+        순찰 회차 시작. 살아있는 브라우저는 종료하지 않고 clear_state로 캐시/쿠키만 초기화.
+
+        Args:
+            pool: DriverPool
+            clear_state: 드라이버 1개의 캐시/쿠키를 초기화하는 함수 (driver) -> None
+        """
+        reused = pool.for_each_idle(clear_state)
+        if reused:
+            with self._lock:
+                self._stats['cold_starts_avoided'] += reused
+            logging.info(f"브라우저 {reused}개 재사용 (캐시/쿠키 초기화) — 콜드 스타트 생략")
+
+    def end_cycle(self, pool):
+        """순찰 회차 종료. 기준을 넘은 브라우저만 종료하고 나머지는 다음 회차까지 유지."""
+        pool.retire_idle(self.should_recycle)
+
+    def stats(self) -> dict:
+        """콜드 스타트/재사용/재활용 집계"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['live_drivers'] = len(self._drivers)
+        return stats
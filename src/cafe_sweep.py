@@ -0,0 +1,226 @@
+"""
+카페별 게시글 삭제 일괄 확인 (--check-deleted)
+URL을 카페 단위로 묶어 카페마다 세션 하나(카페 첫 화면으로 쿠키를 받아 둔 세션)로 처리:
+1. 카페 전체글 목록(최신순)을 확인 대상 중 가장 오래된 글 번호까지(최대 CAFE_SWEEP_MAX_PAGES 페이지) 훑어
+   목록에 있는 글은 존재로 판정 (목록 1페이지 = 글 CAFE_SWEEP_PAGE_SIZE 개)
+2. 목록에서 찾지 못한 글(삭제, 비공개 게시판, 목록 범위 밖)은 같은 세션으로 글별 HTTP 확인 (src.deletion_probe)
+3. 그래도 판정 불가한 글은 호출 측에서 Selenium 으로 확인
+블로그 글은 2단계부터 처리.
+카페별 세션과 목록에서 확인한 글 번호는 실행(start_cycle ~ close) 동안 유지 — 여러 묶음으로 나눠 호출해도
+카페 첫 화면/이미 훑은 목록 페이지를 다시 요청하지 않고, 더 오래된 글이 필요할 때만 다음 페이지부터 이어서 훑음.
+"""
+
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from tqdm import tqdm
+
+from src.config import CAFE_SWEEP, CAFE_SWEEP_MAX_PAGES, CAFE_SWEEP_PAGE_SIZE
+from src.deletion_probe import DeletionProbe, parse_cafe_article
+
+
+class CafeDeletionSweep:
+    """카페 단위 삭제 확인 (글 목록 → 글별 HTTP 확인, 남은 글은 호출 측에서 Selenium)"""
+
+    def __init__(self, probe: DeletionProbe, pacing, user_agent: Optional[str] = None, enabled: bool = CAFE_SWEEP,
+                 max_pages: int = CAFE_SWEEP_MAX_PAGES, page_size: int = CAFE_SWEEP_PAGE_SIZE):
+        """
+        Args:
+            probe: 글별 HTTP 확인에 쓸 DeletionProbe (카페 ID 캐시 공유)
+            pacing: PacingController (카페/블로그 요청 간격)
+            user_agent: 카페별 세션의 User-Agent
+            enabled: False면 sweep() 이 아무것도 판정하지 않음 (모든 URL을 호출 측 확인으로)
+            max_pages: 카페당 최대 목록 페이지 수 (0이면 목록 없이 글별 확인만)
+            page_size: 목록 페이지당 글 수
+        """
+        self.probe = probe
+        self.pacing = pacing
+        self.user_agent = user_agent
+        self.enabled = enabled
+        self.max_pages = max(0, max_pages)
+        self.page_size = max(1, page_size)
+        self._lock = threading.Lock()
+        # 실행 동안 유지: (카페, 숫자 ID 여부) → 세션, 카페 ID → 목록 스캔 상태
+        self._sessions = {}
+        self._listings = {}
+        self._stats = {
+            'cafes': 0,
+            'list_pages': 0,
+            'listed_alive': 0,
+            'probed': 0,
+            'probe_resolved': 0,
+            'leftovers': 0,
+        }
+
+    def start_cycle(self):
+        """실행 시작 — 이전 실행의 카페별 세션/목록 스캔 결과를 비움"""
+        self.close()
+
+    def close(self):
+        """카페별 세션 종료, 목록 스캔 결과 삭제"""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            self._listings.clear()
+        for session in sessions:
+            session.close()
+
+    def _session(self, cafe: str, is_club_id: bool, budget) -> requests.Session:
+        """카페별 세션 (실행 동안 재사용)"""
+        key = (cafe, is_club_id)
+        with self._lock:
+            session = self._sessions.get(key)
+        if session is None:
+            session = self._new_session(None if is_club_id else cafe, budget)
+            with self._lock:
+                self._sessions[key] = session
+        return session
+
+    def _drop_session(self, cafe: str, is_club_id: bool):
+        """오류가 난 카페 세션 폐기 (다음 호출에서 새로 준비)"""
+        with self._lock:
+            session = self._sessions.pop((cafe, is_club_id), None)
+        if session is not None:
+            session.close()
+
+    def _new_session(self, cafe: Optional[str], budget) -> requests.Session:
+        """카페 첫 화면을 한 번 열어 쿠키를 받아 둔 세션 (실패해도 빈 세션으로 진행)"""
+        session = requests.Session()
+        if self.user_agent:
+            session.headers['User-Agent'] = self.user_agent
+        if cafe:
+            budget.wait()
+            try:
+                response = session.get(f"https://cafe.naver.com/{cafe}", timeout=self.probe.timeout)
+                budget.record(response.ok)
+            except requests.RequestException as e:
+                logging.info(f"카페 '{cafe}' 세션 준비 실패 (쿠키 없이 진행): {e}")
+                budget.record(False)
+        return session
+
+    def _listed_article_ids(self, club_id: str, wanted: set, budget, session) -> set:
+        """
+        전체글 목록에서 찾은 확인 대상 글 번호 (대상 중 가장 오래된 글 번호를 지나면 중단)
+        이번 실행에서 이미 훑은 페이지는 다시 요청하지 않고, 필요하면 마지막으로 훑은 다음 페이지부터 이어서 확인
+        """
+        oldest = min(int(article_id) for article_id in wanted)
+        with self._lock:
+            listing = self._listings.setdefault(club_id, {'ids': set(), 'pages': 0, 'oldest': None, 'done': False})
+        remaining = set(wanted) - listing['ids']
+        while remaining and not listing['done'] and listing['pages'] < self.max_pages:
+            if listing['oldest'] is not None and listing['oldest'] <= oldest:
+                break
+            ids = self.probe.cafe_article_ids(club_id, listing['pages'] + 1, self.page_size, budget, session)
+            with self._lock:
+                self._stats['list_pages'] += 1
+            if not ids:
+                # 목록 끝 또는 요청 실패 — 이번 실행에서는 더 훑지 않음 (남은 글은 글별 확인)
+                listing['done'] = True
+                break
+            listing['pages'] += 1
+            listing['ids'].update(ids)
+            page_oldest = min(int(article_id) for article_id in ids)
+            listing['oldest'] = page_oldest if listing['oldest'] is None else min(listing['oldest'], page_oldest)
+            remaining.difference_update(ids)
+        return set(wanted) & listing['ids']
+
+    def _sweep_cafe(self, cafe: str, is_club_id: bool, articles: Dict[str, List[str]],
+                    results: dict, leftovers: list):
+        """카페 하나의 글 확인 (articles: {글 번호: [URL, ...]})"""
+        budget = self.pacing.for_url('https://cafe.naver.com/')
+        session = self._session(cafe, is_club_id, budget)
+        club_id, _ = (cafe, None) if is_club_id else self.probe.club_id(cafe, budget, session)
+        listed = set()
+        if club_id == '':
+            for urls in articles.values():
+                for url in urls:
+                    results[url] = (True, '존재하지 않는 카페')
+            return
+        if club_id and self.max_pages:
+            listed = self._listed_article_ids(club_id, set(articles), budget, session)
+
+        probed = resolved = 0
+        for article_id, urls in articles.items():
+            if article_id in listed:
+                verdict = (False, None)
+            else:
+                verdict = self.probe.probe(urls[0], budget, session)
+                probed += 1
+                resolved += verdict[0] is not None
+            for url in urls:
+                if verdict[0] is None:
+                    leftovers.append(url)
+                else:
+                    results[url] = verdict
+        logging.info(f"카페 '{cafe}': 글 {len(articles)}개 — 목록 확인 {len(listed)}개, "
+                     f"글별 확인 {probed}개 중 {resolved}개 판정")
+        with self._lock:
+            self._stats['listed_alive'] += len(listed)
+            self._stats['probed'] += probed
+            self._stats['probe_resolved'] += resolved
+
+    def sweep(self, urls: List[str]) -> Tuple[dict, list]:
+        """
+        여러 URL의 삭제 여부를 카페 단위로 확인
+
+        Args:
+            urls: 카페/블로그 글 URL 목록 (중복 허용)
+
+        Returns:
+            ({url: (is_deleted, message)}, 판정하지 못한 URL 목록 — Selenium 확인 대상)
+        """
+        unique_urls = list(dict.fromkeys(u for u in urls if u))
+        if not self.enabled:
+            return {}, unique_urls
+
+        # 카페 주소(또는 숫자 카페 ID)별 → 글 번호별 URL (같은 글의 다른 URL 형식은 한 번만 확인)
+        cafes = {}
+        others = []
+        for url in unique_urls:
+            parsed = parse_cafe_article(url) if 'cafe.naver.com' in url else None
+            if parsed is None:
+                others.append(url)
+                continue
+            cafe, article_id, is_club_id = parsed
+            cafes.setdefault((cafe, is_club_id), {}).setdefault(article_id, []).append(url)
+
+        results, leftovers = {}, []
+        for (cafe, is_club_id), articles in tqdm(cafes.items(), desc="카페별 삭제 확인"):
+            try:
+                self._sweep_cafe(cafe, is_club_id, articles, results, leftovers)
+            except Exception as e:
+                logging.warning(f"카페 '{cafe}' 일괄 확인 실패, 글별 Selenium 확인으로 진행: {e}")
+                self._drop_session(cafe, is_club_id)
+                leftovers.extend(url for urls in articles.values() for url in urls if url not in results)
+        # 블로그 등 카페 글이 아닌 URL은 글별 HTTP 확인만
+        for url in others:
+            verdict = self.probe.probe(url, self.pacing.for_url(url))
+            if verdict[0] is None:
+                leftovers.append(url)
+            else:
+                results[url] = verdict
+
+        leftovers = list(dict.fromkeys(leftovers))
+        with self._lock:
+            self._stats['cafes'] += len(cafes)
+            self._stats['leftovers'] += len(leftovers)
+        return results, leftovers
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            {'cafes', 'list_pages', 'listed_alive', 'probed', 'probe_resolved', 'leftovers'}
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def log_stats(self):
+        s = self.stats()
+        if not s['cafes']:
+            return
+        logging.info(
+            f"카페별 삭제 확인: 카페 {s['cafes']}개, 목록 {s['list_pages']}페이지로 존재 확인 {s['listed_alive']}건, "
+            f"글별 HTTP 확인 {s['probed']}건 중 {s['probe_resolved']}건 판정, Selenium 확인 대상 {s['leftovers']}건"
+        )
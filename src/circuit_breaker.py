@@ -0,0 +1,137 @@
+"""
+검색 requests 경로용 서킷 브레이커
+- 최근 요청의 차단(실패) 비율을 추적해 임계값을 넘으면 열림(OPEN) → requests 시도 생략
+- 대기 시간(cooldown)이 지나면 반열림(HALF_OPEN) 상태에서 요청 1건으로 탐침
+- 탐침 성공 시 닫힘(CLOSED), 실패 시 다시 열림
+- 상태 전환은 로그로 남기고 통계로 제공
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+
+from src.config import (
+    CIRCUIT_WINDOW, CIRCUIT_BLOCK_THRESHOLD, CIRCUIT_MIN_SAMPLES, CIRCUIT_COOLDOWN,
+)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# 서킷이 열려 검색을 회차 뒤로 미룬 키워드의 결과 표시 (CIRCUIT_OPEN_ACTION=defer)
+DEFERRED = object()
+
+
+class CircuitBreaker:
+    """차단 비율 기반 서킷 브레이커 (스레드 안전)"""
+
+    def __init__(self, name: str, window: int = CIRCUIT_WINDOW, threshold: float = CIRCUIT_BLOCK_THRESHOLD,
+                 min_samples: int = CIRCUIT_MIN_SAMPLES, cooldown: float = CIRCUIT_COOLDOWN):
+        """
+        Args:
+            name: 로그/통계용 이름
+            window: 차단 비율을 계산할 최근 요청 수
+            threshold: 이 비율(0~1) 이상 차단되면 서킷 열림
+            min_samples: 최소 이만큼 요청이 쌓여야 열림 판단
+            cooldown: 열린 뒤 탐침까지 대기 시간 (초)
+        """
+        self.name = name
+        self.threshold = threshold
+        self.min_samples = min_samples
+        self.cooldown = cooldown
+
+        self._lock = threading.Lock()
+        self._results = deque(maxlen=window)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._stats = {
+            'opened': 0,
+            'closed': 0,
+            'probes': 0,
+            'short_circuited': 0,
+        }
+        self._transitions = deque(maxlen=50)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def _block_rate(self) -> float:
+        return self._results.count(False) / len(self._results) if self._results else 0.0
+
+    def _transition(self, new_state: str, reason: str):
+        """상태 전환 (lock 보유 상태에서 호출)"""
+        old_state, self._state = self._state, new_state
+        if new_state == OPEN:
+            self._opened_at = time.monotonic()
+            self._stats['opened'] += 1
+        elif new_state == CLOSED:
+            self._results.clear()
+            self._stats['closed'] += 1
+        self._transitions.append({'at': time.time(), 'from': old_state, 'to': new_state, 'reason': reason})
+        logging.warning(f"[서킷:{self.name}] {old_state} → {new_state} ({reason})")
+
+    def allow_request(self) -> bool:
+        """
+        지금 요청을 보내도 되는지 판단.
+        반열림 상태에서는 동시에 1건(탐침)만 허용.
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN:
+                if time.monotonic() - self._opened_at < self.cooldown:
+                    self._stats['short_circuited'] += 1
+                    return False
+                self._transition(HALF_OPEN, f"{self.cooldown:g}초 경과, 탐침 시작")
+            if self._probe_in_flight:
+                self._stats['short_circuited'] += 1
+                return False
+            self._probe_in_flight = True
+            self._stats['probes'] += 1
+            return True
+
+    def record_success(self):
+        """요청 성공 기록"""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probe_in_flight = False
+                self._transition(CLOSED, "탐침 성공")
+                return
+            self._results.append(True)
+
+    def record_failure(self):
+        """요청 실패(차단) 기록"""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probe_in_flight = False
+                self._transition(OPEN, "탐침 실패")
+                return
+            if self._state == OPEN:
+                return
+            self._results.append(False)
+            rate = self._block_rate()
+            if len(self._results) >= self.min_samples and rate >= self.threshold:
+                self._transition(OPEN, f"최근 {len(self._results)}건 중 차단 비율 {rate:.0%}")
+
+    def seconds_until_probe(self) -> float:
+        """열림 상태에서 탐침 가능 시점까지 남은 시간 (초, 열림 상태가 아니면 0)"""
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self.cooldown - (time.monotonic() - self._opened_at))
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            {'state', 'block_rate', 'opened', 'closed', 'probes', 'short_circuited', 'transitions': [...]}
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['state'] = self._state
+            stats['block_rate'] = round(self._block_rate(), 3)
+            stats['transitions'] = list(self._transitions)
+        return stats
@@ -25,6 +25,145 @@ DEFAULT_PAGES = 1
 # 스케줄러 실행 간격 (시간)
 # SCHEDULER_INTERVAL = 6
 
+# ===========================================
+# 검색 동시성 설정
+# ===========================================
+
+# 동시에 진행할 키워드 검색 수 (1이면 기존 순차 검색)
+SEARCH_CONCURRENCY = int(os.getenv('SEARCH_CONCURRENCY', 1))
+
+# 요청 페이싱 (AIMD): 예산별 시작 간격(초) — 정상 응답이면 조금씩 줄이고, 차단이면 배수로 늘림
+# PACING_SPEED 하나로 전체 처리량 조절 (2.0이면 모든 간격 절반, 0.5면 두 배)
+PACING_SPEED = float(os.getenv('PACING_SPEED', 1.0))
+PACING_SEARCH_INTERVAL = float(os.getenv('PACING_SEARCH_INTERVAL', 0.75))
+PACING_CAFE_INTERVAL = float(os.getenv('PACING_CAFE_INTERVAL', 0.55))
+PACING_BLOG_INTERVAL = float(os.getenv('PACING_BLOG_INTERVAL', 0.75))
+# 최소 간격(시작 간격 대비 비율) / 최대 간격(초) / 정상 응답당 감소폭(초) / 차단 시 배수
+PACING_MIN_RATIO = float(os.getenv('PACING_MIN_RATIO', 0.4))
+PACING_MAX_INTERVAL = float(os.getenv('PACING_MAX_INTERVAL', 15))
+PACING_DECREASE_STEP = float(os.getenv('PACING_DECREASE_STEP', 0.02))
+PACING_BACKOFF_FACTOR = float(os.getenv('PACING_BACKOFF_FACTOR', 2.0))
+
+# 프로세스 간 공유 요청 예산 (GUI 카페/블로그/순위 분석, 스케줄러가 동시에 돌 때 호스트별 전체 요청 속도 제한)
+SHARED_BUDGET_ENABLED = os.getenv('SHARED_BUDGET_ENABLED', 'true').lower() == 'true'
+SHARED_BUDGET_PATH = os.getenv(
+    'SHARED_BUDGET_PATH',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'request_budget.sqlite3'),
+)
+# 예산별 초당 허용 요청 수 (모든 프로세스 합계) / 순간 허용량(버킷 크기)
+SHARED_BUDGET_RATES = {
+    'search': float(os.getenv('SHARED_BUDGET_SEARCH_RATE', 1.5)),
+    'cafe': float(os.getenv('SHARED_BUDGET_CAFE_RATE', 2.0)),
+    'blog': float(os.getenv('SHARED_BUDGET_BLOG_RATE', 1.5)),
+}
+SHARED_BUDGET_BURST = float(os.getenv('SHARED_BUDGET_BURST', 3))
+
+# 호스트당 유지할 keep-alive 커넥션 수 (검색 요청 커넥션 풀)
+HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', 10))
+# HTTP 요청 제한 시간(초): 연결 / 응답 바이트 간 대기 / 본문 전체 수신 (느리게 흘러오는 응답 차단)
+HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', 5))
+HTTP_READ_TIMEOUT = float(os.getenv('HTTP_READ_TIMEOUT', 10))
+HTTP_TOTAL_TIMEOUT = float(os.getenv('HTTP_TOTAL_TIMEOUT', 20))
+HTTP_TIMEOUT = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+
+# 검색 페이지 스트리밍 수신 (봇 차단 바이트 조기 판정 + 메인 영역 수신 후 조기 종료)
+SEARCH_STREAMING = os.getenv('SEARCH_STREAMING', 'true').lower() == 'true'
+# 메인 영역 수신 후 남은 본문이 이 크기(KiB, 압축 해제 기준) 이하면 마저 받고 커넥션을 풀에 반환
+# (넘으면 커넥션을 닫고 조기 종료, 0이면 항상 닫음 — 수신량 ↔ 커넥션 재사용 트레이드오프)
+SEARCH_STREAM_DRAIN_KIB = int(os.getenv('SEARCH_STREAM_DRAIN_KIB', 256))
+
+# 검색 결과 HTML 파서: html.parser(기본) | lxml | selectolax (미설치 시 html.parser, 추출 결과는 동일)
+HTML_PARSER_BACKEND = os.getenv('HTML_PARSER_BACKEND', 'html.parser').lower()
+# 전체 URL 수집(extract_urls) 페이지당 제한 시간(초, 0이면 무제한) — 넘으면 그때까지 모은 URL 만 사용
+EXTRACT_URLS_BUDGET = float(os.getenv('EXTRACT_URLS_BUDGET', 2.0))
+# 검색 결과 파싱 워커 프로세스 수 (0이면 검색 스레드에서 직접 파싱, 동시 검색 시 코어 수만큼 권장)
+PARSE_WORKERS = int(os.getenv('PARSE_WORKERS', 0))
+# Selenium 검색은 page_source 대신 페이지 안 추출 스크립트 결과(JSON)만 받음
+BROWSER_EXTRACT = os.getenv('BROWSER_EXTRACT', 'true').lower() == 'true'
+# 브라우저 추출 중 page_source 도 받아 HTML 추출과 비교할 비율 (0~1)
+BROWSER_EXTRACT_CROSSCHECK = float(os.getenv('BROWSER_EXTRACT_CROSSCHECK', 0.1))
+
+# 검색 서킷 브레이커: 최근 CIRCUIT_WINDOW건 중 차단 비율이 임계값 이상이면 requests 시도 생략
+CIRCUIT_WINDOW = int(os.getenv('CIRCUIT_WINDOW', 20))
+CIRCUIT_BLOCK_THRESHOLD = float(os.getenv('CIRCUIT_BLOCK_THRESHOLD', 0.5))
+CIRCUIT_MIN_SAMPLES = int(os.getenv('CIRCUIT_MIN_SAMPLES', 5))
+# 열린 뒤 탐침(요청 1건)까지 대기 시간 (초)
+CIRCUIT_COOLDOWN = float(os.getenv('CIRCUIT_COOLDOWN', 120))
+# 서킷이 열렸을 때 동작: selenium(바로 Selenium 검색) | defer(회차 끝으로 미룸)
+CIRCUIT_OPEN_ACTION = os.getenv('CIRCUIT_OPEN_ACTION', 'selenium').lower()
+
+# 검색 요청 헤징 (선택): 응답이 최근 p90보다 늦으면 같은 요청을 한 번 더 보내 먼저 온 결과 사용
+SEARCH_HEDGING = os.getenv('SEARCH_HEDGING', 'false').lower() == 'true'
+# 전체 요청 대비 헤지 요청 비율 상한 / p90 계산 최소 표본 수 / 응답 시간 표본 창 크기
+HEDGE_MAX_RATIO = float(os.getenv('HEDGE_MAX_RATIO', 0.1))
+HEDGE_MIN_SAMPLES = int(os.getenv('HEDGE_MIN_SAMPLES', 20))
+HEDGE_WINDOW = int(os.getenv('HEDGE_WINDOW', 200))
+
+# ===========================================
+# Selenium 설정
+# ===========================================
+
+# 동시에 띄울 headless Chrome 드라이버 수 (삭제 확인/레이아웃 측정 병렬도, 드라이버당 RAM 약 200~300MB)
+DRIVER_POOL_SIZE = int(os.getenv('DRIVER_POOL_SIZE', 1))
+
+# 순찰 회차가 끝나도 브라우저를 종료하지 않고 다음 회차에 재사용 (회차 시작 시 캐시/쿠키만 초기화)
+BROWSER_KEEP_ALIVE = os.getenv('BROWSER_KEEP_ALIVE', 'true').lower() == 'true'
+# 브라우저 재시작 기준: 페이지 로딩 횟수 / chromedriver+Chrome 프로세스 RSS 합계(MB) (0이면 비활성)
+BROWSER_RECYCLE_PAGE_LOADS = int(os.getenv('BROWSER_RECYCLE_PAGE_LOADS', 300))
+BROWSER_RECYCLE_RSS_MB = float(os.getenv('BROWSER_RECYCLE_RSS_MB', 1500))
+# ChromeDriverManager가 찾은 chromedriver 경로 캐시 (유효 기간 내에는 버전 조회 네트워크 요청 생략)
+CHROMEDRIVER_PATH_CACHE = os.getenv(
+    'CHROMEDRIVER_PATH_CACHE',
+    os.path.join(os.path.expanduser('~'), '.wdm', 'keyword_exposure_chromedriver.json'),
+)
+CHROMEDRIVER_PATH_CACHE_DAYS = float(os.getenv('CHROMEDRIVER_PATH_CACHE_DAYS', 7))
+
+# 게시글 삭제 확인을 HTTP 응답(카페 글 API / 모바일 블로그 페이지)으로 먼저 판정 — 판정 불가한 URL만 Selenium 확인
+DELETION_PROBE = os.getenv('DELETION_PROBE', 'true').lower() == 'true'
+
+# 삭제 확인 결과 캐시 (정규화 URL 기준, 회차 간 유지) — 살아있던 기간이 길수록 재확인 간격(TTL)을 늘림
+# TTL = 살아있던 기간 x VERDICT_TTL_RATIO (최소~최대 시간 사이), 노출되던 검색 결과에서 빠지면 즉시 재확인
+VERDICT_CACHE = os.getenv('VERDICT_CACHE', 'true').lower() == 'true'
+VERDICT_CACHE_PATH = os.getenv(
+    'VERDICT_CACHE_PATH',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'deletion_verdicts.sqlite3'),
+)
+VERDICT_TTL_MIN_HOURS = float(os.getenv('VERDICT_TTL_MIN_HOURS', 1))
+VERDICT_TTL_MAX_HOURS = float(os.getenv('VERDICT_TTL_MAX_HOURS', 168))
+VERDICT_TTL_RATIO = float(os.getenv('VERDICT_TTL_RATIO', 0.5))
+
+# 이번 검색 결과에 노출된 카페 글은 삭제 확인 없이 '존재'로 추론 (미노출 글만 실제로 확인)
+# 노출 중인 글도 DELETION_REVERIFY_CYCLES 회차마다 한 번은 실제로 확인 (0이면 노출 중에는 확인 안 함, 1이면 매 회차)
+EXPOSURE_IMPLIES_ALIVE = os.getenv('EXPOSURE_IMPLIES_ALIVE', 'true').lower() == 'true'
+DELETION_REVERIFY_CYCLES = int(os.getenv('DELETION_REVERIFY_CYCLES', 12))
+
+# --check-deleted 카페별 일괄 확인: 카페마다 세션 하나로 최신 글 목록을 훑어 목록에 있는 글은 존재로 판정하고,
+# 나머지만 글별 HTTP 확인 → 그래도 판정 불가한 글만 Selenium. 카페당 최대 목록 페이지 수 / 페이지당 글 수
+CAFE_SWEEP = os.getenv('CAFE_SWEEP', 'true').lower() == 'true'
+CAFE_SWEEP_MAX_PAGES = int(os.getenv('CAFE_SWEEP_MAX_PAGES', 20))
+CAFE_SWEEP_PAGE_SIZE = int(os.getenv('CAFE_SWEEP_PAGE_SIZE', 50))
+# --check-deleted 결과를 DB에 저장하는 묶음 크기 (중단돼도 저장된 묶음까지는 다음 실행에서 건너뜀)
+CHECK_DELETED_BATCH_SIZE = int(os.getenv('CHECK_DELETED_BATCH_SIZE', 20))
+
+# 페이지 대기 최대 시간(초) — 조건(alert/결과 요소/DOM 변경 멈춤)이 충족되면 즉시 진행
+WAIT_ALERT_TIMEOUT = float(os.getenv('WAIT_ALERT_TIMEOUT', 1.5))
+WAIT_RENDER_TIMEOUT = float(os.getenv('WAIT_RENDER_TIMEOUT', 2.5))
+WAIT_SEARCH_TIMEOUT = float(os.getenv('WAIT_SEARCH_TIMEOUT', 2.0))
+# DOM 변경이 이 시간(ms) 동안 없으면 렌더링 완료로 판단
+WAIT_DOM_QUIET_MS = int(os.getenv('WAIT_DOM_QUIET_MS', 300))
+WAIT_POLL_INTERVAL = float(os.getenv('WAIT_POLL_INTERVAL', 0.1))
+
+# 경량 브라우징: 이미지/폰트/미디어/광고·트래킹 스크립트 차단 + eager 페이지 로딩 (레이아웃 측정 시 CSS/폰트는 허용)
+LEAN_BROWSING = os.getenv('LEAN_BROWSING', 'true').lower() == 'true'
+# 추가로 차단할 URL 패턴 (쉼표 구분, CDP Network.setBlockedURLs 와일드카드 형식)
+LEAN_EXTRA_BLOCKED_URLS = os.getenv('LEAN_EXTRA_BLOCKED_URLS', '')
+
+# 워치독: 작업별 제한 시간(초) — 페이지 로딩 / 스크립트 실행 (chromedriver가 스스로 중단)
+WATCHDOG_PAGE_LOAD_TIMEOUT = float(os.getenv('WATCHDOG_PAGE_LOAD_TIMEOUT', 30))
+WATCHDOG_SCRIPT_TIMEOUT = float(os.getenv('WATCHDOG_SCRIPT_TIMEOUT', 10))
+# 제한 시간 + 유예 시간이 지나도 작업이 끝나지 않으면 chromedriver/Chrome 프로세스 트리 강제 종료
+WATCHDOG_KILL_GRACE = float(os.getenv('WATCHDOG_KILL_GRACE', 15))
+
 # ===========================================
 # Google Sheets 설정
 # ===========================================
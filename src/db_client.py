@@ -22,6 +22,8 @@ class DatabaseClient:
         self.database = database
         self.table = table
         self.connection = None
+        # 직접 실행해야 하는 DDL 로 추가되는 열의 존재 여부 (열 이름 → bool)
+        self._columns = {}
 
     def connect(self) -> bool:
         """DB 연결"""
@@ -57,6 +59,20 @@ class DatabaseClient:
         except Exception:
             return self.connect()
 
+    def _has_column(self, column: str) -> bool:
+        """테이블에 열이 있는지 (DDL 적용 전 DB 대비, 클라이언트마다 한 번만 조회)"""
+        if column not in self._columns:
+            try:
+                with self.connection.cursor() as cursor:
+                    cursor.execute(f"SHOW COLUMNS FROM {self.table} LIKE %s", (column,))
+                    self._columns[column] = cursor.fetchone() is not None
+            except Exception as e:
+                logging.error(f"{self.table}.{column} 열 확인 실패: {e}")
+                return False
+            if not self._columns[column]:
+                logging.warning(f"{self.table}.{column} 열이 없습니다 — DDL 적용 전까지 해당 기능 없이 동작합니다.")
+        return self._columns[column]
+
     def get_keywords_for_monitoring(self, products: Optional[List[str]] = None) -> List[Dict]:
         """
         모니터링할 키워드 목록을 DB에서 가져오기
@@ -169,6 +185,105 @@ class DatabaseClient:
             self.connection.rollback()
             logging.error(f"삭제 업데이트 실패: {e}")
 
+    def get_rows_for_deletion_check(self, limit: Optional[int] = None) -> List[Dict]:
+        """
+        삭제 확인 대상 행 (keywords 에 키워드가 있고, URL이 있고 삭제되지 않은 행) — 마지막 삭제 확인 시도 시각이 오래된 순
+        시도 시각(deletion_attempted_at)이 없으면 checked_at 기준, 둘 다 없는 행이 가장 먼저
+        (판정 불가였던 행도 시도 시각이 갱신되므로 맨 앞에 남아 나머지 행을 막지 않음)
+        deletion_attempted_at 열이 없는 DB(아래 DDL 적용 전)는 checked_at 순으로만 정렬
+
+        Args:
+            limit: 최대 행 수 (None이면 전체)
+
+        Returns:
+            [{'row': DB id, 'target_url': result_url, 'checked_at': datetime 또는 None}, ...]
+
+        NOTE: DDL (DB에서 직접 실행 필요):
+        ALTER TABLE keyword_patrol_logs
+            ADD COLUMN deletion_attempted_at DATETIME DEFAULT NULL,
+            ADD INDEX idx_deletion_attempted (deletion_attempted_at);
+        """
+        if not self._ensure_connection():
+            logging.error("DB 연결 실패로 삭제 확인 대상을 가져올 수 없습니다.")
+            return []
+
+        # MySQL 오름차순 정렬은 NULL 이 먼저
+        if self._has_column('deletion_attempted_at'):
+            order_by = "COALESCE(kr.deletion_attempted_at, kr.checked_at), kr.id"
+        else:
+            order_by = "kr.checked_at, kr.id"
+        sql = f"""
+            SELECT kr.id, kr.result_url, kr.checked_at
+            FROM {self.table} kr
+            JOIN keywords k ON kr.keyword_id = k.keyword_id
+            WHERE COALESCE(kr.is_deleted, 0) = 0
+              AND kr.result_url IS NOT NULL AND kr.result_url != ''
+            ORDER BY {order_by}
+        """
+        params = []
+        if limit:
+            sql += " LIMIT %s"
+            params.append(int(limit))
+
+        try:
+            with self.connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                rows = cursor.fetchall()
+            return [
+                {'row': db_id, 'target_url': result_url, 'checked_at': checked_at}
+                for db_id, result_url, checked_at in rows
+            ]
+        except Exception as e:
+            logging.error(f"삭제 확인 대상 로드 실패: {e}")
+            return []
+
+    def record_deletion_checks(self, results: List[Dict]):
+        """
+        삭제 확인 결과를 바로 저장 (--check-deleted 에서 작은 묶음마다 호출)
+        모든 행의 시도 시각(deletion_attempted_at, 열이 있을 때만)을 갱신하고, 실제로 확인해 존재한 행은 checked_at 도 갱신,
+        삭제된 행은 is_deleted=1 로 업데이트 (판정 불가 행은 시도 시각만)
+
+        Args:
+            results: [{'row': DB id, 'is_deleted': True/False/None, 'cached': 캐시 판정 여부(선택)}, ...]
+        """
+        if not results:
+            return
+        attempted_ids = [r['row'] for r in results]
+        deleted_ids = [r['row'] for r in results if r.get('is_deleted')]
+        # 캐시 판정(존재)은 실제 확인이 아니므로 checked_at 은 그대로
+        alive_ids = [r['row'] for r in results if r.get('is_deleted') is False and not r.get('cached')]
+
+        if not self._ensure_connection():
+            logging.error("DB 연결 실패로 삭제 확인 결과 저장을 건너뜁니다.")
+            return
+
+        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        try:
+            with self.connection.cursor() as cursor:
+                if self._has_column('deletion_attempted_at'):
+                    placeholders = ', '.join(['%s'] * len(attempted_ids))
+                    cursor.execute(
+                        f"UPDATE {self.table} SET deletion_attempted_at = %s WHERE id IN ({placeholders})",
+                        [current_time] + attempted_ids,
+                    )
+                if deleted_ids:
+                    placeholders = ', '.join(['%s'] * len(deleted_ids))
+                    cursor.execute(
+                        f"UPDATE {self.table} SET is_deleted = 1, checked_at = %s, updated_at = %s "
+                        f"WHERE id IN ({placeholders})",
+                        [current_time, current_time] + deleted_ids,
+                    )
+                if alive_ids:
+                    placeholders = ', '.join(['%s'] * len(alive_ids))
+                    cursor.execute(
+                        f"UPDATE {self.table} SET checked_at = %s WHERE id IN ({placeholders})",
+                        [current_time] + alive_ids,
+                    )
+            self.connection.commit()
+        except Exception as e:
+            self.connection.rollback()
+            logging.error(f"삭제 확인 결과 저장 실패: {e}")
+
     def batch_update_monitoring_results(self, results: List[Dict]):
         """
         모니터링 결과를 DB에 일괄 업데이트
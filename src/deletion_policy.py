@@ -0,0 +1,253 @@
+"""
+삭제 판정 추론 정책 (카페 키워드 모니터링)
+이번 검색 결과에 노출된 글은 삭제되지 않은 것이 확실하므로 브라우저 확인 없이 '존재'로 추론하고,
+미노출 글만 실제로 확인 (BlogMonitor 와 같은 방식).
+노출이 이어지는 글도 DELETION_REVERIFY_CYCLES 회차마다 한 번은 실제로 확인.
+회차 번호와 회차 간격은 프로세스 이름(gui.py / scheduler.py 등)별로 파일에 유지하고, URL별로는 실제 확인 시각을 기록해
+'이 프로세스의 N회차 간격만큼 시간이 지났는지'로 재확인 여부를 정함 (동시에 도는 다른 프로세스가 회차를 앞당기지 않음).
+URL별 마지막 판정 출처(inferred / observed)도 기록.
+"""
+
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from typing import Callable, Iterable, Optional
+
+from src.config import EXPOSURE_IMPLIES_ALIVE, DELETION_REVERIFY_CYCLES, VERDICT_CACHE_PATH
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS policy_cycles (
+    label TEXT PRIMARY KEY,
+    cycle INTEGER NOT NULL,
+    started_at REAL NOT NULL,
+    period REAL
+);
+CREATE TABLE IF NOT EXISTS policy_verdicts (
+    url TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    observed_at REAL,
+    updated_at REAL NOT NULL
+);
+"""
+
+# 회차 간격 이동 평균 가중치 / 한 번의 간격이 평균에 반영되는 상한 (프로그램을 오래 꺼 둔 간격 제외)
+_PERIOD_WEIGHT = 0.3
+_PERIOD_MAX_FACTOR = 3
+
+INFERRED = 'inferred'
+OBSERVED = 'observed'
+
+
+class DeletionInferencePolicy:
+    """노출 = 존재 추론 + N회차마다 강제 재확인"""
+
+    def __init__(self, path: str = VERDICT_CACHE_PATH, enabled: bool = EXPOSURE_IMPLIES_ALIVE,
+                 reverify_cycles: int = DELETION_REVERIFY_CYCLES, normalize: Optional[Callable[[str], str]] = None,
+                 label: Optional[str] = None):
+        """
+        Args:
+            path: SQLite 파일 경로 (삭제 확인 캐시와 같은 파일, 별도 테이블)
+            enabled: False면 추론 없이 모든 글을 실제로 확인 (기존 동작)
+            reverify_cycles: 노출 중인 글도 이 회차 수마다 실제로 확인 (0이면 노출 중에는 확인하지 않음)
+            normalize: URL 정규화 함수 (기본: NaverScraper.normalize_url)
+            label: 회차 번호/간격을 따로 세는 프로세스 이름 (기본: 실행 스크립트 이름)
+        """
+        if normalize is None:
+            from src.scraper import NaverScraper
+            normalize = NaverScraper.normalize_url
+        self.path = path
+        self.enabled = enabled
+        self.reverify_cycles = max(0, reverify_cycles)
+        self.normalize = normalize
+        self.label = label or os.path.basename(sys.argv[0] or 'python')
+        self.cycle = 0
+        self.period = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._counts = {'inferred': 0, 'observed_exposed': 0, 'observed_unexposed': 0}
+        if self.enabled:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                conn = self._connect()
+                conn.executescript(_SCHEMA)
+                # 회차 번호로 기록하던 이전 파일은 확인 시각 열을 추가 (기존 행은 처음 보는 글처럼 다시 나눠 기록됨)
+                columns = {row[1] for row in conn.execute('PRAGMA table_info(policy_verdicts)')}
+                if 'observed_at' not in columns:
+                    conn.execute('ALTER TABLE policy_verdicts ADD COLUMN observed_at REAL')
+            except (OSError, sqlite3.Error) as e:
+                logging.warning(f"삭제 판정 추론 기록 파일을 열 수 없어 회차마다 강제 재확인: {e}")
+                self.reverify_cycles = 1
+                self._local = None
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """스레드별 연결 (파일을 열 수 없으면 None — 기록 없이 동작)"""
+        if self._local is None:
+            return None
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def start_cycle(self) -> int:
+        """
+        이 프로세스 이름의 회차 번호 증가 + 회차 간격(이동 평균) 갱신
+        (파일에 저장 — 프로세스를 다시 시작해도 이어짐). 반환값: 이번 회차 번호
+        """
+        self._counts = dict.fromkeys(self._counts, 0)
+        conn = self._connect() if self.enabled else None
+        if conn is None:
+            self.cycle += 1
+            return self.cycle
+        now = time.time()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = conn.execute(
+                    'SELECT cycle, started_at, period FROM policy_cycles WHERE label = ?', (self.label,)
+                ).fetchone()
+                if row is None:
+                    cycle, period = 1, None
+                else:
+                    cycle, started_at, period = row[0] + 1, row[1], row[2]
+                    gap = max(0.0, now - started_at)
+                    if period is None:
+                        period = gap
+                    else:
+                        period += _PERIOD_WEIGHT * (min(gap, period * _PERIOD_MAX_FACTOR) - period)
+                conn.execute(
+                    'INSERT INTO policy_cycles (label, cycle, started_at, period) VALUES (?, ?, ?, ?) '
+                    'ON CONFLICT(label) DO UPDATE SET cycle = excluded.cycle, started_at = excluded.started_at, '
+                    'period = excluded.period',
+                    (self.label, cycle, now, period),
+                )
+                conn.execute('COMMIT')
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            self.cycle, self.period = cycle, period
+        except sqlite3.Error as e:
+            logging.warning(f"삭제 판정 회차 번호 저장 실패: {e}")
+            self.cycle += 1
+        return self.cycle
+
+    @property
+    def forces_reverify(self) -> bool:
+        """노출 중인 글을 정기적으로 캐시 없이 실제 확인하는지 (아니면 노출 글도 삭제 확인 캐시를 그대로 사용)"""
+        return self.enabled and self.reverify_cycles > 1
+
+    def needs_check(self, url: str, exposed: bool) -> bool:
+        """
+        실제 삭제 확인이 필요한지
+
+        Args:
+            url: 글 URL
+            exposed: 이번 회차 검색 결과 노출 여부
+        """
+        if not self.enabled or not exposed:
+            return True
+        if self.reverify_cycles == 0:
+            return False
+        if self.reverify_cycles == 1:
+            return True
+        conn = self._connect()
+        if conn is None:
+            return True
+        row = conn.execute(
+            'SELECT observed_at FROM policy_verdicts WHERE url = ?', (self.normalize(url),)
+        ).fetchone()
+        # 처음 보는 노출 글도 추론 (record 에서 첫 재확인 시점을 URL별로 나눠 둠),
+        # 이 프로세스의 회차 간격을 아직 모르면(첫 회차) 재확인 없이 추론
+        if row is None or row[0] is None or not self.period:
+            return False
+        # 회차마다 걸리는 시간이 조금씩 달라도 N회차째에 걸리도록 반 회차 여유
+        return time.time() - row[0] >= (self.reverify_cycles - 0.5) * self.period
+
+    def record(self, observed_exposed: Iterable[str] = (), observed_unexposed: Iterable[str] = (),
+               inferred: Iterable[str] = ()):
+        """이번 키워드의 판정 출처 기록 (실제 확인한 글은 확인 회차도 갱신, 한 트랜잭션)"""
+        observed_exposed, observed_unexposed, inferred = list(observed_exposed), list(observed_unexposed), list(inferred)
+        with self._lock:
+            self._counts['observed_exposed'] += len(observed_exposed)
+            self._counts['observed_unexposed'] += len(observed_unexposed)
+            self._counts['inferred'] += len(inferred)
+        conn = self._connect() if self.enabled else None
+        if conn is None:
+            return
+        now = time.time()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                for url in observed_exposed + observed_unexposed:
+                    key = self.normalize(url)
+                    conn.execute(
+                        'INSERT INTO policy_verdicts (url, source, observed_at, updated_at) VALUES (?, ?, ?, ?) '
+                        'ON CONFLICT(url) DO UPDATE SET source = excluded.source, '
+                        'observed_at = ?, updated_at = excluded.updated_at',
+                        (key, OBSERVED, self._phased_time(key, now), now, now),
+                    )
+                for url in inferred:
+                    key = self.normalize(url)
+                    # 한 번도 확인하지 않은 글은 첫 재확인이 다음 N회차에 고르게 나뉘도록 기준 시각을 앞당겨 기록
+                    # (회차 간격을 아직 모르면 비워 두고 다음 회차에 기록)
+                    conn.execute(
+                        'INSERT INTO policy_verdicts (url, source, observed_at, updated_at) VALUES (?, ?, ?, ?) '
+                        'ON CONFLICT(url) DO UPDATE SET source = excluded.source, '
+                        'observed_at = COALESCE(observed_at, excluded.observed_at), '
+                        'updated_at = excluded.updated_at',
+                        (key, INFERRED, self._phased_time(key, now) if self.period else None, now),
+                    )
+                conn.execute('COMMIT')
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+        except sqlite3.Error as e:
+            logging.warning(f"삭제 판정 출처 기록 실패: {e}")
+
+    def _phased_time(self, key: str, now: float) -> float:
+        """처음 기록하는 글의 기준 시각 (URL별로 0~N-1회차 간격만큼 앞당겨 정기 재확인이 한 회차에 몰리지 않게 함)"""
+        phase = zlib.crc32(key.encode('utf-8')) % self.reverify_cycles if self.reverify_cycles > 1 else 0
+        return now - phase * (self.period or 0.0)
+
+    def source_of(self, url: str) -> Optional[str]:
+        """URL의 마지막 판정 출처 ('inferred' / 'observed', 기록 없으면 None)"""
+        conn = self._connect() if self.enabled else None
+        if conn is None or not url:
+            return None
+        row = conn.execute('SELECT source FROM policy_verdicts WHERE url = ?', (self.normalize(url),)).fetchone()
+        return row[0] if row else None
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            {'enabled', 'label', 'cycle', 'period_seconds', 'reverify_cycles', 'inferred', 'observed_exposed',
+             'observed_unexposed', 'inferred_ratio'}
+        """
+        with self._lock:
+            stats = dict(self._counts)
+        total = sum(stats.values())
+        stats.update(
+            enabled=self.enabled,
+            label=self.label,
+            cycle=self.cycle,
+            period_seconds=round(self.period, 1) if self.period else None,
+            reverify_cycles=self.reverify_cycles,
+            inferred_ratio=round(stats['inferred'] / total, 3) if total else 0.0,
+        )
+        return stats
+
+    def log_stats(self):
+        s = self.stats()
+        if not s['enabled']:
+            return
+        logging.info(
+            f"삭제 판정 추론 ({s['label']} 회차 {s['cycle']}): 노출로 존재 추론 {s['inferred']}건({s['inferred_ratio']:.0%}), "
+            f"실제 확인 — 미노출 {s['observed_unexposed']}건, 노출 중 정기 재확인 {s['observed_exposed']}건 "
+            f"({s['reverify_cycles']}회차마다)"
+        )
@@ -0,0 +1,309 @@
+"""
+게시글 삭제 여부 HTTP 확인 (브라우저 없이)
+- 카페: 카페 글 조회 API(JSON) 응답으로 판정 (URL 의 카페 주소 → 숫자 카페 ID 는 카페 정보 API 로 조회해 캐시)
+- 블로그: 모바일 글 페이지(m.blog.naver.com) 의 삭제/비공개 문구와 본문 표식으로 판정
+- 판정 기준은 Selenium 확인(NaverScraper._check_post_deleted_with)과 같음:
+  카페 글 조회 API 의 404 / 글 없음 오류 코드 → 삭제, 멤버 공개 등 권한 제한 → 존재, 블로그 비공개/접근 제한 → 삭제
+- 어느 쪽인지 확실하지 않은 응답(차단, 서버 오류, 로그인 이동, 알 수 없는 형식)은 판정하지 않고 None 반환
+  → 호출 측에서 Selenium 으로 확인
+"""
+
+import logging
+import re
+import threading
+from typing import Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+import requests
+
+from src.config import DELETION_PROBE, HTTP_TIMEOUT
+from src.pacing import BLOCK_STATUS_CODES
+from src.transport import SearchTransport
+
+CAFE_INFO_API = 'https://apis.naver.com/cafe-web/cafe2/CafeGateInfo.json?cluburl={slug}'
+CAFE_ARTICLE_API = ('https://apis.naver.com/cafe-web/cafe-articleapi/v2.1/cafes/{club_id}/articles/{article_id}'
+                    '?useCafeId=true')
+# 카페 최신 글 목록 (전체글보기, 최신순) — --check-deleted 카페별 일괄 확인(src.cafe_sweep)에서 사용
+CAFE_ARTICLE_LIST_API = ('https://apis.naver.com/cafe-web/cafe2/ArticleListV2dot1.json?search.clubid={club_id}'
+                         '&search.queryType=lastArticle&search.page={page}&search.perPage={per_page}')
+BLOG_MOBILE_POST = 'https://m.blog.naver.com/PostView.naver?blogId={blog_id}&logNo={log_no}'
+
+# 카페 글 조회 API 오류 응답(errorCode) 중 글이 삭제되었거나 없음을 뜻하는 코드
+# 이 코드나 404 응답일 때만 삭제로 판정 (오류 문구의 '삭제' 같은 단어만으로는 판정하지 않음)
+CAFE_ARTICLE_DELETED_CODES = ('0004', '4004')
+# 글은 있지만 볼 권한이 없는 경우의 오류 안내 문구 (Selenium 확인에서도 존재로 판정)
+CAFE_RESTRICTED_MARKERS = ('멤버', '권한', '등급', '로그인')
+# Selenium 확인의 블로그 판정 문구 + 삭제된 글 안내 문구
+BLOG_DELETED_MARKERS = ('비공개 블로그입니다', '접근이 제한', '삭제되었거나 존재하지 않', '존재하지 않는 게시물')
+# 글 본문이 있는 모바일 블로그 페이지 표식 (스마트에디터 본문 / 구버전 본문)
+BLOG_ALIVE_MARKERS = ('se-main-container', 'se_component_wrap', 'post_ct', '__se_component_area')
+
+_CAFE_PATH_RE = re.compile(r'^/(?:ca-fe/(?:web/)?cafes/)?([A-Za-z0-9_-]+)/(?:articles/)?(\d+)')
+_CLUB_ID_RE = re.compile(r'clubid=(\d+)', re.IGNORECASE)
+_ARTICLE_ID_RE = re.compile(r'articleid=(\d+)', re.IGNORECASE)
+_BLOG_PATH_RE = re.compile(r'^/([A-Za-z0-9_-]+)/(\d+)')
+_BLOG_ID_RE = re.compile(r'blogId=([A-Za-z0-9_-]+)')
+_LOG_NO_RE = re.compile(r'logNo=(\d+)')
+
+
+def parse_cafe_article(url: str) -> Optional[Tuple[str, str, bool]]:
+    """
+    카페 글 URL → (카페 주소 또는 숫자 카페 ID, 글 번호, 숫자 카페 ID 여부), 글 URL 이 아니면 None
+
+    지원 형식: cafe.naver.com/{카페}/{글}, cafe.naver.com/ca-fe/cafes/{카페ID}/articles/{글},
+              ArticleRead.nhn?clubid=..&articleid=.. (iframe_url 로 감싼 형식 포함), m.cafe.naver.com 동일
+    """
+    decoded = unquote(url or '')
+    club_id = _CLUB_ID_RE.search(decoded)
+    article_id = _ARTICLE_ID_RE.search(decoded)
+    if club_id and article_id:
+        return club_id.group(1), article_id.group(1), True
+    m = _CAFE_PATH_RE.match(urlparse(url).path)
+    if not m:
+        return None
+    cafe, article = m.groups()
+    return cafe, article, cafe.isdigit()
+
+
+def parse_blog_post(url: str) -> Optional[Tuple[str, str]]:
+    """블로그 글 URL → (블로그 ID, 글 번호), 글 URL 이 아니면 None (blog.naver.com/{ID}/{글}, PostView?blogId=&logNo=)"""
+    blog_id = _BLOG_ID_RE.search(url or '')
+    log_no = _LOG_NO_RE.search(url or '')
+    if blog_id and log_no:
+        return blog_id.group(1), log_no.group(1)
+    m = _BLOG_PATH_RE.match(urlparse(url).path)
+    return m.groups() if m else None
+
+
+def _find_key(data, key: str):
+    """중첩 JSON 에서 key 의 첫 값 (없으면 None)"""
+    if isinstance(data, dict):
+        if key in data:
+            return data[key]
+        data = list(data.values())
+    if isinstance(data, list):
+        for value in data:
+            found = _find_key(value, key)
+            if found is not None:
+                return found
+    return None
+
+
+def _api_error(data) -> Tuple[Optional[str], str]:
+    """카페 API 오류 응답 → (errorCode, 안내 문구 reason) — 오류 객체가 없으면 (None, '')"""
+    code = _find_key(data, 'errorCode')
+    reason = _find_key(data, 'reason')
+    return (str(code) if code is not None else None), (reason if isinstance(reason, str) else '')
+
+
+class DeletionProbe:
+    """HTTP 응답만으로 게시글 삭제 여부 판정 (스레드 안전, 판정 불가면 None)"""
+
+    def __init__(self, enabled: bool = DELETION_PROBE, transport: Optional[SearchTransport] = None,
+                 timeout=HTTP_TIMEOUT):
+        """
+        Args:
+            enabled: False면 항상 판정 불가(None) — 모든 확인을 Selenium 으로
+            transport: HTTP 전송 계층 (None이면 검색과 별도의 커넥션 풀 생성 — 전송 통계도 분리)
+            timeout: 요청 제한 시간 (requests timeout 형식)
+        """
+        self.enabled = enabled
+        self.transport = transport or SearchTransport()
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._club_ids = {}
+        self._stats = {
+            'probed': 0,
+            'deleted': 0,
+            'alive': 0,
+            'unknown': 0,
+            'browser_checks': 0,
+        }
+        self._unknown_reasons = {}
+
+    def probe(self, url: str, budget=None, session: Optional[requests.Session] = None
+              ) -> Tuple[Optional[bool], Optional[str]]:
+        """
+        게시글 삭제 여부 HTTP 확인 — NaverScraper.check_post_deleted 와 같은 (is_deleted, message) 형식
+
+        Args:
+            url: 카페/블로그 글 URL
+            budget: 요청 전에 기다리고 응답(차단 여부)을 기록할 페이싱 예산 (AimdBudget, 없으면 대기 없음)
+            session: 요청에 쓸 세션 (카페별 쿠키를 받아 둔 세션 등, None이면 쿠키 없는 공용 전송 계층)
+
+        Returns:
+            (True, 문구) 삭제 / (False, None) 존재 / (None, 판정 불가 사유) → Selenium 확인 필요
+        """
+        if not self.enabled:
+            return None, 'HTTP 확인 꺼짐'
+        if 'cafe.naver.com' in url:
+            result = self._probe_cafe(url, budget, session)
+        elif 'blog.naver.com' in url:
+            result = self._probe_blog(url, budget, session)
+        else:
+            result = (None, '카페/블로그 URL 아님')
+
+        is_deleted, message = result
+        with self._lock:
+            self._stats['probed'] += 1
+            if is_deleted is None:
+                self._stats['unknown'] += 1
+                self._unknown_reasons[message] = self._unknown_reasons.get(message, 0) + 1
+            else:
+                self._stats['deleted' if is_deleted else 'alive'] += 1
+        return result
+
+    def record_browser_check(self, count: int = 1):
+        """판정 불가로 Selenium 확인을 한 건수 기록 (통계용)"""
+        with self._lock:
+            self._stats['browser_checks'] += count
+
+    def _get(self, url: str, budget, session: Optional[requests.Session] = None,
+             **kwargs) -> Optional[requests.Response]:
+        """페이싱 예산을 지켜 GET (요청 실패 시 None)"""
+        if budget is not None:
+            budget.wait()
+        try:
+            get = session.get if session is not None else self.transport.get
+            response = get(url, timeout=self.timeout, **kwargs)
+        except requests.RequestException as e:
+            logging.info(f"삭제 확인 HTTP 요청 실패 ({url}): {e}")
+            if budget is not None:
+                budget.record(False)
+            return None
+        if budget is not None:
+            budget.record(response.status_code not in BLOCK_STATUS_CODES)
+        return response
+
+    def club_id(self, slug: str, budget=None, session: Optional[requests.Session] = None
+                ) -> Tuple[Optional[str], Optional[str]]:
+        """카페 주소 → (숫자 카페 ID, 없을 때 사유) — 조회 결과는 캐시, 카페 정보 API 가 404면 ID 대신 '' 캐시"""
+        with self._lock:
+            if slug in self._club_ids:
+                return self._club_ids[slug], None
+        response = self._get(CAFE_INFO_API.format(slug=slug), budget, session,
+                             headers={'Referer': 'https://cafe.naver.com/'})
+        if response is None:
+            return None, '카페 정보 요청 실패'
+        try:
+            data = response.json()
+        except ValueError:
+            return None, f"카페 정보 응답 형식 오류 ({response.status_code})"
+        club_id = _find_key(data, 'cafeId') or _find_key(data, 'clubid')
+        if club_id:
+            club_id = str(club_id)
+        elif response.status_code == 404:
+            club_id = ''   # 폐쇄/없는 카페
+        else:
+            # 차단/서버 오류/알 수 없는 형식 — 캐시하지 않고 판정 불가 (카페 전체를 삭제로 보지 않음)
+            return None, f"카페 ID 없음 ({response.status_code})"
+        with self._lock:
+            self._club_ids[slug] = club_id
+        return club_id, None
+
+    def cafe_article_ids(self, club_id: str, page: int, per_page: int, budget=None,
+                         session: Optional[requests.Session] = None) -> Optional[list]:
+        """
+        카페 전체글 목록 한 페이지의 글 번호 (최신순, 문자열) — 요청 실패/알 수 없는 형식이면 None
+
+        Args:
+            club_id: 숫자 카페 ID
+            page: 1부터 시작하는 페이지 번호
+            per_page: 페이지당 글 수
+        """
+        response = self._get(CAFE_ARTICLE_LIST_API.format(club_id=club_id, page=page, per_page=per_page),
+                             budget, session, headers={'Referer': f"https://cafe.naver.com/ca-fe/cafes/{club_id}"})
+        if response is None or response.status_code != 200:
+            return None
+        try:
+            entries = _find_key(response.json(), 'articleList')
+        except ValueError:
+            return None
+        if not isinstance(entries, list):
+            return None
+        ids = []
+        for entry in entries:
+            article_id = _find_key(entry, 'articleId')
+            if article_id is not None:
+                ids.append(str(article_id))
+        return ids
+
+    def _probe_cafe(self, url: str, budget, session) -> Tuple[Optional[bool], Optional[str]]:
+        parsed = parse_cafe_article(url)
+        if parsed is None:
+            return None, '카페 글 URL 형식 아님'
+        cafe, article_id, is_club_id = parsed
+        club_id, reason = (cafe, None) if is_club_id else self.club_id(cafe, budget, session)
+        if club_id is None:
+            return None, reason
+        if club_id == '':
+            return True, '존재하지 않는 카페'
+
+        response = self._get(CAFE_ARTICLE_API.format(club_id=club_id, article_id=article_id), budget, session,
+                             headers={'Referer': f"https://cafe.naver.com/ca-fe/cafes/{club_id}/articles/{article_id}"})
+        if response is None:
+            return None, '카페 글 요청 실패'
+        try:
+            data = response.json()
+        except ValueError:
+            return None, f"카페 글 응답 형식 오류 ({response.status_code})"
+
+        # 정상 응답의 글 제목/본문에도 '삭제' 같은 단어가 있을 수 있으므로 글 정보가 있으면 먼저 존재로 판정
+        article = _find_key(data, 'article')
+        if response.status_code == 200 and isinstance(article, dict) and article:
+            return False, None
+        if response.status_code in BLOCK_STATUS_CODES or response.status_code >= 500:
+            return None, f"카페 글 응답 판정 불가 ({response.status_code})"
+        code, reason = _api_error(data)
+        if response.status_code == 404 or code in CAFE_ARTICLE_DELETED_CODES:
+            return True, (reason.strip() or '삭제되었거나 존재하지 않는 게시글')[:100]
+        if code is not None and any(marker in reason for marker in CAFE_RESTRICTED_MARKERS):
+            return False, None
+        return None, f"카페 글 응답 판정 불가 ({response.status_code}, {code})"
+
+    def _probe_blog(self, url: str, budget, session) -> Tuple[Optional[bool], Optional[str]]:
+        parsed = parse_blog_post(url)
+        if parsed is None:
+            return None, '블로그 글 URL 형식 아님'
+        blog_id, log_no = parsed
+        response = self._get(BLOG_MOBILE_POST.format(blog_id=blog_id, log_no=log_no), budget, session,
+                             headers={'Accept': 'text/html,application/xhtml+xml', 'Accept-Language': 'ko-KR,ko;q=0.9'})
+        if response is None:
+            return None, '블로그 글 요청 실패'
+        if 'nid.naver.com' in response.url:
+            return None, '블로그 글 로그인 필요'
+        if response.status_code in BLOCK_STATUS_CODES or response.status_code >= 500:
+            return None, f"블로그 글 응답 판정 불가 ({response.status_code})"
+
+        body = self.transport.decode_body(response)
+        for marker in BLOG_DELETED_MARKERS:
+            if marker in body:
+                return True, '비공개 블로그' if marker in BLOG_DELETED_MARKERS[:2] else '삭제된 게시물'
+        if response.status_code == 200 and any(marker in body for marker in BLOG_ALIVE_MARKERS):
+            return False, None
+        return None, f"블로그 글 응답 판정 불가 ({response.status_code})"
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            {'probed', 'deleted', 'alive', 'unknown', 'browser_checks',
+             'resolved_ratio': 브라우저 없이 판정한 비율 (0~1, 확인 없으면 None),
+             'unknown_reasons': {판정 불가 사유: 건수}}
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['unknown_reasons'] = dict(self._unknown_reasons)
+        resolved = stats['deleted'] + stats['alive']
+        stats['resolved_ratio'] = round(resolved / stats['probed'], 3) if stats['probed'] else None
+        return stats
+
+    def log_stats(self):
+        s = self.stats()
+        if not s['probed']:
+            return
+        logging.info(
+            f"삭제 확인 HTTP 판정: {s['probed']}건 중 {s['deleted'] + s['alive']}건({s['resolved_ratio']:.0%}) "
+            f"브라우저 없이 판정 (삭제 {s['deleted']}, 존재 {s['alive']}), Selenium 확인 {s['browser_checks']}건"
+        )
+        for reason, count in sorted(s['unknown_reasons'].items(), key=lambda kv: -kv[1]):
+            logging.info(f"  판정 불가 '{reason}': {count}건")
@@ -0,0 +1,232 @@
+"""
+Selenium WebDriver 풀 모듈
+- 여러 headless Chrome 드라이버를 미리/필요 시 생성해 대여(checkout)·반납(checkin)
+- 대여 시 세션 상태 확인, 반납 시 쿠키 초기화
+- 풀 크기만큼 삭제 확인/레이아웃 측정을 병렬 실행
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, List, Optional
+
+from src.config import DRIVER_POOL_SIZE
+
+
+class DriverPool:
+    """headless Chrome 드라이버 풀"""
+
+    def __init__(self, create_driver: Callable, is_alive: Callable, reset_driver: Callable,
+                 size: int = DRIVER_POOL_SIZE, should_retire: Optional[Callable] = None,
+                 on_close: Optional[Callable] = None):
+        """
+        초기화
+
+        Args:
+            create_driver: 새 드라이버를 만드는 함수 () -> WebDriver
+            is_alive: 드라이버 세션 상태 확인 함수 (driver) -> bool
+            reset_driver: 반납 시 드라이버 상태(쿠키 등)를 초기화하는 함수 (driver) -> None
+            size: 동시에 존재할 수 있는 최대 드라이버 수 (RAM ↔ 처리량 조절)
+            should_retire: 반납 시 드라이버를 재사용하지 않고 종료할지 판단하는 함수 (driver) -> bool
+            on_close: 드라이버 종료 후 호출되는 함수 (driver) -> None
+        """
+        self.size = max(1, size)
+        self._create_driver = create_driver
+        self._is_alive = is_alive
+        self._reset_driver = reset_driver
+        self._should_retire = should_retire
+        self._on_close = on_close
+
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        # 드라이버 생성(ChromeDriverManager 설치 포함)은 동시에 하지 않음 — 캐시 파일 경쟁 방지
+        self._create_lock = threading.Lock()
+        self._idle: List = []
+        self._generation = 0
+        self._driver_generation = {}
+
+        self._stats = {
+            'created': 0,
+            'closed': 0,
+            'checkouts': 0,
+            'checkout_wait_seconds': 0.0,
+        }
+
+    def _quit(self, driver):
+        """드라이버 종료 (오류 무시)"""
+        with self._lock:
+            self._driver_generation.pop(id(driver), None)
+            self._stats['closed'] += 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        if self._on_close is not None:
+            try:
+                self._on_close(driver)
+            except Exception:
+                pass
+
+    def checkout(self):
+        """
+        드라이버 대여. 빈 드라이버가 없으면 반납될 때까지 대기.
+        대여 전 세션 상태를 확인하여 죽은 드라이버는 새로 생성.
+        """
+        started = time.monotonic()
+        self._slots.acquire()
+        try:
+            while True:
+                with self._lock:
+                    driver = self._idle.pop() if self._idle else None
+                if driver is None:
+                    with self._create_lock:
+                        driver = self._create_driver()
+                    with self._lock:
+                        self._driver_generation[id(driver)] = self._generation
+                        self._stats['created'] += 1
+                    break
+                if self._is_alive(driver):
+                    break
+                logging.info("풀 드라이버 세션 종료 감지 — 폐기 후 재생성")
+                self._quit(driver)
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._stats['checkouts'] += 1
+            self._stats['checkout_wait_seconds'] += time.monotonic() - started
+        return driver
+
+    def checkin(self, driver, discard: bool = False):
+        """
+        드라이버 반납. 쿠키를 초기화해 다음 사용자가 "처음 방문자" 상태로 쓰도록 함.
+
+        Args:
+            driver: checkout 으로 받은 드라이버
+            discard: True면 재사용하지 않고 종료 (오류가 난 드라이버 등)
+        """
+        try:
+            with self._lock:
+                stale = self._driver_generation.get(id(driver)) != self._generation
+            if discard or stale or (self._should_retire is not None and self._should_retire(driver)):
+                self._quit(driver)
+                return
+            try:
+                self._reset_driver(driver)
+            except Exception as e:
+                logging.info(f"풀 드라이버 초기화 실패, 폐기: {e}")
+                self._quit(driver)
+                return
+            with self._lock:
+                self._idle.append(driver)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def driver(self):
+        """
+        드라이버 대여 컨텍스트. 블록 안에서 예외가 나면 해당 드라이버는 폐기.
+
+        사용 예:
+            with pool.driver() as driver:
+                driver.get(url)
+        """
+        driver = self.checkout()
+        discard = False
+        try:
+            yield driver
+        except BaseException:
+            discard = True
+            raise
+        finally:
+            self.checkin(driver, discard=discard)
+
+    def map(self, func: Callable, items, on_error: Optional[Callable] = None) -> list:
+        """
+        풀 크기만큼 병렬로 func(driver, item) 실행 후 입력 순서대로 결과 반환.
+        func 안에서 난 예외는 해당 드라이버를 폐기하고 그대로 전파
+        (on_error 가 있으면 드라이버를 폐기하고 on_error(item, 예외) 반환값을 결과로 사용).
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        def run(item):
+            if on_error is None:
+                with self.driver() as driver:
+                    return func(driver, item)
+            # 드라이버 생성 실패(checkout)는 그대로 전파, func 예외만 on_error 로 처리
+            driver = self.checkout()
+            discard = True
+            try:
+                result = func(driver, item)
+                discard = False
+                return result
+            except Exception as e:
+                return on_error(item, e)
+            finally:
+                self.checkin(driver, discard=discard)
+
+        if self.size == 1 or len(items) == 1:
+            return [run(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.size, len(items))) as executor:
+            return list(executor.map(run, items))
+
+    def for_each_idle(self, func: Callable) -> int:
+        """대기 중인 드라이버 각각에 func(driver) 실행 (오류 무시). 반환값: 성공한 드라이버 수"""
+        with self._lock:
+            idle = list(self._idle)
+        done = 0
+        for driver in idle:
+            try:
+                func(driver)
+                done += 1
+            except Exception as e:
+                logging.info(f"풀 드라이버 작업 중 오류 (무시): {e}")
+        return done
+
+    def retire_idle(self, predicate: Callable) -> int:
+        """
+        대기 중인 드라이버 중 predicate(driver)가 True인 것만 종료.
+        반환값: 종료한 드라이버 수
+        """
+        with self._lock:
+            idle = list(self._idle)
+        retired = []
+        for driver in idle:
+            try:
+                if predicate(driver):
+                    retired.append(driver)
+            except Exception as e:
+                logging.info(f"풀 드라이버 상태 확인 중 오류 (무시): {e}")
+        with self._lock:
+            retired = [d for d in retired if d in self._idle]
+            for driver in retired:
+                self._idle.remove(driver)
+        for driver in retired:
+            self._quit(driver)
+        return len(retired)
+
+    def close_all(self):
+        """
+        모든 드라이버 종료. 대여 중인 드라이버는 반납되는 시점에 종료.
+        반환값: 종료한 대기 드라이버 수
+        """
+        with self._lock:
+            self._generation += 1
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._quit(driver)
+        return len(idle)
+
+    def stats(self) -> dict:
+        """풀 통계 (생성/종료/대여 횟수, 누적 대여 대기 시간)"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = self.size
+            stats['idle'] = len(self._idle)
+        stats['checkout_wait_seconds'] = round(stats['checkout_wait_seconds'], 2)
+        return stats
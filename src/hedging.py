@@ -0,0 +1,166 @@
+"""
+검색 요청 헤징 (tail latency 단축)
+첫 요청이 최근 p90 응답 시간을 넘기면 같은 요청을 한 번 더 보내고 먼저 끝난 쪽 결과를 사용.
+추가 요청 수는 전체 요청 대비 비율(HEDGE_MAX_RATIO)로 제한하고, 헤지 요청도 검색 페이싱 슬롯/공유 예산 토큰을
+받아야 보냄 (바로 받을 수 없으면 헤지하지 않고 첫 요청을 기다림).
+헤지 발생/승리 횟수와 승리 시 절약한 시간을 집계해 추가 요청량 대비 효과를 확인.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Optional
+
+from src.config import HEDGE_MAX_RATIO, HEDGE_MIN_SAMPLES, HEDGE_WINDOW, SEARCH_CONCURRENCY
+
+
+class LatencyTracker:
+    """최근 N건 응답 시간의 백분위 계산"""
+
+    def __init__(self, window: int = HEDGE_WINDOW):
+        self._lock = threading.Lock()
+        self._samples = deque(maxlen=window)
+
+    def add(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._samples)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """pct 백분위 응답 시간 (초, 표본이 없으면 None)"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(round(pct / 100 * (len(samples) - 1))))
+        return samples[index]
+
+
+class HedgedFetcher:
+    """fetch(url) 호출을 p90 초과 시 한 번 더 보내는 래퍼 (스레드 안전)"""
+
+    def __init__(self, fetch: Callable, max_ratio: float = HEDGE_MAX_RATIO,
+                 min_samples: int = HEDGE_MIN_SAMPLES, workers: Optional[int] = None,
+                 acquire_slot: Optional[Callable[[], bool]] = None):
+        """
+        Args:
+            fetch: 실제 요청 함수 (url) -> 결과 또는 None(실패/차단)
+            acquire_slot: 헤지 요청 전에 호출하는 대기 없는 슬롯 예약 함수 () -> bool
+                          (예: 검색 페이싱 예산의 try_acquire, False면 헤지 생략 — None이면 제한 없음)
+            max_ratio: 전체 요청 대비 헤지 요청 비율 상한 (0.1이면 최대 10% 추가 요청)
+            min_samples: 이만큼 응답 시간이 쌓이기 전에는 헤지하지 않음
+            workers: 요청 실행 스레드 수 (기본: 동시 검색 수의 2배 + 2)
+        """
+        self.fetch = fetch
+        self.max_ratio = max_ratio
+        self.min_samples = min_samples
+        self.acquire_slot = acquire_slot
+        self.latency = LatencyTracker()
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers or SEARCH_CONCURRENCY * 2 + 2, thread_name_prefix='hedge')
+        self._lock = threading.Lock()
+        self._stats = {
+            'requests': 0,
+            'hedges_fired': 0,
+            'hedges_won': 0,
+            'hedges_capped': 0,
+            'hedges_no_slot': 0,
+            'saved_seconds': 0.0,
+        }
+
+    def _timed(self, url):
+        """fetch 실행 후 (결과, 소요 시간) 반환"""
+        started = time.monotonic()
+        result = self.fetch(url)
+        elapsed = time.monotonic() - started
+        self.latency.add(elapsed)
+        return result, elapsed
+
+    def _hedge_allowed(self) -> bool:
+        """헤지 상한 확인 후 헤지 1건 예약 (lock 보유 상태에서 호출)"""
+        if self._stats['hedges_fired'] + 1 > self.max_ratio * self._stats['requests']:
+            self._stats['hedges_capped'] += 1
+            return False
+        self._stats['hedges_fired'] += 1
+        return True
+
+    def _record_saving(self, primary, hedge_finished_after: float):
+        """헤지가 이긴 경우, 첫 요청이 끝난 시점에 절약한 시간을 기록"""
+        def on_done(future):
+            try:
+                _, primary_elapsed = future.result()
+            except Exception:
+                return
+            with self._lock:
+                self._stats['saved_seconds'] += max(0.0, primary_elapsed - hedge_finished_after)
+        primary.add_done_callback(on_done)
+
+    def __call__(self, url):
+        """url 요청 (p90 초과 시 헤지). 먼저 끝난 성공 결과, 둘 다 실패면 None 반환"""
+        with self._lock:
+            self._stats['requests'] += 1
+        started = time.monotonic()
+        primary = self._executor.submit(self._timed, url)
+
+        threshold = self.latency.percentile(90) if len(self.latency) >= self.min_samples else None
+        if threshold is None:
+            return primary.result()[0]
+        done, _ = wait([primary], timeout=threshold)
+        if done:
+            return primary.result()[0]
+
+        with self._lock:
+            allowed = self._hedge_allowed()
+        if not allowed:
+            return primary.result()[0]
+        if self.acquire_slot is not None and not self.acquire_slot():
+            # 페이싱 슬롯/공유 예산 토큰이 바로 없으면 헤지 요청을 보내지 않음 (예약했던 헤지 1건 취소)
+            with self._lock:
+                self._stats['hedges_fired'] -= 1
+                self._stats['hedges_no_slot'] += 1
+            return primary.result()[0]
+
+        logging.info(f"검색 응답 지연 ({threshold:.2f}초 초과) — 헤지 요청 전송")
+        hedge = self._executor.submit(self._timed, url)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result, _ = future.result()
+                except Exception:
+                    continue
+                if result is None:
+                    continue
+                if future is hedge:
+                    with self._lock:
+                        self._stats['hedges_won'] += 1
+                    self._record_saving(primary, time.monotonic() - started)
+                return result
+        return None
+
+    def stats(self) -> dict:
+        """{'requests', 'hedges_fired', 'hedges_won', 'hedges_capped', 'hedges_no_slot', 'saved_seconds', 'p90_seconds'}"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['saved_seconds'] = round(stats['saved_seconds'], 2)
+        p90 = self.latency.percentile(90)
+        stats['p90_seconds'] = round(p90, 3) if p90 is not None else None
+        return stats
+
+    def log_stats(self):
+        s = self.stats()
+        if s['requests']:
+            logging.info(
+                f"검색 헤징 통계: 요청 {s['requests']}건, 헤지 {s['hedges_fired']}건 "
+                f"(승리 {s['hedges_won']}건, 상한 초과 {s['hedges_capped']}건, 페이싱 슬롯 없음 {s['hedges_no_slot']}건), "
+                f"절약 {s['saved_seconds']}초, p90 {s['p90_seconds']}초"
+            )
+
+    def close(self):
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,137 @@
+"""
+경량 브라우징 모듈
+headless Chrome이 쓰지 않는 리소스(이미지, 폰트, 미디어, 광고/트래킹 스크립트)를
+CDP Network.setBlockedURLs 로 차단하고, 페이지별 수신 바이트/로딩 시간을 집계.
+
+프로필:
+- 'lean'   : 삭제 확인/검색 폴백용 — CSS까지 차단 (alert/페이지 소스만 필요)
+- 'layout' : 레이아웃 측정용 — getBoundingClientRect 결과에 영향을 주는 CSS/폰트/이미지/미디어는 허용
+              (크기 지정 없는 썸네일·동영상이 빠지면 블록 높이가 줄어 first_cafe_y_pct/post_y_pct 가 달라짐)
+              광고/트래킹 스크립트만 차단
+"""
+
+import logging
+import threading
+
+from src.config import LEAN_BROWSING, LEAN_EXTRA_BLOCKED_URLS
+
+# 이미지 (확장자 + 네이버 썸네일/이미지 프록시 호스트)
+_IMAGE_PATTERNS = [
+    '*.jpg*', '*.jpeg*', '*.png*', '*.gif*', '*.webp*', '*.avif*', '*.bmp*',
+    '*-phinf.pstatic.net/*', '*search.pstatic.net/common/*', '*dthumb-phinf.pstatic.net/*',
+]
+_FONT_PATTERNS = ['*.woff*', '*.ttf*', '*.otf*', '*.eot*']
+_MEDIA_PATTERNS = ['*.mp4*', '*.webm*', '*.m3u8*', '*.mp3*', '*.m4a*']
+# 광고/트래킹 스크립트 (페이지 내용·alert와 무관)
+_TRACKER_PATTERNS = [
+    '*doubleclick.net/*', '*googlesyndication.com/*', '*google-analytics.com/*',
+    '*googletagmanager.com/*', '*facebook.net/*', '*wcs.naver.net/*', '*lcs.naver.com/*',
+    '*tivan.naver.com/*', '*siape.veta.naver.com/*', '*nam.veta.naver.com/*',
+]
+_STYLE_PATTERNS = ['*.css*']
+
+_EXTRA_PATTERNS = [p.strip() for p in LEAN_EXTRA_BLOCKED_URLS.split(',') if p.strip()]
+
+BLOCKED_URL_PROFILES = {
+    'lean': _IMAGE_PATTERNS + _FONT_PATTERNS + _MEDIA_PATTERNS + _TRACKER_PATTERNS + _STYLE_PATTERNS + _EXTRA_PATTERNS,
+    'layout': _TRACKER_PATTERNS + _EXTRA_PATTERNS,
+}
+
+# 현재 문서의 수신 바이트(transferSize 합계)와 로딩 시간(ms)
+# (Timing-Allow-Origin 헤더가 없는 교차 출처 리소스는 transferSize가 0이므로 하한값)
+_PAGE_METRICS_SCRIPT = """
+var nav = performance.getEntriesByType('navigation')[0];
+var resources = performance.getEntriesByType('resource');
+var bytes = nav ? (nav.transferSize || 0) : 0;
+for (var i = 0; i < resources.length; i++) { bytes += resources[i].transferSize || 0; }
+var end = nav ? (nav.loadEventEnd || nav.domContentLoadedEventEnd) : 0;
+return {bytes: bytes, load_ms: nav && end ? Math.round(end - nav.startTime) : null, resources: resources.length};
+"""
+
+
+class LeanBrowsing:
+    """드라이버별 리소스 차단 프로필 적용 및 페이지 전송량/로딩 시간 집계"""
+
+    def __init__(self, enabled: bool = LEAN_BROWSING):
+        """
+        Args:
+            enabled: False면 리소스를 차단하지 않고 페이지 측정만 수행
+        """
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._driver_profile = {}
+        self._stats = {}
+
+    def configure_options(self, chrome_options):
+        """Chrome 옵션 설정: DOMContentLoaded 시점에 driver.get 반환 (나머지 대기는 조건 대기로 처리)"""
+        if self.enabled:
+            chrome_options.page_load_strategy = 'eager'
+
+    def prepare(self, driver):
+        """새 드라이버에 CDP Network 도메인 활성화"""
+        if self.enabled:
+            driver.execute_cdp_cmd('Network.enable', {})
+
+    def apply(self, driver, profile: str):
+        """
+        드라이버에 차단 프로필 적용 (이미 같은 프로필이면 생략)
+
+        Args:
+            driver: WebDriver
+            profile: 'lean' 또는 'layout'
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._driver_profile.get(id(driver)) == profile:
+                return
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PROFILES[profile]})
+        with self._lock:
+            self._driver_profile[id(driver)] = profile
+
+    def forget(self, driver):
+        """종료된 드라이버의 프로필 기록 삭제"""
+        with self._lock:
+            self._driver_profile.pop(id(driver), None)
+
+    def record_page(self, driver, profile: str):
+        """현재 페이지의 수신 바이트/로딩 시간을 프로필별 통계에 반영 (측정 실패는 무시)"""
+        try:
+            metrics = driver.execute_script(_PAGE_METRICS_SCRIPT)
+        except Exception as e:
+            logging.debug(f"페이지 측정 실패 (무시): {e}")
+            return
+        if not isinstance(metrics, dict):
+            return
+        with self._lock:
+            s = self._stats.setdefault(profile, {'pages': 0, 'bytes': 0, 'load_ms_total': 0, 'load_ms_pages': 0})
+            s['pages'] += 1
+            s['bytes'] += metrics.get('bytes') or 0
+            if metrics.get('load_ms') is not None:
+                s['load_ms_total'] += metrics['load_ms']
+                s['load_ms_pages'] += 1
+
+    def stats(self) -> dict:
+        """프로필별 {'pages', 'bytes', 'avg_bytes', 'avg_load_ms'}"""
+        with self._lock:
+            raw = {profile: dict(s) for profile, s in self._stats.items()}
+        stats = {'enabled': self.enabled}
+        for profile, s in raw.items():
+            stats[profile] = {
+                'pages': s['pages'],
+                'bytes': s['bytes'],
+                'avg_bytes': s['bytes'] // s['pages'] if s['pages'] else None,
+                'avg_load_ms': round(s['load_ms_total'] / s['load_ms_pages']) if s['load_ms_pages'] else None,
+            }
+        return stats
+
+    def log_stats(self):
+        """프로필별 페이지 전송량/로딩 시간 로그 출력"""
+        stats = self.stats()
+        for profile in ('lean', 'layout'):
+            s = stats.get(profile)
+            if s:
+                logging.info(
+                    f"브라우저 페이지 통계 [{profile}{'' if self.enabled else ', 차단 비활성'}]: "
+                    f"{s['pages']}페이지, 평균 {s['avg_bytes']:,}B, 평균 로딩 {s['avg_load_ms']}ms"
+                )
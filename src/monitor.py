@@ -2,15 +2,22 @@
 키워드 모니터링 모듈 - DB 기반
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from tqdm import tqdm
 from urllib.parse import urlparse
 from typing import List, Dict, Optional
 import logging
+import time
+
+from src.config import CHECK_DELETED_BATCH_SIZE
+from src.deletion_policy import DeletionInferencePolicy
+from src.verdict_cache import DeletionVerdictCache
 
 class KeywordMonitor:
     """DB 기반 키워드 모니터링 클래스"""
 
-    def __init__(self, scraper, db_client, sheets_client=None, keyword_list_sheets_client=None):
+    def __init__(self, scraper, db_client, sheets_client=None, keyword_list_sheets_client=None,
+                 verdict_cache=None, deletion_policy=None):
         """
         초기화
 
@@ -19,11 +26,19 @@ class KeywordMonitor:
             db_client: DatabaseClient 인스턴스
             sheets_client: GoogleSheetsClient 인스턴스 (키워드순찰 시트 동기화용, 선택)
             keyword_list_sheets_client: GoogleSheetsClient 인스턴스 (키워드목록 시트 동기화용, 선택)
+            verdict_cache: DeletionVerdictCache 인스턴스 (기본: VERDICT_CACHE_PATH 파일)
+            deletion_policy: DeletionInferencePolicy 인스턴스 (기본: 같은 파일, EXPOSURE_IMPLIES_ALIVE 설정)
         """
         self.scraper = scraper
         self.db_client = db_client
         self.sheets_client = sheets_client
         self.keyword_list_sheets_client = keyword_list_sheets_client
+        # 삭제 확인 결과 캐시 (살아있던 기간에 비례해 재확인 간격 증가, 회차 내 중복 확인 방지)
+        self.verdict_cache = verdict_cache or DeletionVerdictCache(normalize=self.normalize_url)
+        # 노출된 글은 삭제 확인 없이 '존재'로 추론 (N회차마다 강제 재확인)
+        self.deletion_policy = deletion_policy or DeletionInferencePolicy(
+            path=self.verdict_cache.path, normalize=self.normalize_url
+        )
 
     def normalize_url(self, url: str) -> str:
         """URL 정규화 — NaverScraper.normalize_url 위임 (단일 공통 로직)"""
@@ -65,13 +80,16 @@ class KeywordMonitor:
         """
         DB 기반 키워드 모니터링
         같은 키워드는 한 번만 검색하되, 각 URL의 삭제 여부는 개별적으로 확인합니다.
+        이번 검색 결과에 노출된 글은 삭제 확인 없이 존재로 추론합니다 (DELETION_REVERIFY_CYCLES 회차마다 실제 확인).
         매 실행 시 캐시와 쿠키를 초기화하여 깨끗한 상태에서 시작합니다.
 
         Args:
             products: 필터링할 제품 목록 (예: ['cancer', 'diabetes']). None이면 전체.
         """
-        # 캐시/쿠키 초기화: 이전 드라이버가 남아있으면 완전히 리셋
-        self.scraper.reset_driver()
+        # 캐시/쿠키 초기화: 이전 회차 브라우저는 재사용하되 캐시/쿠키는 비움 (BROWSER_KEEP_ALIVE=false면 완전히 리셋)
+        self.scraper.start_cycle()
+        self.verdict_cache.start_cycle()
+        self.deletion_policy.start_cycle()
         print("캐시/쿠키 초기화 완료 - 깨끗한 상태에서 모니터링을 시작합니다.")
 
         keywords_data = self.db_client.get_keywords_for_monitoring(products=products)
@@ -98,144 +116,198 @@ class KeywordMonitor:
 
         batch_updates = []
 
-        # 2. 키워드별 루프
-        for keyword, items in tqdm(keyword_groups.items(), desc="키워드별 모니터링 진행 중"):
-            try:
-                # 해당 키워드의 네이버 검색 결과는 한 번만 가져옴
-                # data-heatmap-target=".link" 인 메인 노출 URL만 사용
-                soup = self.scraper.get_search_results(keyword, page=1)
-                if not soup:
-                    logging.warning(f"키워드 '{keyword}' 검색 결과 가져오기 실패, 건너뜀")
+        # 레이아웃 측정은 드라이버 풀에서 백그라운드로 실행 — 같은 키워드의 삭제 확인과 병렬 진행
+        with ThreadPoolExecutor(max_workers=1) as layout_executor:
+            # 2. 키워드별 루프
+            # 해당 키워드의 네이버 검색 결과는 한 번만 가져옴 (SEARCH_CONCURRENCY > 1 이면 여러 키워드 동시 검색)
+            search_results = self.scraper.iter_search_results(list(keyword_groups.keys()), page=1)
+            for keyword, soup in tqdm(search_results, total=len(keyword_groups), desc="키워드별 모니터링 진행 중"):
+                items = keyword_groups[keyword]
+                try:
+                    # data-heatmap-target=".link" 인 메인 노출 URL만 사용
+                    if not soup:
+                        logging.warning(f"키워드 '{keyword}' 검색 결과 가져오기 실패, 건너뜀")
+                        continue
+                    search_urls = self.scraper.extract_main_urls(soup)
+                    popular_urls = self.scraper.extract_popular_post_urls(soup)
+                    if not search_urls:
+                        logging.warning(f"키워드 '{keyword}' — 검색 결과 URL 0개 추출됨 (봇 차단/HTML 변경 의심). 이 키워드의 노출 판정은 신뢰할 수 없습니다.")
+
+                    # 대표카페 여부 확인 및 DB 저장 (키워드당 1회)
+                    is_main_cafe = self.scraper.check_all_main_cafe(soup)
+                    keyword_id = items[0].get('keyword_id') if items else None
+                    if keyword_id:
+                        self.db_client.upsert_main_cafe_status(keyword_id, is_main_cafe)
+                        logging.info(f"키워드 '{keyword}' 대표카페여부={is_main_cafe}")
+
+                    # 키워드 단위 레이아웃 측정 (글 단위는 아래 items 루프 내에서 개별 처리)
+                    # 노출된 URL 목록 수집 (삭제되지 않은 것만)
+                    exposed_urls = [
+                        item['target_url'] for item in items
+                        if item.get('target_url') and item.get('is_deleted') != 'O'
+                    ]
+
+                    layout_future = layout_executor.submit(self.scraper.get_layout_metrics, keyword, exposed_urls)
+                except Exception as e:
+                    logging.error(f"키워드 '{keyword}' 검색 중 오류 발생, 건너뜀: {e}")
                     continue
-                search_urls = self.scraper.extract_main_urls(soup)
-                popular_urls = self.scraper.extract_popular_post_urls(soup)
-                if not search_urls:
-                    logging.warning(f"키워드 '{keyword}' — 검색 결과 URL 0개 추출됨 (봇 차단/HTML 변경 의심). 이 키워드의 노출 판정은 신뢰할 수 없습니다.")
-
-                # 대표카페 여부 확인 및 DB 저장 (키워드당 1회)
-                is_main_cafe = self.scraper.check_all_main_cafe(soup)
-                keyword_id = items[0].get('keyword_id') if items else None
-                if keyword_id:
-                    self.db_client.upsert_main_cafe_status(keyword_id, is_main_cafe)
-                    logging.info(f"키워드 '{keyword}' 대표카페여부={is_main_cafe}")
-
-                # 키워드 단위 레이아웃 측정 (글 단위는 아래 items 루프 내에서 개별 처리)
-                # 노출된 URL 목록 수집 (삭제되지 않은 것만)
-                exposed_urls = [
-                    item['target_url'] for item in items
-                    if item.get('target_url') and item.get('is_deleted') != 'O'
-                ]
 
+                # 교차노출 감지: 이 키워드의 검색 결과에 다른 키워드의 URL이 있는지 확인
+                # 교차키워드는 "키워드(순위)" 형식으로 저장
+                cross_keywords = []
+                seen_kws = set()
+                for idx, search_url in enumerate(search_urls, start=1):
+                    norm = self.normalize_url(search_url)
+                    mapped_kw = url_to_keyword.get(norm)
+                    if mapped_kw and mapped_kw != keyword and mapped_kw not in seen_kws:
+                        seen_kws.add(mapped_kw)
+                        cross_keywords.append(f"{mapped_kw}({idx})")
+                if cross_keywords:
+                    logging.info(f"교차노출 감지 - 키워드 '{keyword}': {cross_keywords}")
+
+                # naver.me 단축 URL → 실제 URL로 해석 (비교 가능하게)
+                resolved_urls = {}
+                for item in items:
+                    target_url = item['target_url']
+                    if target_url and 'naver.me' in target_url:
+                        resolved = self.scraper.resolve_short_url(target_url)
+                        if resolved != target_url:
+                            logging.info(f"단축URL 해석 (행 {item['row']}): {target_url} → {resolved}")
+                            target_url = resolved
+                    resolved_urls[item['row']] = target_url
+
+                # 삭제되지 않은 글의 이번 검색 결과 순위 (노출 여부로 삭제 확인 대상 결정)
+                ranks = {
+                    item['row']: self.find_url_position(resolved_urls[item['row']], search_urls)
+                    for item in items
+                    if resolved_urls[item['row']] and item.get('is_deleted') != 'O'
+                }
+
+                # 지난 회차에 노출됐는데 이번 검색 결과에서 빠진 글은 삭제됐을 수 있으므로 캐시를 지우고 재확인
+                for item in items:
+                    if item.get('current_status') == 'O' and item['row'] in ranks and ranks[item['row']] is None:
+                        if self.verdict_cache.invalidate(resolved_urls[item['row']]):
+                            logging.info(f"검색 결과에서 빠진 글 삭제 재확인 (행 {item['row']}): {resolved_urls[item['row']]}")
+
+                # 노출된 글은 존재로 추론, 미노출 글과 정기 재확인 대상만 실제로 확인
+                inferred_urls, reverify_urls, unexposed_urls = [], [], []
+                for row_id, rank in ranks.items():
+                    url = resolved_urls[row_id]
+                    if rank is None:
+                        unexposed_urls.append(url)
+                    elif self.deletion_policy.needs_check(url, exposed=True):
+                        reverify_urls.append(url)
+                    else:
+                        inferred_urls.append(url)
+                # 정기 재확인은 캐시된 판정이 아닌 실제 확인 (추론을 끄거나 매 회차 확인이면 캐시 그대로 사용)
+                if self.deletion_policy.forces_reverify:
+                    for url in dict.fromkeys(reverify_urls):
+                        self.verdict_cache.invalidate(url)
+
+                # [개별 확인] 게시글 삭제 여부를 URL마다 확인 (캐시가 유효한 URL 제외, 드라이버 풀 크기만큼 병렬)
+                deletion_results, cached_urls = self.verdict_cache.resolve(
+                    reverify_urls + unexposed_urls, self.scraper.check_posts_deleted_parallel
+                )
+                inferred = set(inferred_urls) - set(deletion_results)
+                deletion_results.update((url, (False, None)) for url in inferred)
+                self.deletion_policy.record(
+                    observed_exposed=[u for u in reverify_urls if deletion_results[u][0] is not None],
+                    observed_unexposed=[u for u in unexposed_urls if deletion_results[u][0] is not None],
+                    inferred=inferred,
+                )
+
+                # 레이아웃 측정 결과 수신 (DB 저장은 메인 스레드에서)
                 layout_result = None
                 try:
-                    layout_result = self.scraper.get_layout_metrics(keyword, exposed_urls)
+                    layout_result = layout_future.result()
                     if layout_result and keyword_id:
                         self.db_client.upsert_layout_info(keyword_id, layout_result)
                     logging.info(f"키워드 '{keyword}' 레이아웃: has_split={layout_result.get('has_split_block')}, first_pct={layout_result.get('first_cafe_y_pct')}")
                 except Exception as e:
                     logging.warning(f"키워드 '{keyword}' 레이아웃 측정 실패, 건너뜀: {e}")
-            except Exception as e:
-                logging.error(f"키워드 '{keyword}' 검색 중 오류 발생, 건너뜀: {e}")
-                continue
-
-            # 교차노출 감지: 이 키워드의 검색 결과에 다른 키워드의 URL이 있는지 확인
-            # 교차키워드는 "키워드(순위)" 형식으로 저장
-            cross_keywords = []
-            seen_kws = set()
-            for idx, search_url in enumerate(search_urls, start=1):
-                norm = self.normalize_url(search_url)
-                mapped_kw = url_to_keyword.get(norm)
-                if mapped_kw and mapped_kw != keyword and mapped_kw not in seen_kws:
-                    seen_kws.add(mapped_kw)
-                    cross_keywords.append(f"{mapped_kw}({idx})")
-            if cross_keywords:
-                logging.info(f"교차노출 감지 - 키워드 '{keyword}': {cross_keywords}")
-
-            # 3. 같은 키워드 내의 각 URL(행)들을 개별 검사
-            for item in items:
-                target_url = item['target_url']
-                row = item['row']
-
-                # naver.me 단축 URL → 실제 URL로 해석 (비교 가능하게)
-                if target_url and 'naver.me' in target_url:
-                    resolved = self.scraper.resolve_short_url(target_url)
-                    if resolved != target_url:
-                        logging.info(f"단축URL 해석 (행 {row}): {target_url} → {resolved}")
-                        target_url = resolved
-
-                if not target_url:
-                    # URL 없는 항목: 인기글 섹션 존재 여부만 기록
-                    batch_updates.append({
-                        'row': row,
-                        'cross_keywords': cross_keywords,
-                        'popular_status': 'O' if popular_urls else 'X',
-                    })
-                    continue
-
-                if item.get('is_deleted') == 'O':
-                    # 이미 삭제된 항목: 인기글은 검색 결과 기준으로 업데이트
-                    popular_status = "O" if popular_urls else "X"
-                    batch_updates.append({
-                        'row': row,
-                        'url': target_url,
-                        'cross_keywords': cross_keywords,
-                        'popular_status': popular_status,
-                    })
-                    continue
-
-                try:
-                    # [개별 확인] 게시글 삭제 여부를 URL마다 각각 확인
-                    is_deleted, err_msg = self.scraper.check_post_deleted(target_url)
 
-                    if is_deleted is None:
-                        if 'cafe.naver.com' not in (target_url or ''):
-                            # 카페가 아닌 URL(블로그 등)은 삭제 확인 불가 → 살아있는 것으로 간주하고 노출만 확인
-                            is_deleted = False
+                # 3. 같은 키워드 내의 각 URL(행)들을 개별 검사
+                for item in items:
+                    target_url = resolved_urls[item['row']]
+                    row = item['row']
+
+                    if not target_url:
+                        # URL 없는 항목: 인기글 섹션 존재 여부만 기록
+                        batch_updates.append({
+                            'row': row,
+                            'cross_keywords': cross_keywords,
+                            'popular_status': 'O' if popular_urls else 'X',
+                        })
+                        continue
+
+                    if item.get('is_deleted') == 'O':
+                        # 이미 삭제된 항목: 인기글은 검색 결과 기준으로 업데이트
+                        popular_status = "O" if popular_urls else "X"
+                        batch_updates.append({
+                            'row': row,
+                            'url': target_url,
+                            'cross_keywords': cross_keywords,
+                            'popular_status': popular_status,
+                        })
+                        continue
+
+                    try:
+                        is_deleted, err_msg = deletion_results.get(target_url, (None, "삭제 확인 결과 없음"))
+
+                        if is_deleted is None:
+                            if 'cafe.naver.com' not in (target_url or ''):
+                                # 카페가 아닌 URL(블로그 등)은 삭제 확인 불가 → 살아있는 것으로 간주하고 노출만 확인
+                                is_deleted = False
+                            else:
+                                # 카페 URL인데 확인 실패 — 이 행은 건너뜀
+                                logging.warning(f"삭제 확인 실패, 건너뜀 (행 {row}): {target_url} / {err_msg}")
+                                continue
+
+                        popular_status = "O" if popular_urls else "X"
+                        if is_deleted:
+                            # 삭제된 경우: 노출 X, 삭제 O
+                            exposure_status = "X"
+                            deletion_status = "O"
+                            rank = None
                         else:
-                            # 카페 URL인데 확인 실패 — 이 행은 건너뜀
-                            logging.warning(f"삭제 확인 실패, 건너뜀 (행 {row}): {target_url} / {err_msg}")
-                            continue
-
-                    popular_status = "O" if popular_urls else "X"
-                    if is_deleted:
-                        # 삭제된 경우: 노출 X, 삭제 O
-                        exposure_status = "X"
-                        deletion_status = "O"
-                        rank = None
-                    else:
-                        # 살아있는 경우: 검색 결과에서 순위(위치) 확인
-                        deletion_status = "X"
-                        rank = self.find_url_position(target_url, search_urls)
-                        is_exposed = rank is not None
-                        exposure_status = "O" if is_exposed else "X"
-
-                    # 레이아웃 글 단위 값 추출
-                    block_position = None
-                    post_y_pct = None
-                    if layout_result and target_url and exposure_status == 'O':
-                        url_m = layout_result.get('url_metrics', {})
-                        norm = self.normalize_url(target_url)
-                        for k, v in url_m.items():
-                            if self.normalize_url(k) == norm:
-                                block_position = v.get('block_position')
-                                post_y_pct = v.get('post_y_pct')
-                                break
-
-                    # 결과 데이터 구성
-                    batch_updates.append({
-                        'row': row,
-                        'url': target_url,
-                        'exposure_status': exposure_status,
-                        'deletion_status': deletion_status,
-                        'cross_keywords': cross_keywords,
-                        'rank': rank,
-                        'popular_status': popular_status,
-                        'block_position': block_position,
-                        'post_y_pct': post_y_pct,
-                    })
-                except Exception as e:
-                    logging.error(f"행 {row} 처리 중 오류 발생, 건너뜀: {e}")
-                    continue
+                            # 살아있는 경우: 검색 결과에서 순위(위치) 확인
+                            deletion_status = "X"
+                            rank = ranks.get(row)
+                            is_exposed = rank is not None
+                            exposure_status = "O" if is_exposed else "X"
+
+                        # 레이아웃 글 단위 값 추출
+                        block_position = None
+                        post_y_pct = None
+                        if layout_result and target_url and exposure_status == 'O':
+                            url_m = layout_result.get('url_metrics', {})
+                            norm = self.normalize_url(target_url)
+                            for k, v in url_m.items():
+                                if self.normalize_url(k) == norm:
+                                    block_position = v.get('block_position')
+                                    post_y_pct = v.get('post_y_pct')
+                                    break
+
+                        # 결과 데이터 구성
+                        update = {
+                            'row': row,
+                            'url': target_url,
+                            'exposure_status': exposure_status,
+                            'deletion_status': deletion_status,
+                            'cross_keywords': cross_keywords,
+                            'rank': rank,
+                            'popular_status': popular_status,
+                            'block_position': block_position,
+                            'post_y_pct': post_y_pct,
+                        }
+                        if target_url in inferred or (target_url in cached_urls and not is_deleted):
+                            # 추론/캐시 판정(존재)은 삭제 여부/확인 시각(checked_at)을 갱신하지 않음 — checked_at 은 실제 확인 시각만
+                            # (캐시의 삭제 판정은 DB 에 아직 반영되지 않은 경우이므로 그대로 기록)
+                            del update['deletion_status']
+                        batch_updates.append(update)
+                    except Exception as e:
+                        logging.error(f"행 {row} 처리 중 오류 발생, 건너뜀: {e}")
+                        continue
 
         # 4. DB 일괄 업데이트
         if batch_updates:
@@ -261,8 +333,11 @@ class KeywordMonitor:
             else:
                 logging.warning("키워드목록 시트 동기화 대상 데이터 없음")
 
-        # 작업 완료 후 드라이버 종료 (다음 실행 시 깨끗하게 시작)
-        self.scraper.close_driver()
+        # 회차 종료: 재시작 기준을 넘은 드라이버만 종료, 나머지는 다음 회차에 재사용
+        self.scraper.end_cycle()
+        self.scraper.log_stats()
+        self.verdict_cache.log_stats()
+        self.deletion_policy.log_stats()
 
         return batch_updates
 
@@ -288,49 +363,88 @@ class KeywordMonitor:
             'search_urls_count': len(search_urls)
         }
 
-    def check_deleted_posts(self):
-        """
-        DB의 모든 게시글 삭제 여부 확인
-        삭제된 글은 DB의 is_deleted=1로 업데이트
+    def _resolve_check_url(self, row: Dict) -> str:
+        """삭제 확인에 쓸 URL (단축 URL은 원본 글 URL로 해석, 해석 실패면 그대로)"""
+        url = row['target_url']
+        if url and 'naver.me' in url:
+            resolved = self.scraper.resolve_short_url(url)
+            if resolved != url:
+                logging.info(f"단축URL 해석 (id {row['row']}): {url} → {resolved}")
+            return resolved
+        return url
+
+    def check_deleted_posts(self, time_budget: Optional[float] = None, max_urls: Optional[int] = None,
+                            batch_size: int = CHECK_DELETED_BATCH_SIZE):
         """
-        keywords = self.db_client.get_keywords_for_monitoring()
-
-        if not keywords:
-            logging.info("확인할 게시글이 없습니다.")
-            return []
+        DB 게시글 삭제 여부 확인 — 마지막 확인 시도 시각이 오래된 글부터
+        batch_size 개를 확인할 때마다 삭제 여부와 확인/시도 시각을 DB에 바로 저장하므로,
+        시간 예산 소진/Ctrl-C/오류로 멈춰도 다음 실행은 확인하지 못한 글부터 이어서 진행
+        (판정 불가였던 글도 시도 시각이 갱신되어 다음 실행에서는 뒤로 밀림)
+        단축 URL(naver.me)은 원본 글 URL로 해석한 뒤 확인
+        삭제 확인 캐시가 유효한 글(최근에 확인한 글)은 재확인하지 않음
+        나머지는 카페 단위로 글 목록/HTTP 응답으로 먼저 판정하고, 판정 불가한 글만 Selenium 확인 (CAFE_SWEEP)
 
-        # URL이 있고 아직 삭제되지 않은 항목만 필터링
-        urls_to_check = [
-            (item['target_url'], item['row'])
-            for item in keywords
-            if item.get('target_url') and item.get('is_deleted') != 'O'
-        ]
+        Args:
+            time_budget: 최대 실행 시간 (초, None이면 제한 없음) — 넘으면 진행 중인 묶음까지만 확인
+            max_urls: 이번 실행에서 확인할 최대 URL 수 (None이면 전체)
+            batch_size: DB 저장 단위 (URL 수)
 
-        if not urls_to_check:
+        Returns:
+            [{'url', 'row', 'is_deleted', 'message'}, ...] — 이번 실행에서 확인을 마친 글
+        """
+        rows = self.db_client.get_rows_for_deletion_check(limit=max_urls)
+        if not rows:
             logging.info("확인할 URL이 없습니다.")
             return []
 
-        logging.info(f"\n총 {len(urls_to_check)}개의 게시글 삭제 여부를 확인합니다...")
+        never_checked = sum(1 for row in rows if not row.get('checked_at'))
+        logging.info(f"\n총 {len(rows)}개의 게시글 삭제 여부를 확인합니다 (확인 기록 없음 {never_checked}개, 오래된 순)...")
 
-        # 일괄 삭제 확인
-        results = self.scraper.batch_check_posts_deleted(urls_to_check)
-
-        # 삭제된 글의 DB id 수집
-        deleted_ids = []
+        deadline = time.monotonic() + time_budget if time_budget else None
+        results = []
         deleted_count = 0
-
-        for result in tqdm(results, desc="삭제 여부 확인 결과 처리"):
-            if result['is_deleted']:
-                deleted_count += 1
-                deleted_ids.append(result['row'])
-                logging.info(f"삭제된 글 발견 (id {result['row']}): {result['url']}")
-
-        # DB 업데이트
-        if deleted_ids:
-            logging.info(f"\n{len(deleted_ids)}개의 삭제된 글을 DB에 업데이트 중...")
-            self.db_client.mark_rows_deleted(deleted_ids)
-            logging.info("업데이트 완료!")
-
-        logging.info(f"\n삭제 확인 결과: 전체 {len(results)}개 중 {deleted_count}개 삭제됨")
+        self.verdict_cache.start_cycle()
+        # 카페별 세션/목록 스캔 결과는 묶음 사이에 유지 (실행마다 새로)
+        self.scraper.cafe_sweep.start_cycle()
+        progress = tqdm(total=len(rows), desc="삭제 여부 확인")
+        try:
+            for start in range(0, len(rows), max(1, batch_size)):
+                if deadline is not None and time.monotonic() >= deadline:
+                    logging.info(f"시간 예산 소진 — {len(results)}/{len(rows)}개 확인 후 종료 (다음 실행에서 이어서 확인)")
+                    break
+                batch = rows[start:start + max(1, batch_size)]
+                check_urls = {row['row']: self._resolve_check_url(row) for row in batch}
+                # 캐시에 없는 URL만 카페별로 확인, 남은 URL은 드라이버 풀 크기만큼 병렬 Selenium 확인
+                verdicts, cached_urls = self.verdict_cache.resolve(
+                    list(check_urls.values()), self.scraper.sweep_posts_deleted
+                )
+                batch_results = []
+                for row in batch:
+                    url = check_urls[row['row']]
+                    is_deleted, message = verdicts.get(url, (None, "유효하지 않은 URL"))
+                    batch_results.append({
+                        'url': row['target_url'], 'row': row['row'], 'is_deleted': is_deleted, 'message': message,
+                        'cached': url in cached_urls,
+                    })
+                    if is_deleted:
+                        deleted_count += 1
+                        logging.info(f"삭제된 글 발견 (id {row['row']}): {url}")
+                # 묶음마다 DB 저장 (삭제 표시 + checked_at + 시도 시각)
+                self.db_client.record_deletion_checks(batch_results)
+                results.extend(batch_results)
+                progress.update(len(batch))
+        except KeyboardInterrupt:
+            logging.warning(f"사용자 중단 — 확인을 마친 {len(results)}개는 DB에 저장됨 (다음 실행에서 이어서 확인)")
+        finally:
+            progress.close()
+            self.scraper.cafe_sweep.close()
+            # 작업 완료 후 드라이버 종료
+            self.scraper.close_driver()
+
+        failed = sum(1 for result in results if result['is_deleted'] is None)
+        logging.info(f"\n삭제 확인 결과: 확인 {len(results)}개 중 {deleted_count}개 삭제됨, 판정 불가 {failed}개 "
+                     f"(남은 대상 {len(rows) - len(results)}개)")
+        self.scraper.log_stats()
+        self.verdict_cache.log_stats()
 
         return results
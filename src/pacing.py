@@ -0,0 +1,224 @@
+"""
+요청 간격(페이싱) 제어 모듈 - AIMD 방식
+- 응답이 정상이면 요청 간격을 조금씩 줄이고(가산 감소), 차단(403/429/빈 결과)이면 크게 늘림(승산 증가)
+- 검색 / 카페 글 / 블로그 호스트별로 별도 예산(간격) 유지
+- PACING_SPEED 하나로 전체 처리량 ↔ 차단 위험 조절 (2.0이면 기본 간격의 절반)
+
+간격은 같은 예산의 요청 시작 시점 사이 최소 간격이며, 동시 요청에서도 슬롯을 하나씩 예약하므로 지켜짐.
+SHARED_BUDGET_ENABLED면 추가로 프로세스 간 공유 토큰 버킷(src/shared_budget.py)에서 토큰을 받은 뒤 요청.
+"""
+
+import logging
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+from src.config import (
+    SHARED_BUDGET_ENABLED, PACING_SPEED, PACING_SEARCH_INTERVAL, PACING_CAFE_INTERVAL, PACING_BLOG_INTERVAL,
+    PACING_MIN_RATIO, PACING_MAX_INTERVAL, PACING_DECREASE_STEP, PACING_BACKOFF_FACTOR,
+)
+
+# 차단으로 간주하는 HTTP 상태 코드
+BLOCK_STATUS_CODES = (403, 429)
+
+
+class AimdBudget:
+    """예산 1개 (요청 간격을 AIMD로 조절, 스레드 안전)"""
+
+    def __init__(self, name: str, interval: float, min_interval: float, max_interval: float,
+                 decrease_step: float, backoff_factor: float, jitter: float = 0.25, shared=None):
+        """
+        Args:
+            name: 예산 이름 (search / cafe / blog)
+            interval: 시작 간격 (초)
+            min_interval: 정상 응답이 이어져도 이 이하로는 줄이지 않음
+            max_interval: 차단이 이어져도 이 이상으로는 늘리지 않음
+            decrease_step: 정상 응답 1건마다 줄이는 간격 (초)
+            backoff_factor: 차단 1건마다 곱하는 배수
+            jitter: 간격에 더하는 랜덤 비율 (±jitter)
+            shared: 프로세스 간 공유 예산 (SharedRequestBudget, None이면 이 프로세스만 페이싱)
+        """
+        self.name = name
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.decrease_step = decrease_step
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.shared = shared
+
+        self._lock = threading.Lock()
+        self._interval = min(max(interval, min_interval), max_interval)
+        self._next_allowed = 0.0
+        self._stats = {
+            'requests': 0,
+            'successes': 0,
+            'blocks': 0,
+            'waited_seconds': 0.0,
+            'shared_waited_seconds': 0.0,
+        }
+
+    @property
+    def interval(self) -> float:
+        with self._lock:
+            return self._interval
+
+    def reserve(self) -> float:
+        """
+        다음 요청 슬롯을 예약하고, 요청 전에 기다려야 할 시간(초)을 반환.
+        (동기 코드는 time.sleep, asyncio 코드는 asyncio.sleep 으로 대기)
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_allowed)
+            spacing = self._interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+            self._next_allowed = start + spacing
+            delay = start - now
+            self._stats['requests'] += 1
+            self._stats['waited_seconds'] += delay
+        return delay
+
+    def try_acquire(self) -> bool:
+        """
+        다음 요청 슬롯이 지금 비어 있고 공유 예산 토큰도 바로 받을 수 있으면 예약하고 True (대기 없음).
+        헤지 요청처럼 생략해도 되는 추가 요청용 — False면 요청하지 않음.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._next_allowed > now:
+                return False
+            previous = self._next_allowed
+            reserved = self._next_allowed = now + self._interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+            self._stats['requests'] += 1
+        if self.shared is None:
+            return True
+        try:
+            if self.shared.try_acquire(self.name):
+                return True
+        except Exception as e:
+            logging.warning(f"[페이싱:{self.name}] 공유 예산 사용 실패, 이 프로세스만 페이싱: {e}")
+            self.shared = None
+            return True
+        # 공유 토큰을 못 받으면 요청하지 않으므로 예약한 슬롯을 되돌림 (그사이 다른 요청이 뒤에 예약했으면 슬롯은 유지)
+        with self._lock:
+            if self._next_allowed == reserved:
+                self._next_allowed = previous
+            self._stats['requests'] -= 1
+        return False
+
+    def wait(self):
+        """다음 요청 슬롯까지 대기 (동기, 공유 예산 토큰까지 받은 뒤 반환)"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        self.acquire_shared()
+
+    def acquire_shared(self):
+        """공유 예산에서 토큰 1개 받기 (다른 프로세스 요청이 많으면 대기, 공유 예산 오류 시 생략)"""
+        if self.shared is None:
+            return
+        try:
+            waited = self.shared.acquire(self.name)
+        except Exception as e:
+            logging.warning(f"[페이싱:{self.name}] 공유 예산 사용 실패, 이 프로세스만 페이싱: {e}")
+            self.shared = None
+            return
+        with self._lock:
+            self._stats['shared_waited_seconds'] += waited
+
+    def on_success(self):
+        """정상 응답 — 간격을 decrease_step 만큼 줄임"""
+        with self._lock:
+            self._stats['successes'] += 1
+            self._interval = max(self.min_interval, self._interval - self.decrease_step)
+
+    def on_block(self):
+        """차단 응답 — 간격을 backoff_factor 배로 늘리고, 이미 예약된 다음 슬롯도 뒤로 미룸"""
+        with self._lock:
+            self._stats['blocks'] += 1
+            old_interval = self._interval
+            self._interval = min(self.max_interval, self._interval * self.backoff_factor)
+            self._next_allowed = max(self._next_allowed, time.monotonic() + self._interval)
+        if self._interval != old_interval:
+            logging.info(f"[페이싱:{self.name}] 차단 감지 — 요청 간격 {old_interval:.2f}초 → {self._interval:.2f}초")
+
+    def record(self, ok: bool):
+        """응답 결과 반영 (ok=False면 차단으로 처리)"""
+        if ok:
+            self.on_success()
+        else:
+            self.on_block()
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['interval'] = round(self._interval, 3)
+        stats['waited_seconds'] = round(stats['waited_seconds'], 2)
+        stats['shared_waited_seconds'] = round(stats['shared_waited_seconds'], 2)
+        return stats
+
+
+class PacingController:
+    """검색/카페/블로그 예산을 묶어 관리하는 페이싱 컨트롤러"""
+
+    def __init__(self, speed: float = PACING_SPEED, shared_budget: bool = SHARED_BUDGET_ENABLED):
+        """
+        Args:
+            speed: 처리량 배수 (1.0=기본, 2.0=간격 절반, 0.5=간격 두 배)
+            shared_budget: True면 프로세스 간 공유 예산도 함께 사용
+        """
+        self.speed = max(0.01, speed)
+        shared = None
+        if shared_budget:
+            from src.shared_budget import get_shared_budget
+            shared = get_shared_budget()
+        self.budgets = {
+            name: AimdBudget(
+                name,
+                interval=interval / self.speed,
+                min_interval=interval * PACING_MIN_RATIO / self.speed,
+                max_interval=PACING_MAX_INTERVAL,
+                decrease_step=PACING_DECREASE_STEP / self.speed,
+                backoff_factor=PACING_BACKOFF_FACTOR,
+                shared=shared,
+            )
+            for name, interval in (
+                ('search', PACING_SEARCH_INTERVAL),
+                ('cafe', PACING_CAFE_INTERVAL),
+                ('blog', PACING_BLOG_INTERVAL),
+            )
+        }
+
+    @staticmethod
+    def budget_name_for_url(url: str) -> str:
+        """URL 호스트로 예산 이름 결정 (카페/블로그 외에는 search)"""
+        host = urlparse(url or '').netloc
+        if host.endswith('cafe.naver.com'):
+            return 'cafe'
+        if host.endswith('blog.naver.com'):
+            return 'blog'
+        return 'search'
+
+    def budget(self, name: str) -> AimdBudget:
+        return self.budgets[name]
+
+    def for_url(self, url: str) -> AimdBudget:
+        return self.budgets[self.budget_name_for_url(url)]
+
+    def wait(self, name: str):
+        """예산 name의 다음 요청 슬롯까지 대기"""
+        self.budgets[name].wait()
+
+    def stats(self) -> dict:
+        """{예산 이름: {'interval', 'requests', 'successes', 'blocks', 'waited_seconds'}}"""
+        return {name: budget.stats() for name, budget in self.budgets.items()}
+
+    def log_stats(self):
+        """예산별 페이싱 통계를 로그로 출력"""
+        for name, s in self.stats().items():
+            if s['requests']:
+                logging.info(
+                    f"페이싱 [{name}]: 요청 {s['requests']}건, 차단 {s['blocks']}건, "
+                    f"현재 간격 {s['interval']}초, 누적 대기 {s['waited_seconds']}초 "
+                    f"(공유 예산 대기 {s['shared_waited_seconds']}초)"
+                )
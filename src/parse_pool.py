@@ -0,0 +1,74 @@
+"""
+검색 결과 파싱 프로세스 풀
+- HTML 파싱 + 단일 패스 추출(ParsedSerp)은 CPU 작업이라 GIL 을 잡고 있어, 동시 검색(SEARCH_CONCURRENCY > 1)을 해도
+  파싱 단계가 코어 1개로 제한됨 → 받은 HTML bytes 를 ProcessPoolExecutor 워커로 보내 파싱
+- 워커는 파싱 트리가 아니라 작은 추출 결과(ParsedSerp.to_dict)만 돌려줌
+  (메인 URL / 인기글 링크 / 대표카페 판정 / 레이아웃 항목 — NaverScraper.extract_* 가 그대로 사용)
+- PARSE_WORKERS=0(기본)이면 풀을 만들지 않고 호출한 스레드에서 바로 파싱
+"""
+
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Union
+
+from src.config import HTML_PARSER_BACKEND, PARSE_WORKERS
+from src.parsed_serp import ParsedSerp
+from src.parser_backend import get_parser
+
+
+def parse_to_dict(html: Union[bytes, str], encoding: str = 'utf-8', backend: str = HTML_PARSER_BACKEND) -> dict:
+    """(워커 프로세스) HTML 을 파싱해 ParsedSerp.to_dict() 반환"""
+    if isinstance(html, bytes):
+        html = html.decode(encoding, errors='replace')
+    return get_parser(backend).parse(html).parsed().to_dict()
+
+
+class ParsePool:
+    """검색 결과 HTML → ParsedSerp 파싱 프로세스 풀 (스레드 안전, 첫 사용 때 워커 시작)"""
+
+    def __init__(self, workers: int = PARSE_WORKERS, backend: str = HTML_PARSER_BACKEND):
+        """
+        Args:
+            workers: 워커 프로세스 수 (0이면 풀 없이 호출 스레드에서 파싱)
+            backend: 워커에서 쓸 HTML 파서 백엔드
+        """
+        self.workers = max(0, workers)
+        self.backend = backend
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                logging.info(f"검색 결과 파싱 프로세스 풀 시작 (워커 {self.workers}개, {self.backend})")
+            return self._executor
+
+    def submit(self, html: Union[bytes, str], encoding: str = 'utf-8'):
+        """파싱 작업 제출 → Future[dict] (ParsedSerp.from_dict 로 복원)"""
+        return self._get_executor().submit(parse_to_dict, html, encoding, self.backend)
+
+    def parse(self, html: Union[bytes, str], encoding: str = 'utf-8') -> ParsedSerp:
+        """
+        HTML 을 워커에서 파싱해 ParsedSerp 반환 (결과를 기다리는 동안 GIL 을 놓으므로 다른 검색 스레드는 계속 진행)
+        워커 프로세스가 비정상 종료되면 풀을 새로 만들고 이 스레드에서 파싱.
+        """
+        try:
+            return ParsedSerp.from_dict(self.submit(html, encoding).result())
+        except BrokenProcessPool as e:
+            logging.warning(f"파싱 워커 프로세스 비정상 종료 ({e}) — 풀을 다시 만들고 이번 페이지는 직접 파싱")
+            self.close()
+            return ParsedSerp.from_dict(parse_to_dict(html, encoding, self.backend))
+
+    def close(self):
+        """워커 프로세스 종료 (다음 사용 때 다시 시작)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,216 @@
+"""
+검색 결과 페이지 단일 패스 추출 (ParsedSerp)
+결과 링크 / ugcItem / 섹션 제목을 선택자 하나로 문서 순서대로 한 번에 모은 뒤,
+각 요소의 상위 요소를 한 번씩만 거슬러 올라가며 섹션(인기글 / 관련 경험 카페글 / 상하단 블록) 소속을 판별.
+NaverScraper 의 extract_main_urls / extract_popular_post_urls / check_all_main_cafe /
+analyze_keyword_layout 은 모두 이 결과를 읽기만 하므로, 키워드당 트리 탐색은 1회이고 트리 복사도 없음.
+"""
+
+import re
+from typing import List, Optional
+
+_PUBLISHED_DATE_RE = re.compile(r'(\d{4}\.\d{2}\.\d{2})\.?')
+_PUBLISHED_RELATIVE_RE = re.compile(r'(\d+[일시간분]+\s*전|어제|오늘)')
+
+# 메인 노출 링크 data-heatmap-target 값 → 지문 표식
+_TARGET_MARKERS = {'.link': 'link', '.imgtitlelink': 'imgtitlelink'}
+
+
+def parse_published_at(text: str) -> str:
+    """프로필 보조 텍스트에서 발행일 추출 (YYYY.MM.DD 또는 상대시간)"""
+    # YYYY.MM.DD. 형식
+    m = _PUBLISHED_DATE_RE.search(text)
+    if m:
+        return m.group(1)
+    # 상대시간 (N일 전, N시간 전, 어제 등)
+    m = _PUBLISHED_RELATIVE_RE.search(text)
+    if m:
+        return m.group(1)
+    return text[:15]
+
+
+class ParsedSerp:
+    """
+    검색 결과 페이지 1개의 추출 결과
+
+    Attributes:
+        blocked: 검색 결과 요소(data-heatmap-target 링크, sds-comps)가 전혀 없음 — 봇 차단 페이지로 판정
+        has_split_block: 상하단 분리 블록(_fsolid_head) 존재 여부
+        main_links: 메인 노출 링크 href (data-heatmap-target=".link"/".imgtitlelink", 관련 경험 카페글 섹션 제외)
+        fallback_links: main_links 가 비었을 때 쓰는 href (.series 를 뺀 모든 data-heatmap-target 링크 중 naver.com)
+        header_titles: 섹션 제목(sds-comps-header-title)별 h2 텍스트 (h2 없으면 None)
+        popular_links: 인기글 섹션의 .link 링크 [(href, items 인덱스 또는 None), ...]
+        items: ugcItem 목록 [{'cafe_href', 'cafe_name', 'published_at', 'block',
+                             'power_content', 'main_badge', 'in_first_popular'}, ...]
+        fingerprint: 페이지 템플릿 지문 — 발견한 표식 이름을 정렬해 '+'로 연결 (src.serp_template 참고)
+            heatmap: data-heatmap-target 링크 / link, imgtitlelink: main_links 에 들어간 해당 target 값의 링크
+            series: 서브 노출 링크 / ugc: ugcItem / header: 섹션 제목
+            health: 관련 경험 카페글 블록 안 링크 / split: 상하단 분리 블록
+    """
+
+    __slots__ = ('blocked', 'has_split_block', 'main_links', 'fallback_links',
+                 'header_titles', 'popular_links', 'items', 'fingerprint')
+
+    def __init__(self, blocked: bool = True, has_split_block: bool = False,
+                 main_links: Optional[List[str]] = None, fallback_links: Optional[List[str]] = None,
+                 header_titles: Optional[list] = None, popular_links: Optional[list] = None,
+                 items: Optional[List[dict]] = None, fingerprint: str = ''):
+        self.blocked = blocked
+        self.has_split_block = has_split_block
+        self.main_links = main_links or []
+        self.fallback_links = fallback_links or []
+        self.header_titles = header_titles or []
+        self.popular_links = popular_links or []
+        self.items = items or []
+        self.fingerprint = fingerprint
+
+    def parsed(self) -> 'ParsedSerp':
+        """SerpDocument.parsed() 와 같은 인터페이스 (파싱 워커에서 받은 결과를 extract_* 에 그대로 전달)"""
+        return self
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ParsedSerp':
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+
+
+def parse_serp(doc) -> ParsedSerp:
+    """
+    SerpDocument 를 한 번 훑어 ParsedSerp 생성 (SerpDocument.parsed() 에서 호출, 결과는 문서에 보관)
+
+    Args:
+        doc: src.parser_backend.SerpDocument
+    """
+    result = ParsedSerp()
+    nodes = doc.select('serp_nodes')
+    result.has_split_block = doc.select_one('fsolid_head') is not None
+
+    # 1) 섹션 제목 — h2 에 '인기글'이 있으면 조부모 요소(제목 + 글목록)가 인기글 섹션
+    popular_sections = []
+    for node in nodes:
+        if doc.tag(node) == 'a' or doc.attr(node, 'data-template-id') == 'ugcItem':
+            continue
+        h2 = doc.select_one('h2', node)
+        result.header_titles.append(doc.text(h2, strip=True) if h2 is not None else None)
+        if h2 is None or '인기글' not in doc.text(h2):
+            continue
+        parent = doc.parent(node)
+        section = doc.parent(parent) if parent is not None else None
+        if section is not None:
+            popular_sections.append(section)
+    popular_keys = {doc.key(section) for section in popular_sections}
+    first_popular_key = doc.key(popular_sections[0]) if popular_sections else None
+
+    # 2) 링크 / ugcItem — 상위 요소 소속은 _Ancestry 가 요소별로 한 번만 계산
+    ancestry = _Ancestry(doc, popular_keys, first_popular_key)
+    item_index = {}
+    markers = set()
+    for node in nodes:
+        tag = doc.tag(node)
+        if tag == 'a':
+            target = doc.attr(node, 'data-heatmap-target', '')
+            href = doc.attr(node, 'href', '')
+            in_health_block, in_popular, _, ugc_key, _ = ancestry.of(doc.parent(node))
+            markers.add('heatmap')
+            if in_health_block:
+                markers.add('health')
+            elif target == '.series':
+                markers.add('series')
+
+            is_http = bool(href) and ('http://' in href or 'https://' in href)
+            if not in_health_block and is_http:
+                if target in ('.link', '.imgtitlelink'):
+                    result.main_links.append(href)
+                    markers.add(_TARGET_MARKERS[target])
+                if '.series' not in target and 'naver.com' in href:
+                    result.fallback_links.append(href)
+            if in_popular and target == '.link' and href:
+                result.popular_links.append((href, item_index.get(ugc_key)))
+        elif doc.attr(node, 'data-template-id') == 'ugcItem':
+            _, _, in_first_popular, key, block = ancestry.of(node)
+            item_index[key] = len(result.items)
+            result.items.append(_parse_item(doc, node, block, in_first_popular))
+            markers.add('ugc')
+
+    if result.header_titles:
+        markers.add('header')
+    if result.has_split_block:
+        markers.add('split')
+    result.fingerprint = '+'.join(sorted(markers))
+    result.blocked = 'heatmap' not in markers and doc.select_one('sds_comps') is None
+    return result
+
+
+class _Ancestry:
+    """
+    요소별 상위 요소 소속 (요소 자신 포함) 메모 — 링크마다 루트까지 올라가지 않고
+    이미 계산한 상위 요소를 만나면 거기서 멈춤. 문서 1개 파싱 동안만 사용.
+
+    소속 값: (관련 경험 카페글 블록 안, 인기글 섹션 안, 첫 인기글 섹션 안,
+              가장 가까운 ugcItem 의 key, 가장 가까운 분리 블록 'head'/'body'/'single')
+    """
+
+    _ROOT = (False, False, False, None, 'single')
+
+    def __init__(self, doc, popular_keys: set, first_popular_key):
+        self.doc = doc
+        self.popular_keys = popular_keys
+        self.first_popular_key = first_popular_key
+        self._memo = {}
+
+    def of(self, node) -> tuple:
+        doc = self.doc
+        # 메모된 상위 요소(또는 루트)까지 올라간 뒤 내려오며 채움
+        path = []
+        state = self._ROOT
+        while node is not None:
+            key = doc.key(node)
+            memo = self._memo.get(key)
+            if memo is not None:
+                state = memo[0]
+                break
+            path.append((key, node))
+            node = doc.parent(node)
+
+        for key, node in reversed(path):
+            in_health, in_popular, in_first_popular, ugc_key, block = state
+            if key in self.popular_keys:
+                in_popular = True
+                in_first_popular = in_first_popular or key == self.first_popular_key
+            classes = doc.attr(node, 'class', '')
+            if doc.tag(node) == 'div':
+                if 'fds-health-cafe-block-wrap' in classes:
+                    in_health = True
+                if doc.attr(node, 'data-template-id') == 'ugcItem':
+                    ugc_key = key
+            if '_fsolid_' in classes:
+                tokens = classes.split()
+                if '_fsolid_head' in tokens:
+                    block = 'head'
+                elif '_fsolid_body' in tokens:
+                    block = 'body'
+            state = (in_health, in_popular, in_first_popular, ugc_key, block)
+            # key 가 id() 인 백엔드는 요소가 살아 있어야 key 가 유지되므로 요소도 함께 보관
+            self._memo[key] = (state, node)
+        return state
+
+
+def _parse_item(doc, item, block: str, in_first_popular: bool) -> dict:
+    """ugcItem 1개의 카페 링크/카페명/발행일/배지 정보 (block, in_first_popular 는 _Ancestry 결과)"""
+    cafe_link = doc.select_one('cafe_link_targets', item)
+    if cafe_link is None:
+        cafe_link = doc.select_one('cafe_links', item)
+    title = doc.select_one('profile_title', item)
+    subtext = doc.select_one('profile_subtext', item)
+
+    return {
+        'cafe_href': doc.attr(cafe_link, 'href', '') if cafe_link is not None else None,
+        'cafe_name': doc.text(title, strip=True) if title is not None else None,
+        'published_at': parse_published_at(doc.text(subtext, strip=True)) if subtext is not None else '',
+        'block': block,
+        'power_content': bool(doc.attr(item, 'data-power-content-url')),
+        'main_badge': doc.select_one('main_cafe_badge', item) is not None,
+        'in_first_popular': in_first_popular,
+    }
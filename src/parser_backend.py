@@ -0,0 +1,291 @@
+"""
+검색 결과(SERP) HTML 파서 백엔드
+- html.parser(BeautifulSoup, 기본) / lxml / selectolax(lexbor) 중 HTML_PARSER_BACKEND 로 선택
+- 추출에 쓰는 선택자는 모듈 로딩 시 백엔드별로 한 번만 컴파일
+  (BeautifulSoup의 class_=lambda 매칭처럼 요소마다 파이썬 함수를 호출하지 않음)
+- 추출 함수(NaverScraper.extract_*)는 SerpDocument 의 공통 메서드만 사용하므로 백엔드와 무관하게 같은 결과
+  (python -m benchmarks.parser_parity 로 저장된 검색 페이지에서 백엔드 간 결과 비교)
+
+lxml / selectolax 는 선택 의존성 — 설치되어 있지 않으면 경고 후 html.parser 사용.
+"""
+
+import logging
+from typing import Optional
+
+from src.config import HTML_PARSER_BACKEND
+from src.parsed_serp import parse_serp
+
+# 이름 → (CSS 선택자, XPath) — 모두 기준 요소의 하위 요소만 대상 (문서 순서)
+SELECTORS = {
+    # 정상 검색결과 페이지 판정 (결과 링크가 없을 때)
+    'sds_comps': ('[class*="sds-comps"]', 'descendant::*[contains(@class, "sds-comps")]'),
+    # 섹션 제목의 h2 (인기글 섹션 판별)
+    'h2': ('h2', 'descendant::h2'),
+    # 카페글/블로그글 항목 안 요소
+    'cafe_links': ('a[href*="cafe.naver.com"]', 'descendant::a[contains(@href, "cafe.naver.com")]'),
+    'cafe_link_targets': (
+        'a[data-heatmap-target=".link"][href*="cafe.naver.com"]',
+        'descendant::a[@data-heatmap-target=".link" and contains(@href, "cafe.naver.com")]',
+    ),
+    'main_cafe_badge': ('svg[viewbox="0 0 20 15"]', 'descendant::svg[@viewbox="0 0 20 15"]'),
+    'profile_title': (
+        'span[class*="sds-comps-profile-info-title-text"]',
+        'descendant::span[contains(@class, "sds-comps-profile-info-title-text")]',
+    ),
+    'profile_subtext': (
+        'span[class*="profile-info-subtext"]',
+        'descendant::span[contains(@class, "profile-info-subtext")]',
+    ),
+    # 상하단 분리 블록
+    'fsolid_head': ('[class*="_fsolid_head"]', 'descendant::*[contains(@class, "_fsolid_head")]'),
+    # 단일 패스 추출(ParsedSerp)용: 결과 링크 + ugcItem + 섹션 제목 (문서 순서)
+    'serp_nodes': (
+        'a[data-heatmap-target], div[data-template-id="ugcItem"], div[class*="sds-comps-header-title"]',
+        'descendant::a[@data-heatmap-target] | descendant::div[@data-template-id="ugcItem"]'
+        ' | descendant::div[contains(@class, "sds-comps-header-title")]',
+    ),
+}
+
+
+class _SoupBackend:
+    """BeautifulSoup(html.parser) — soupsieve 로 선택자 사전 컴파일"""
+
+    name = 'html.parser'
+
+    def __init__(self):
+        import soupsieve
+        self._compiled = {key: soupsieve.compile(css) for key, (css, _) in SELECTORS.items()}
+
+    def parse(self, html):
+        from bs4 import BeautifulSoup
+        return BeautifulSoup(html, 'html.parser')
+
+    def select(self, node, key: str, limit: int = 0) -> list:
+        return self._compiled[key].select(node, limit=limit)
+
+    @staticmethod
+    def attr(node, name: str) -> Optional[str]:
+        value = node.get(name)
+        if isinstance(value, list):
+            return ' '.join(value)
+        return value
+
+    @staticmethod
+    def text(node, strip: bool = False) -> str:
+        return node.get_text(strip=strip)
+
+    @staticmethod
+    def parent(node):
+        parent = node.parent
+        # BeautifulSoup 객체(문서 자체)는 요소가 아님
+        return parent if parent is not None and parent.name != '[document]' else None
+
+    @staticmethod
+    def tag(node) -> str:
+        return node.name
+
+    @staticmethod
+    def key(node):
+        return id(node)
+
+    @staticmethod
+    def to_soup(root):
+        return root
+
+
+class _LxmlBackend:
+    """lxml.html — 선택자는 etree.XPath 로 사전 컴파일 (cssselect 불필요)"""
+
+    name = 'lxml'
+
+    def __init__(self):
+        from lxml import etree
+        import lxml.html
+        self._html = lxml.html
+        self._etree = etree
+        self._compiled = {key: etree.XPath(xpath) for key, (_, xpath) in SELECTORS.items()}
+        # BeautifulSoup get_text 와 같게: 주석/스크립트/스타일을 뺀 텍스트 노드만
+        self._strings = etree.XPath('descendant::text()[not(parent::script or parent::style)]')
+
+    def parse(self, html):
+        # 인코딩 선언이 있는 str 은 lxml이 거부하므로 UTF-8 bytes 로 전달
+        html = html.encode('utf-8')
+        parser = self._html.HTMLParser(encoding='utf-8')
+        root = self._html.document_fromstring(html, parser=parser)
+        # 문서 노드 기준으로 검색해야 최상위 <html> 요소도 하위 요소로 취급됨
+        return root.getroottree()
+
+    def select(self, node, key: str, limit: int = 0) -> list:
+        found = self._compiled[key](node)
+        return found[:limit] if limit else found
+
+    @staticmethod
+    def attr(node, name: str) -> Optional[str]:
+        return node.get(name)
+
+    def text(self, node, strip: bool = False) -> str:
+        strings = self._strings(node)
+        if strip:
+            return ''.join(s.strip() for s in strings)
+        return ''.join(strings)
+
+    def parent(self, node):
+        if isinstance(node, self._etree._ElementTree):
+            return None
+        return node.getparent()
+
+    @staticmethod
+    def tag(node) -> str:
+        return node.tag
+
+    @staticmethod
+    def key(node):
+        # lxml은 참조가 살아있는 요소에 대해 항상 같은 파이썬 객체를 돌려줌
+        return id(node)
+
+    def to_soup(self, root):
+        from bs4 import BeautifulSoup
+        return BeautifulSoup(self._etree.tostring(root, encoding='unicode', method='html'), 'html.parser')
+
+
+class _SelectolaxBackend:
+    """selectolax(lexbor) — CSS 선택자를 C 엔진에서 실행"""
+
+    name = 'selectolax'
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+        self._parser = LexborHTMLParser
+        self._css = {key: css for key, (css, _) in SELECTORS.items()}
+
+    def parse(self, html):
+        return self._parser(html)
+
+    def select(self, node, key: str, limit: int = 0) -> list:
+        found = node.css(self._css[key])
+        if node is not None and hasattr(node, 'mem_id'):
+            # lexbor는 기준 요소 자신도 결과에 포함하므로 제외
+            found = [n for n in found if n.mem_id != node.mem_id]
+        return found[:limit] if limit else found
+
+    @staticmethod
+    def attr(node, name: str) -> Optional[str]:
+        return node.attributes.get(name)
+
+    @staticmethod
+    def text(node, strip: bool = False) -> str:
+        return node.text(deep=True, separator='', strip=strip)
+
+    @staticmethod
+    def parent(node):
+        if not hasattr(node, 'mem_id'):
+            return None
+        parent = node.parent
+        return parent if parent is not None and parent.tag != '-document' else None
+
+    @staticmethod
+    def tag(node) -> str:
+        return node.tag
+
+    @staticmethod
+    def key(node):
+        # 조회할 때마다 새 래퍼 객체가 생기므로 노드 주소로 구분
+        return node.mem_id
+
+    @staticmethod
+    def to_soup(root):
+        from bs4 import BeautifulSoup
+        return BeautifulSoup(root.html, 'html.parser')
+
+
+_BACKENDS = {
+    'html.parser': _SoupBackend,
+    'lxml': _LxmlBackend,
+    'selectolax': _SelectolaxBackend,
+}
+
+
+class SerpDocument:
+    """파싱된 검색 결과 페이지 (백엔드 공통 조회 메서드)"""
+
+    __slots__ = ('backend', 'root', '_parsed')
+
+    def __init__(self, backend, root):
+        self.backend = backend
+        self.root = root
+        self._parsed = None
+
+    def select(self, key: str, node=None) -> list:
+        """SELECTORS[key] 에 맞는 하위 요소 목록 (node 생략 시 문서 전체, 문서 순서)"""
+        return self.backend.select(self.root if node is None else node, key)
+
+    def select_one(self, key: str, node=None):
+        """SELECTORS[key] 에 맞는 첫 하위 요소 (없으면 None)"""
+        found = self.backend.select(self.root if node is None else node, key, limit=1)
+        return found[0] if found else None
+
+    def attr(self, node, name: str, default=None):
+        value = self.backend.attr(node, name)
+        return default if value is None else value
+
+    def text(self, node, strip: bool = False) -> str:
+        return self.backend.text(node, strip)
+
+    def parent(self, node):
+        """부모 요소 (최상위 요소면 None)"""
+        return self.backend.parent(node)
+
+    def tag(self, node) -> str:
+        return self.backend.tag(node)
+
+    def key(self, node):
+        """같은 요소면 같은 값 (요소를 참조하는 동안만 유효, 백엔드마다 요소 객체 동일성 기준이 다름)"""
+        return self.backend.key(node)
+
+    def parsed(self):
+        """단일 패스 추출 결과 ParsedSerp (처음 호출 때 한 번 만들어 문서에 보관)"""
+        if self._parsed is None:
+            self._parsed = parse_serp(self)
+        return self._parsed
+
+    def to_soup(self):
+        """BeautifulSoup 트리 (BeautifulSoup 전용 코드용, html.parser 백엔드가 아니면 다시 파싱)"""
+        return self.backend.to_soup(self.root)
+
+
+class ParserBackend:
+    """설정된 백엔드로 HTML을 SerpDocument 로 파싱"""
+
+    def __init__(self, name: str = HTML_PARSER_BACKEND):
+        """
+        Args:
+            name: 'html.parser' | 'lxml' | 'selectolax' (설치되어 있지 않으면 html.parser)
+        """
+        backend_cls = _BACKENDS.get(name)
+        if backend_cls is None:
+            logging.warning(f"알 수 없는 HTML 파서 백엔드 '{name}' — html.parser 사용")
+            backend_cls = _SoupBackend
+        try:
+            self.backend = backend_cls()
+        except ImportError as e:
+            logging.warning(f"HTML 파서 백엔드 '{name}' 사용 불가 ({e}) — html.parser 사용")
+            self.backend = _SoupBackend()
+
+    @property
+    def name(self) -> str:
+        return self.backend.name
+
+    def parse(self, html: str) -> SerpDocument:
+        """HTML 문자열 파싱"""
+        return SerpDocument(self.backend, self.backend.parse(html))
+
+
+_parsers = {}
+
+
+def get_parser(name: str = HTML_PARSER_BACKEND) -> ParserBackend:
+    """백엔드 이름별 공용 ParserBackend (선택자 컴파일은 한 번만)"""
+    parser = _parsers.get(name)
+    if parser is None:
+        parser = _parsers[name] = ParserBackend(name)
+    return parser
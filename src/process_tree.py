@@ -0,0 +1,165 @@
+"""
+프로세스 트리 유틸리티 (chromedriver → Chrome 하위 프로세스)
+psutil이 설치되어 있으면 사용하고, 없으면 Linux /proc 정보로 대체.
+둘 다 불가능한 환경(psutil 없는 Windows 등)에서는 None/빈 값 반환.
+"""
+
+import os
+import signal
+import subprocess
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import psutil
+except ImportError:  # 선택 의존성 — 없으면 /proc 기반으로 동작
+    psutil = None
+
+
+def _proc_parent_map() -> Dict[int, int]:
+    """/proc 에서 {pid: ppid} 매핑 생성 (Linux 전용)"""
+    parents = {}
+    for name in os.listdir('/proc'):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f'/proc/{name}/stat', 'rb') as f:
+                stat = f.read().decode('utf-8', errors='replace')
+            # comm 필드에 공백/괄호가 있을 수 있으므로 마지막 ')' 이후를 파싱
+            fields = stat[stat.rindex(')') + 2:].split()
+            parents[int(name)] = int(fields[1])
+        except (OSError, ValueError, IndexError):
+            continue
+    return parents
+
+
+def list_descendants(pid: int) -> Optional[List[int]]:
+    """pid의 모든 하위 프로세스 pid 목록 (조회 불가 환경이면 None)"""
+    if psutil is not None:
+        try:
+            return [p.pid for p in psutil.Process(pid).children(recursive=True)]
+        except psutil.Error:
+            return []
+    if not os.path.isdir('/proc'):
+        return None
+    parents = _proc_parent_map()
+    children = {}
+    for child, parent in parents.items():
+        children.setdefault(parent, []).append(child)
+    result, stack = [], [pid]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            result.append(child)
+            stack.append(child)
+    return result
+
+
+def _rss_bytes(pid: int) -> int:
+    """단일 프로세스 RSS (bytes, 조회 실패 시 0)"""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except psutil.Error:
+            return 0
+    try:
+        with open(f'/proc/{pid}/status', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0
+
+
+def tree_rss_mb(pid: int) -> Optional[float]:
+    """pid와 모든 하위 프로세스의 RSS 합계 (MB, 조회 불가 환경이면 None)"""
+    descendants = list_descendants(pid)
+    if descendants is None:
+        return None
+    total = sum(_rss_bytes(p) for p in [pid] + descendants)
+    return round(total / (1024 * 1024), 1)
+
+
+def pid_alive(pid: int) -> Optional[bool]:
+    """프로세스 생존 여부 (확인 불가 환경이면 None)"""
+    if psutil is not None:
+        return psutil.pid_exists(pid)
+    if os.name != 'posix':
+        # Windows의 os.kill 은 신호 0이어도 프로세스를 종료하므로 사용하지 않음
+        return None
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _proc_cmdline(pid: int) -> Optional[str]:
+    """/proc/<pid>/cmdline 을 공백으로 이은 문자열 (Linux 전용, 읽을 수 없으면 None)"""
+    try:
+        with open(f'/proc/{pid}/cmdline', 'rb') as f:
+            return f.read().replace(b'\0', b' ').decode('utf-8', errors='replace').strip()
+    except OSError:
+        return None
+
+
+def process_cmdline(pid: int) -> Optional[str]:
+    """pid의 명령줄 (조회 불가/종료된 프로세스면 None)"""
+    if psutil is not None:
+        try:
+            return ' '.join(psutil.Process(pid).cmdline())
+        except psutil.Error:
+            return None
+    if not os.path.isdir('/proc'):
+        return None
+    return _proc_cmdline(pid)
+
+
+def find_processes(cmdline_marker: str) -> List[Tuple[int, int, str]]:
+    """명령줄에 cmdline_marker 가 포함된 프로세스 [(pid, ppid, 명령줄), ...] (조회 불가 환경이면 빈 목록)"""
+    found = []
+    if psutil is not None:
+        for proc in psutil.process_iter(['pid', 'ppid', 'cmdline']):
+            cmdline = ' '.join(proc.info['cmdline'] or [])
+            if cmdline_marker in cmdline:
+                found.append((proc.info['pid'], proc.info['ppid'], cmdline))
+        return found
+    if not os.path.isdir('/proc'):
+        return found
+    for pid, ppid in _proc_parent_map().items():
+        cmdline = _proc_cmdline(pid)
+        if cmdline and cmdline_marker in cmdline:
+            found.append((pid, ppid, cmdline))
+    return found
+
+
+def kill_tree(pid: int) -> int:
+    """pid와 모든 하위 프로세스 강제 종료. 반환값: 종료 신호를 보낸 프로세스 수"""
+    if psutil is not None:
+        try:
+            parent = psutil.Process(pid)
+            procs = parent.children(recursive=True) + [parent]
+        except psutil.Error:
+            return 0
+        killed = 0
+        for proc in procs:
+            try:
+                proc.kill()
+                killed += 1
+            except psutil.Error:
+                pass
+        psutil.wait_procs(procs, timeout=5)
+        return killed
+    if os.name != 'posix':
+        # psutil 없는 Windows: taskkill 로 트리 전체 종료
+        result = subprocess.run(['taskkill', '/F', '/T', '/PID', str(pid)], capture_output=True)
+        return 1 if result.returncode == 0 else 0
+    killed = 0
+    for target in (list_descendants(pid) or []) + [pid]:
+        try:
+            os.kill(target, signal.SIGKILL)
+            killed += 1
+        except OSError:
+            pass
+    return killed
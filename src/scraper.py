@@ -1,4 +1,3 @@
-import copy
 import glob
 import os
 import requests
@@ -10,14 +9,66 @@ from typing import Optional
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import UnexpectedAlertPresentException, NoAlertPresentException
+from selenium.common.exceptions import (
+    UnexpectedAlertPresentException, NoAlertPresentException, SessionNotCreatedException,
+)
 from webdriver_manager.chrome import ChromeDriverManager
 import logging
 
+from src.browser_extract import BrowserExtractor
+from src.browser_lifecycle import BrowserLifecycle
+from src.cafe_sweep import CafeDeletionSweep
+from src.circuit_breaker import CircuitBreaker, DEFERRED
+from src.deletion_probe import DeletionProbe
+from src.config import (
+    SEARCH_STREAMING, SEARCH_STREAM_DRAIN_KIB, SEARCH_HEDGING, BROWSER_KEEP_ALIVE, CIRCUIT_OPEN_ACTION,
+    WAIT_ALERT_TIMEOUT, WAIT_RENDER_TIMEOUT, WAIT_SEARCH_TIMEOUT,
+    HTTP_TIMEOUT, HTTP_TOTAL_TIMEOUT, WATCHDOG_PAGE_LOAD_TIMEOUT, WATCHDOG_SCRIPT_TIMEOUT,
+)
+from src.driver_pool import DriverPool
+from src.lean_browsing import LeanBrowsing
+from src.pacing import PacingController, BLOCK_STATUS_CODES
+from src.parse_pool import ParsePool
+from src.parser_backend import get_parser
+from src.serp_template import TemplateRegistry
+from src.transport import SearchTransport
+from src.url_harvest import harvest_urls
+from src.waits import PageWaiter
+from src.watchdog import Watchdog
+
+# 정상 검색결과 페이지에만 있는 바이트 마커 (둘 다 없으면 파싱 없이 봇 차단으로 판정)
+SERP_RESULT_MARKERS = (b'data-heatmap-target', b'sds-comps')
+# 메인 영역(main_pack)이 끝난 뒤 시작되는 우측 영역 마커 — 이후 본문은 추출에 필요 없음
+SERP_STOP_MARKERS = (b'id="sub_pack"', b"id='sub_pack'")
+# Selenium 대기용: 검색 결과가 렌더링되었음을 나타내는 요소
+SERP_RESULT_SELECTORS = ('a[data-heatmap-target]', '[class*="sds-comps"]')
+# 레이아웃 측정 대기용: 카페글 블록(상하단 구분 또는 ugcItem)
+LAYOUT_READY_SELECTORS = ('[class*="_fsolid_head"]', 'div[data-template-id="ugcItem"]')
+# 삭제 확인 대기용: 카페 글 본문 iframe 과 본문 요소 (보이면 alert 없이 존재로 판정)
+CAFE_ARTICLE_FRAME = 'cafe_main'
+CAFE_ARTICLE_SELECTORS = ('.article_viewer', '.se-main-container', '.ArticleContentBox')
+
 class NaverScraper:
     def __init__(self):
-        # Selenium WebDriver (삭제 확인용, 필요시 초기화)
-        self._driver = None
+        # 브라우저 수명 관리 (회차 간 재사용, 페이지 로딩 수/메모리 기준 재시작)
+        self.lifecycle = BrowserLifecycle()
+        # Selenium 조건 대기 (고정 sleep 대신 alert/결과 요소/DOM 변경 멈춤 감지)
+        self.waiter = PageWaiter()
+        # 경량 브라우징 (불필요한 리소스 차단, 페이지별 전송량/로딩 시간 집계)
+        self.lean = LeanBrowsing()
+        # 멈춘 드라이버 강제 종료 + 이전 실행이 남긴 Chrome 정리
+        self.watchdog = Watchdog(driver_pid=self.lifecycle.driver_pid)
+        self.watchdog.reap_orphans()
+        # 드라이버별 Chrome 프로필 폴더 (종료 후 삭제)
+        self._profile_dirs = {}
+        # Selenium WebDriver 풀 (삭제 확인/레이아웃 측정/검색 폴백용, 필요시 생성)
+        self.driver_pool = DriverPool(
+            create_driver=self._create_driver,
+            is_alive=self._is_driver_alive,
+            reset_driver=self._reset_pooled_driver,
+            should_retire=self.lifecycle.should_recycle,
+            on_close=self._on_driver_closed,
+        )
 
         # 다양한 User-Agent 목록 정의 (최신 버전)
         self.user_agents = [
@@ -29,8 +80,75 @@ class NaverScraper:
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:123.0) Gecko/20100101 Firefox/123.0',
         ]
         self._session = requests.Session()
+        # 검색 요청 전송 계층 (커넥션 풀 재사용 + 요청마다 빈 쿠키)
+        self.transport = SearchTransport()
+        # 검색 결과 HTML 파서 (HTML_PARSER_BACKEND: html.parser | lxml | selectolax)
+        self.parser = get_parser()
+        # 검색 결과 파싱 프로세스 풀 (PARSE_WORKERS > 0 일 때만, 워커는 ParsedSerp 만 반환)
+        self.parse_pool = ParsePool()
+        # Selenium 검색 결과를 페이지 안 스크립트로 추출 (BROWSER_EXTRACT, 일부는 HTML 추출과 교차 확인)
+        self.browser_extractor = BrowserExtractor()
+        # 검색 결과 템플릿 지문 → 메인 URL 추출기 버전 선택
+        self.templates = TemplateRegistry()
+        # 게시글 삭제 여부 HTTP 판정 (판정 불가한 URL만 Selenium 확인)
+        self.deletion_probe = DeletionProbe()
+        # 봇 차단이 잦을 때 requests 시도를 생략하는 서킷 브레이커
+        self.search_breaker = CircuitBreaker('search')
+        # 검색/카페/블로그 요청 간격 (정상 응답이면 빨라지고 차단되면 느려짐)
+        self.pacing = PacingController()
+        # --check-deleted 카페별 일괄 확인 (카페 글 목록 → 글별 HTTP 확인, 남은 글만 Selenium)
+        self.cafe_sweep = CafeDeletionSweep(self.deletion_probe, self.pacing, user_agent=self.get_random_user_agent())
+        # 검색 요청 헤징 (SEARCH_HEDGING=true일 때만, p90 초과 시 같은 요청을 한 번 더)
+        self.hedger = None
+        if SEARCH_HEDGING:
+            from src.hedging import HedgedFetcher
+            # 헤지 요청도 검색 페이싱 슬롯/공유 예산 토큰을 받아야 전송 (바로 없으면 헤지 생략)
+            self.hedger = HedgedFetcher(self._fetch_search_requests,
+                                        acquire_slot=lambda: self.pacing.budget('search').try_acquire())
         self.base_url = "https://search.naver.com/search.naver"
         
+    def get_stats(self) -> dict:
+        """스크래퍼 하위 구성요소들의 통계 반환 (회차 종료 시 로그용)"""
+        return {
+            'transport': self.transport.stats(),
+            'driver_pool': self.driver_pool.stats(),
+            'browser': self.lifecycle.stats(),
+            'waits': self.waiter.stats(),
+            'pages': self.lean.stats(),
+            'search_circuit': self.search_breaker.stats(),
+            'pacing': self.pacing.stats(),
+            'hedging': self.hedger.stats() if self.hedger else None,
+            'watchdog': self.watchdog.stats(),
+            'serp_templates': self.templates.stats(),
+            'browser_extract': self.browser_extractor.stats(),
+            'deletion_probe': self.deletion_probe.stats(),
+            'cafe_sweep': self.cafe_sweep.stats(),
+        }
+
+    def log_stats(self):
+        """스크래퍼 통계를 로그로 출력"""
+        self.transport.log_stats()
+        self.pacing.log_stats()
+        if self.hedger:
+            self.hedger.log_stats()
+        b = self.lifecycle.stats()
+        logging.info(
+            f"브라우저 통계: 콜드 스타트 {b['cold_starts']}회, 재사용 {b['cold_starts_avoided']}회, "
+            f"재시작 {b['recycles']}회 (페이지 수 {b['recycled_by_page_loads']}, 메모리 {b['recycled_by_rss']})"
+        )
+        self.waiter.log_stats()
+        self.lean.log_stats()
+        c = self.search_breaker.stats()
+        logging.info(
+            f"검색 서킷 통계: 상태 {c['state']}, 열림 {c['opened']}회, 탐침 {c['probes']}회, "
+            f"requests 생략 {c['short_circuited']}건, 최근 차단 비율 {c['block_rate']:.0%}"
+        )
+        self.watchdog.log_stats()
+        self.templates.log_stats()
+        self.browser_extractor.log_stats()
+        self.deletion_probe.log_stats()
+        self.cafe_sweep.log_stats()
+
     def get_random_user_agent(self):
         """무작위 User-Agent 반환"""
         return random.choice(self.user_agents)
@@ -43,21 +161,20 @@ class NaverScraper:
         """
         if not url or 'naver.me' not in url:
             return url
-        try:
-            resp = self._session.head(
-                url, allow_redirects=True, timeout=10,
-                headers={"User-Agent": self.get_random_user_agent()}
-            )
-            return resp.url
-        except Exception:
+        # 단축 URL 해석도 검색 예산 간격을 지킴 (403/429 응답이면 간격 증가)
+        budget = self.pacing.for_url(url)
+        for method in (self._session.head, self._session.get):
+            budget.wait()
             try:
-                resp = self._session.get(
-                    url, allow_redirects=True, timeout=10,
+                resp = method(
+                    url, allow_redirects=True, timeout=HTTP_TIMEOUT,
                     headers={"User-Agent": self.get_random_user_agent()}
                 )
-                return resp.url
             except Exception:
-                return url
+                continue
+            budget.record(resp.status_code not in BLOCK_STATUS_CODES)
+            return resp.url
+        return url
 
     @staticmethod
     def normalize_url(url: str) -> str:
@@ -78,140 +195,225 @@ class NaverScraper:
             netloc = netloc[2:]
         return netloc + parsed.path
 
-    def get_search_results(self, keyword, page=1, delay=True):
-        """네이버 검색 결과를 가져오는 함수 (requests 우선, 403 시 Selenium 폴백)"""
-        if delay:
-            time.sleep(random.uniform(0.5, 1.0))
-
+    def build_search_url(self, keyword, page=1):
+        """검색 키워드/페이지로 네이버 검색 URL 생성"""
         from urllib.parse import urlencode
         params = urlencode({"query": keyword, "start": (page - 1) * 10 + 1})
-        url = f"{self.base_url}?{params}"
+        return f"{self.base_url}?{params}"
+
+    def get_search_results(self, keyword, page=1, delay=True, allow_defer=False):
+        """
+        네이버 검색 결과를 가져오는 함수 (requests 우선, 403 시 Selenium 폴백)
+
+        Args:
+            allow_defer: True이고 서킷이 열려 있으며 CIRCUIT_OPEN_ACTION=defer 이면
+                         검색하지 않고 DEFERRED 반환 (회차 끝에서 다시 검색)
+
+        Returns:
+            SerpDocument (HTML_PARSER_BACKEND 로 파싱한 검색 결과, PARSE_WORKERS > 0 이면 ParsedSerp —
+            어느 쪽이든 extract_* 함수에 그대로 전달) 또는 실패 시 None
+        """
+        if delay:
+            self.pacing.wait('search')
+
+        url = self.build_search_url(keyword, page)
 
         logging.info(f"'{keyword}' 검색 중 (페이지 {page})...")
 
-        # 1단계: requests 시도 (빠름)
-        # 매 검색마다 새 세션 사용 → 쿠키/세션 누적 없이 "처음 방문자" 상태로 검색
+        # 1단계: requests 시도 (빠름, 봇 차단이 잦으면 서킷이 열려 생략)
+        soup, attempted = self._fetch_search_requests_guarded(url)
+        if soup is not None:
+            return soup
+        if self._should_defer(attempted, allow_defer):
+            logging.info(f"'{keyword}' 서킷 열림 — 검색을 회차 끝으로 미룸")
+            return DEFERRED
+
+        # 2단계: Selenium 폴백 (느리지만 확실)
+        return self._fetch_search_selenium(url)
+
+    def _fetch_search_requests_guarded(self, url):
+        """
+        서킷 브레이커를 거쳐 requests 검색.
+
+        Returns:
+            (soup or None, attempted) -- attempted=False면 서킷이 열려 요청을 보내지 않은 것
+        """
+        if not self.search_breaker.allow_request():
+            return None, False
+        soup = self._fetch_search_requests_hedged(url)
+        if soup is not None:
+            self.search_breaker.record_success()
+        else:
+            self.search_breaker.record_failure()
+        # 페이싱 예산에는 _fetch_search_requests 가 실제 차단 신호(결과 마커 없음/403/429)만 반영
+        return soup, True
+
+    def _fetch_search_requests_hedged(self, url):
+        """_fetch_search_requests 와 같되, 헤징이 켜져 있으면 느린 요청에 헤지 요청 추가"""
+        if self.hedger is not None:
+            return self.hedger(url)
+        return self._fetch_search_requests(url)
+
+    def _should_defer(self, attempted, allow_defer):
+        """서킷이 열려 requests를 생략했을 때 Selenium 대신 회차 끝으로 미룰지 여부"""
+        return not attempted and allow_defer and CIRCUIT_OPEN_ACTION == 'defer'
+
+    def _search_deferred(self, keywords, page=1):
+        """
+        미뤄 둔 키워드를 회차 끝에서 다시 검색하는 제너레이터.
+        서킷이 아직 열려 있으면 탐침 시점까지 한 번 기다린 뒤 검색 (여전히 열려 있으면 Selenium 폴백).
+        """
+        if not keywords:
+            return
+        wait_for = self.search_breaker.seconds_until_probe()
+        if wait_for > 0:
+            logging.info(f"미뤄 둔 키워드 {len(keywords)}개 — 서킷 탐침까지 {wait_for:.0f}초 대기")
+            time.sleep(wait_for)
+        for keyword in keywords:
+            try:
+                soup = self.get_search_results(keyword, page=page)
+            except Exception as e:
+                logging.error(f"키워드 '{keyword}' 검색 중 오류 발생: {e}")
+                soup = None
+            yield keyword, soup
+
+    def _parse_page(self, html, encoding='utf-8'):
+        """
+        검색 결과 HTML 파싱.
+        PARSE_WORKERS > 0 이면 파싱 워커 프로세스에서 추출까지 마친 ParsedSerp (트리 없음),
+        아니면 이 스레드에서 파싱한 SerpDocument — 둘 다 parsed() 로 같은 추출 결과를 제공.
+        """
+        if self.parse_pool.enabled:
+            return self.parse_pool.parse(html, encoding)
+        if isinstance(html, bytes):
+            html = html.decode(encoding, errors='replace')
+        return self.parser.parse(html)
+
+    def _fetch_search_requests(self, url):
+        """
+        requests로 검색 페이지를 가져와 soup 반환.
+        봇 차단(결과 없음) 또는 요청 실패 시 None 반환.
+        검색 페이싱 예산에는 봇 차단(결과 마커 없음, 403/429)만 차단으로 반영 — 제한 시간 초과/파싱 오류 등은 반영하지 않음
+        """
+        # 커넥션은 풀에서 재사용하되 쿠키는 싣지 않음 → 쿠키/세션 누적 없이 "처음 방문자" 상태로 검색
+        budget = self.pacing.budget('search')
+        started = time.monotonic()
         try:
-            fresh_session = requests.Session()
             headers = {
                 "User-Agent": self.get_random_user_agent(),
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
                 "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-                "Accept-Encoding": "identity",
                 "Referer": "https://www.naver.com/",
                 "Connection": "keep-alive",
                 "Upgrade-Insecure-Requests": "1",
             }
-            response = fresh_session.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            if SEARCH_STREAMING:
+                # 받는 중에 바이트 마커 검사: 결과 마커가 없으면 파싱 없이 즉시 폴백,
+                # 메인 영역까지 받았으면 나머지 본문은 받지 않음
+                body, found, encoding = self.transport.get_streaming(
+                    url, SERP_RESULT_MARKERS, SERP_STOP_MARKERS, headers=headers,
+                    timeout=HTTP_TIMEOUT, total_timeout=HTTP_TOTAL_TIMEOUT,
+                    drain_bytes=SEARCH_STREAM_DRAIN_KIB * 1024,
+                )
+                if not found:
+                    logging.info(f"requests 결과 없음 (검색 결과 마커 없음, 봇 차단 추정), Selenium으로 전환")
+                    budget.record(False)
+                    return None
+                soup = self._parse_page(body, encoding)
+            else:
+                response = self.transport.get(url, headers=headers, timeout=HTTP_TIMEOUT)
+                response.raise_for_status()
+                soup = self._parse_page(self.transport.decode_body(response))
             # 실제 검색 결과가 있는지 확인 (봇 차단 페이지는 결과 없음)
             # data-heatmap-target 속성 또는 네이버 검색 결과 컨테이너(sds-comps) 중 하나라도 있으면 유효
-            has_results = (
-                soup.find('a', attrs={'data-heatmap-target': True}) is not None
-                or soup.find(class_=lambda c: c and 'sds-comps' in ' '.join(c) if isinstance(c, list) else c and 'sds-comps' in c) is not None
-            )
-            if has_results:
+            # (이때 만든 단일 패스 추출 결과는 문서에 보관되어 extract_* 함수가 그대로 사용)
+            if not soup.parsed().blocked:
+                budget.record(True)
                 return soup
             logging.info(f"requests 결과 없음 (봇 차단 추정), Selenium으로 전환")
+            budget.record(False)
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code in BLOCK_STATUS_CODES:
+                budget.record(False)
+            logging.info(f"requests 실패 ({e}), Selenium으로 전환")
+        except requests.Timeout as e:
+            self.watchdog.record('http_search', url, time.monotonic() - started)
+            logging.info(f"requests 제한 시간 초과 ({e}), Selenium으로 전환")
         except Exception as e:
             logging.info(f"requests 실패 ({e}), Selenium으로 전환")
+        return None
 
-        # 2단계: Selenium 폴백 (느리지만 확실)
+    def _fetch_search_selenium(self, url):
+        """Selenium으로 검색 페이지를 가져와 soup(BROWSER_EXTRACT면 ParsedSerp) 반환 (2회 시도, 실패 시 None)"""
         # 쿠키 초기화 후 검색 — 처음 방문자 상태 유지
+        budget = self.pacing.budget('search')
         for attempt in range(2):
             try:
-                driver = self._init_driver()
-                driver.delete_all_cookies()
-                driver.get(url)
-                time.sleep(random.uniform(1.5, 2.0))
-                soup = BeautifulSoup(driver.page_source, 'html.parser')
-                return soup
+                # 브라우저 요청도 검색 예산 간격을 지킴 (드라이버 대여/워치독 감시 전에 대기)
+                budget.wait()
+                # 오류가 난 드라이버는 풀에서 폐기되고 다음 시도 때 새로 생성됨
+                with self.driver_pool.driver() as driver, \
+                        self.watchdog.guard('search', driver, self._selenium_op_timeout(WAIT_SEARCH_TIMEOUT, scripts=2), url):
+                    driver.delete_all_cookies()
+                    self._load_page(driver, url)
+                    # 검색 결과 요소가 나타나면 바로 진행 (봇 차단 페이지면 최대 대기 후 진행)
+                    found = self.waiter.presence(driver, SERP_RESULT_SELECTORS, WAIT_SEARCH_TIMEOUT, name='search_results')
+                    # 결과 요소가 끝내 없으면 봇 차단으로 반영
+                    budget.record(found)
+                    self.lean.record_page(driver, 'lean')
+                    if self.browser_extractor.enabled:
+                        # page_source 전송/재파싱 없이 페이지 안에서 ParsedSerp 추출 (스크립트 실패 시 page_source 파싱)
+                        return self.browser_extractor.extract(driver, self._parse_page, url)
+                    soup = self._parse_page(driver.page_source)
+                    return soup
             except Exception as e:
                 logging.info(f"Selenium 실패 (시도 {attempt+1}): {str(e)}")
-                self.close_driver()
                 if attempt == 0:
                     time.sleep(2)
         return None
-            
+
+    def iter_search_results(self, keywords, page=1):
+        """
+        키워드 목록의 검색 결과를 (keyword, soup) 순서대로 반환하는 제너레이터.
+        SEARCH_CONCURRENCY > 1 이면 AsyncNaverScraper로 여러 키워드를 동시에 검색하고,
+        아니면 기존처럼 get_search_results를 순차 호출.
+        검색 실패 키워드는 soup=None 으로 반환.
+        서킷이 열려 미뤄진 키워드(CIRCUIT_OPEN_ACTION=defer)는 마지막에 다시 검색해 반환하므로
+        입력 순서와 반환 순서가 다를 수 있음.
+        """
+        from src.config import SEARCH_CONCURRENCY
+
+        if SEARCH_CONCURRENCY > 1:
+            from src.async_scraper import AsyncNaverScraper
+            yield from AsyncNaverScraper(self).iter_search_results(keywords, page=page)
+            return
+
+        deferred = []
+        for keyword in keywords:
+            try:
+                soup = self.get_search_results(keyword, page=page, allow_defer=True)
+            except Exception as e:
+                logging.error(f"키워드 '{keyword}' 검색 중 오류 발생: {e}")
+                soup = None
+            if soup is DEFERRED:
+                deferred.append(keyword)
+                continue
+            yield keyword, soup
+        yield from self._search_deferred(deferred, page=page)
+
     def extract_urls(self, soup):
-        """검색 결과에서 URL을 추출하는 함수"""
-        urls = []
-        
-        # 1. 가장 효과적인 방법: 모든 a 태그를 검색하고 모든 속성 확인
-        logging.info("모든 a 태그에서 URL 추출 시도...")
-        try:
-            for a_tag in soup.find_all('a'):
-                # 모든 속성 확인
-                for _, attr_value in a_tag.attrs.items():
-                    # URL 형태인 모든 속성 값 추출
-                    if isinstance(attr_value, str) and ('http://' in attr_value or 'https://' in attr_value):
-                        # 네이버 URL에 초점
-                        if 'naver.com' in attr_value:
-                            urls.append(attr_value)
-                            #logging.info(f"네이버 URL 발견 (속성: {attr_name}): {attr_value[:100]}..." if len(attr_value) > 100 else f"네이버 URL 발견: {attr_value}")
-        except Exception as e:
-            logging.info(f"a 태그 처리 중 오류: {str(e)}")
-        
-        # 2. 구조적 접근: 네이버 검색 결과에서 자주 사용되는 패턴 찾기
-        try:
-            # nocr 속성이 있는 요소 찾기 (네이버 검색 결과에 자주 사용됨)
-            nocr_elements = soup.find_all(attrs={'nocr': True})
-            logging.info(f"{len(nocr_elements)}개의 nocr 속성 요소 발견")
-            
-            for elem in nocr_elements:
-                # 링크 요소이거나 내부에 링크를 포함하는지 확인
-                if elem.name == 'a' and elem.has_attr('href'):
-                    urls.append(elem['href'])
-                else:
-                    # 내부 링크 찾기
-                    for inner_a in elem.find_all('a', href=True):
-                        urls.append(inner_a['href'])
-        except Exception as e:
-            logging.info(f"nocr 요소 처리 중 오류: {str(e)}")
-        
-        # 3. 일반적인 컨테이너 클래스 접근
-        # 클래스 이름은 동적으로 변경되지만, 일부 공통 패턴이 있음
-        try:
-            # 일반적인 검색 결과 컨테이너
-            containers = []
-            
-            # 클래스 수가 많은 div 탐색 (네이버 검색은 일반적으로 많은 클래스를 사용)
-            for div in soup.find_all('div'):
-                if div.has_attr('class') and len(div['class']) >= 2:
-                    containers.append(div)
-            
-            logging.info(f"{len(containers)}개의 잠재적 컨테이너 발견")
-            
-            # 각 컨테이너 내의 링크 찾기
-            for container in containers:
-                for a in container.find_all('a', href=True):
-                    if 'naver.com' in a['href']:
-                        urls.append(a['href'])
-        except Exception as e:
-            logging.info(f"컨테이너 처리 중 오류: {str(e)}")
-        
-        # 4. 텍스트 기반 접근
-        # 특정 키워드와 함께 출현할 가능성이 높은 링크 찾기
-        keywords = ["cafe", "blog", "카페", "블로그", "지식인", "포스트", "뉴스"]
-        
-        try:
-            for keyword in keywords:
-                # 텍스트에 키워드가 포함된 요소 근처의 링크 찾기
-                for element in soup.find_all(text=lambda t: keyword in t.lower() if t else False):
-                    parent = element.parent
-                    # 부모 요소와 그 형제 요소에서 링크 찾기
-                    for a in parent.find_all('a', href=True):
-                        if 'naver.com' in a['href']:
-                            urls.append(a['href'])
-                    # 상위 요소도 확인
-                    if parent.parent:
-                        for a in parent.parent.find_all('a', href=True):
-                            if 'naver.com' in a['href']:
-                                urls.append(a['href'])
-        except Exception as e:
-            logging.info(f"키워드 기반 검색 중 오류: {str(e)}")
-        
+        """
+        검색 결과에서 URL을 추출하는 함수 (페이지의 모든 네이버 URL 후보, src.url_harvest)
+        파싱 트리 필요 — 파싱 워커 결과(ParsedSerp)는 사용 불가
+        """
+        # 텍스트 노드 탐색 등 BeautifulSoup 전용 로직 — 다른 백엔드 문서는 BeautifulSoup 트리로 변환
+        if not isinstance(soup, BeautifulSoup):
+            soup = soup.to_soup()
+        # a 태그 속성 / nocr 요소 / 다중 클래스 div / 키워드 텍스트 주변 링크를 트리 1회 순회로 수집 (페이지당 제한 시간)
+        urls, complete = harvest_urls(soup)
+        if not complete:
+            logging.warning(f"URL 수집 제한 시간 초과 — 부분 결과 {len(urls)}개 사용")
+
         # 네이버 카페/블로그 URL 정규화 (JWT 토큰 제거)
         normalized_urls = []
         for url in urls:
@@ -238,39 +440,14 @@ class NaverScraper:
 
     def extract_main_urls(self, soup):
         """
-        메인 노출 URL만 추출.
-        1순위: data-heatmap-target=".link" 인 a 태그
-        2순위(폴백): data-heatmap-target 속성이 있는 모든 a 태그 중 naver.com 포함 URL
+        메인 노출 URL만 추출. 페이지 템플릿 지문으로 추출기 버전을 바로 선택 (src.serp_template).
+        현재 템플릿: data-heatmap-target=".link"/".imgtitlelink" 인 a 태그
+        구버전/변경된 템플릿(.link 없음): data-heatmap-target 속성이 있는 모든 a 태그 중 naver.com 포함 URL
         data-heatmap-target=".series" 는 서브 노출이므로 제외.
         fds-health-cafe-block-wrap(관련 경험 카페글) 섹션은 제외.
         """
-        # 관련 경험 카페글 섹션을 soup에서 제거한 뒤 탐색
-        search_soup = copy.copy(soup)
-        for health_block in search_soup.find_all('div', class_=lambda c: c and 'fds-health-cafe-block-wrap' in c):
-            health_block.decompose()
-
-        urls = []
-        try:
-            for a_tag in search_soup.find_all('a', attrs={'data-heatmap-target': lambda v: v in ('.link', '.imgtitlelink')}):
-                href = a_tag.get('href', '')
-                if href and ('http://' in href or 'https://' in href):
-                    urls.append(href)
-        except Exception as e:
-            logging.info(f"메인 URL 추출 중 오류: {str(e)}")
-
-        # 폴백: .link 속성 방식으로 URL을 하나도 못 찾은 경우 — 네이버 HTML 구조 변경 감지
-        if not urls:
-            logging.warning("data-heatmap-target='.link' URL 없음 — 네이버 HTML 구조 변경 의심, 폴백 추출 시도")
-            try:
-                for a_tag in search_soup.find_all('a', attrs={'data-heatmap-target': True}):
-                    target_val = a_tag.get('data-heatmap-target', '')
-                    if '.series' in target_val:
-                        continue
-                    href = a_tag.get('href', '')
-                    if href and 'naver.com' in href and ('http://' in href or 'https://' in href):
-                        urls.append(href)
-            except Exception as e:
-                logging.warning(f"폴백 URL 추출 중 오류: {str(e)}")
+        # 현재 템플릿이 아니면 지문별로 회차당 1회만 경고
+        urls = self.templates.extract_main_links(soup.parsed())
 
         normalized_urls = [self.normalize_url(url) for url in urls]
         unique_urls = list(dict.fromkeys(normalized_urls))
@@ -287,28 +464,14 @@ class NaverScraper:
         해당 섹션 내 data-heatmap-target=".link" URL을 추출.
         인기글 섹션이 없으면 빈 집합 반환.
         """
-        popular_urls = set()
-        try:
-            all_header_titles = soup.find_all('div', class_=lambda c: c and 'sds-comps-header-title' in c)
-            logging.info(f"[인기글] sds-comps-header-title 개수: {len(all_header_titles)}")
-            for i, header_title in enumerate(all_header_titles):
-                h2 = header_title.find('h2')
-                h2_text = h2.get_text(strip=True) if h2 else None
-                logging.info(f"[인기글] header_title[{i}] h2={h2_text!r}")
-                if not h2 or '인기글' not in h2.get_text():
-                    continue
-                section = header_title.parent.parent  # sds-comps-header의 부모 (header + 글목록 모두 포함)
-                if section is None:
-                    logging.info(f"[인기글] section is None, 스킵")
-                    continue
-                links = section.find_all('a', attrs={'data-heatmap-target': '.link'})
-                logging.info(f"[인기글] section 내 .link 개수: {len(links)}")
-                for a_tag in links:
-                    href = a_tag.get('href', '')
-                    if href and ('http://' in href or 'https://' in href):
-                        popular_urls.add(self.normalize_url(href))
-        except Exception as e:
-            logging.info(f"인기글 URL 추출 중 오류: {str(e)}")
+        parsed = soup.parsed()
+        logging.info(f"[인기글] sds-comps-header-title 개수: {len(parsed.header_titles)}")
+        for i, h2_text in enumerate(parsed.header_titles):
+            logging.info(f"[인기글] header_title[{i}] h2={h2_text!r}")
+        popular_urls = {
+            self.normalize_url(href) for href, _ in parsed.popular_links
+            if 'http://' in href or 'https://' in href
+        }
         logging.info(f"인기글 섹션 URL {len(popular_urls)}개 추출 완료")
         return popular_urls
 
@@ -320,24 +483,14 @@ class NaverScraper:
         비대표카페가 하나라도 있으면 False, 전부 대표카페이면 True(default).
         파워콘텐츠(광고) 항목(data-power-content-url 속성 보유)은 판정에서 제외.
         """
-        try:
-            items = soup.find_all('div', attrs={'data-template-id': 'ugcItem'})
-            if not items:
-                return True  # 결과 없으면 default(대표카페)
-            for item in items:
-                # 파워콘텐츠(광고) 항목은 대표카페 판정에서 제외
-                if item.get('data-power-content-url'):
-                    continue
-                is_cafe = item.find('a', href=lambda h: h and 'cafe.naver.com' in h)
-                if not is_cafe:
-                    continue
-                badge = item.find('svg', attrs={'viewbox': '0 0 20 15'})
-                if not badge:
-                    logging.info("[대표카페] 비대표카페 항목 발견 → is_main_cafe=False")
-                    return False
-        except Exception as e:
-            logging.info(f"대표카페 확인 중 오류: {e}")
-        return True
+        for item in soup.parsed().items:
+            # 파워콘텐츠(광고) 항목은 대표카페 판정에서 제외
+            if item['power_content'] or item['cafe_href'] is None:
+                continue
+            if not item['main_badge']:
+                logging.info("[대표카페] 비대표카페 항목 발견 → is_main_cafe=False")
+                return False
+        return True  # 결과 없으면 default(대표카페)
 
     def get_cafe_post_views(self, url):
         """
@@ -353,8 +506,9 @@ class NaverScraper:
             return None
 
         try:
-            # 랜덤 지연
-            time.sleep(random.uniform(0.3, 0.8))
+            # 카페 예산 간격만큼 대기 (403/429 응답이면 간격 증가)
+            budget = self.pacing.budget('cafe')
+            budget.wait()
 
             headers = {
                 "User-Agent": self.get_random_user_agent(),
@@ -362,7 +516,9 @@ class NaverScraper:
                 "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7"
             }
 
-            response = requests.get(url, headers=headers)
+            started = time.monotonic()
+            response = requests.get(url, headers=headers, timeout=HTTP_TIMEOUT)
+            budget.record(response.status_code not in BLOCK_STATUS_CODES)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -406,16 +562,21 @@ class NaverScraper:
 
             return None
 
+        except requests.Timeout as e:
+            self.watchdog.record('http_cafe_views', url, time.monotonic() - started)
+            logging.info(f"조회수 가져오기 제한 시간 초과 ({url}): {str(e)}")
+            return None
         except Exception as e:
             logging.info(f"조회수 가져오기 실패 ({url}): {str(e)}")
             return None
 
-    def _is_driver_alive(self):
+    def _is_driver_alive(self, driver):
         """드라이버 세션이 살아있는지 확인"""
-        if self._driver is None:
+        if driver is None:
             return False
         try:
-            _ = self._driver.current_url
+            with self.watchdog.guard('health_check', driver, WATCHDOG_SCRIPT_TIMEOUT):
+                _ = driver.current_url
             return True
         except Exception:
             return False
@@ -437,64 +598,132 @@ class NaverScraper:
                     return path
             raise
 
-    def _init_driver(self):
-        """Selenium WebDriver 초기화 (죽은 세션이면 재생성)"""
-        if not self._is_driver_alive():
-            # 죽은 드라이버 정리
-            if self._driver is not None:
-                try:
-                    self._driver.quit()
-                except Exception:
-                    pass
-                self._driver = None
-
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--log-level=3')
-            chrome_options.add_argument('--incognito')
-            chrome_options.add_argument('--disable-application-cache')
-            chrome_options.add_argument('--disable-cache')
-            chrome_options.add_argument(f'user-agent={self.get_random_user_agent()}')
-
-            driver_path = self._get_chromedriver_path()
-            self._driver = webdriver.Chrome(
-                service=Service(driver_path),
-                options=chrome_options
-            )
-            logging.info("Selenium WebDriver 초기화 완료")
+    def _create_driver(self):
+        """새 Selenium WebDriver 생성 (드라이버 풀에서 호출)"""
+        chrome_options = Options()
+        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--log-level=3')
+        chrome_options.add_argument('--incognito')
+        chrome_options.add_argument('--disable-application-cache')
+        chrome_options.add_argument('--disable-cache')
+        chrome_options.add_argument(f'user-agent={self.get_random_user_agent()}')
+        # 실행 프로세스 pid가 들어간 프로필 폴더 — 비정상 종료로 남은 Chrome을 다음 실행에서 찾아 정리
+        profile_dir = self.watchdog.make_profile_dir()
+        chrome_options.add_argument(f'--user-data-dir={profile_dir}')
+        self.lean.configure_options(chrome_options)
+
+        # 경로는 디스크 캐시 우선 (버전 조회 네트워크 요청 생략), Chrome 버전 불일치 시 한 번만 재조회
+        driver_path = self.lifecycle.resolve_chromedriver_path(self._get_chromedriver_path)
+        try:
+            try:
+                driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+            except SessionNotCreatedException as e:
+                logging.info(f"캐시된 chromedriver로 세션 생성 실패, 경로 재조회: {e.msg}")
+                driver_path = self.lifecycle.resolve_chromedriver_path(self._get_chromedriver_path, refresh=True)
+                driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+        except Exception:
+            self.watchdog.remove_profile_dir(profile_dir)
+            raise
+        self._profile_dirs[id(driver)] = profile_dir
+        # chromedriver가 스스로 중단하는 제한 시간 (넘기면 TimeoutException)
+        driver.set_page_load_timeout(WATCHDOG_PAGE_LOAD_TIMEOUT)
+        driver.set_script_timeout(WATCHDOG_SCRIPT_TIMEOUT)
+        self.lean.prepare(driver)
+        self.lifecycle.register(driver)
+        logging.info("Selenium WebDriver 초기화 완료")
+        return driver
+
+    def _on_driver_closed(self, driver):
+        """풀에서 드라이버를 종료한 뒤 드라이버별 기록과 프로필 폴더 정리"""
+        self.lifecycle.forget(driver)
+        self.lean.forget(driver)
+        self.watchdog.remove_profile_dir(self._profile_dirs.pop(id(driver), None))
+
+    @staticmethod
+    def _selenium_op_timeout(wait_timeout: float = 0.0, scripts: int = 1) -> float:
+        """페이지 로딩 1회 + 조건 대기 + 스크립트 scripts회로 이루어진 Selenium 작업의 제한 시간 (초)"""
+        return WATCHDOG_PAGE_LOAD_TIMEOUT + wait_timeout + WATCHDOG_SCRIPT_TIMEOUT * scripts
+
+    def _load_page(self, driver, url, profile='lean'):
+        """
+        드라이버로 페이지 로딩 (재시작 기준용 로딩 횟수 집계)
 
-        return self._driver
+        Args:
+            profile: 리소스 차단 프로필 — 'lean'(CSS까지 차단) 또는 'layout'(광고/트래킹만 차단)
+        """
+        self.lean.apply(driver, profile)
+        with self.watchdog.guard('page_load', driver, WATCHDOG_PAGE_LOAD_TIMEOUT, url):
+            driver.get(url)
+        self.lifecycle.note_page_load(driver)
+
+    def _reset_pooled_driver(self, driver):
+        """풀 반납 시 쿠키 초기화 (멈춘 드라이버면 워치독이 종료 → 풀에서 폐기)"""
+        with self.watchdog.guard('reset', driver, WATCHDOG_SCRIPT_TIMEOUT):
+            self._reset_driver_cookies(driver)
+
+    @staticmethod
+    def _reset_driver_cookies(driver):
+        """풀 반납 시 드라이버 쿠키 초기화 (남아 있는 alert는 먼저 닫음)"""
+        try:
+            driver.switch_to.alert.accept()
+        except NoAlertPresentException:
+            pass
+        driver.delete_all_cookies()
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+
+    @staticmethod
+    def _clear_driver_cache_and_cookies(driver):
+        """드라이버 1개의 캐시와 쿠키를 모두 초기화"""
+        driver.delete_all_cookies()
+        # Chrome DevTools Protocol로 브라우저 캐시 완전 삭제
+        driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
 
     def clear_cache_and_cookies(self):
-        """WebDriver의 캐시와 쿠키를 모두 초기화"""
-        if self._driver:
-            try:
-                self._driver.delete_all_cookies()
-                # Chrome DevTools Protocol로 브라우저 캐시 완전 삭제
-                self._driver.execute_cdp_cmd('Network.clearBrowserCache', {})
-                self._driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
-                print("브라우저 캐시 및 쿠키 초기화 완료")
-            except Exception as e:
-                print(f"캐시/쿠키 초기화 중 오류 (무시): {str(e)}")
+        """대기 중인 모든 WebDriver의 캐시와 쿠키를 초기화"""
+        try:
+            self.driver_pool.for_each_idle(self._clear_driver_cache_and_cookies)
+            print("브라우저 캐시 및 쿠키 초기화 완료")
+        except Exception as e:
+            print(f"캐시/쿠키 초기화 중 오류 (무시): {str(e)}")
 
     def reset_driver(self):
         """WebDriver를 완전히 종료하고 새로 시작 (캐시/쿠키 완전 초기화)"""
         self.close_driver()
         print("WebDriver 리셋 완료 - 다음 사용 시 새로 초기화됩니다.")
 
+    def start_cycle(self):
+        """
+        순찰 회차 시작. BROWSER_KEEP_ALIVE면 살아있는 브라우저를 재사용하면서 캐시/쿠키만 초기화,
+        아니면 기존처럼 모든 브라우저를 종료하고 새로 시작.
+        """
+        self.templates.start_cycle()
+        if BROWSER_KEEP_ALIVE:
+            self.lifecycle.start_cycle(self.driver_pool, self._clear_driver_cache_and_cookies)
+        else:
+            self.reset_driver()
+
+    def end_cycle(self):
+        """
+        순찰 회차 종료. BROWSER_KEEP_ALIVE면 재시작 기준을 넘은 브라우저만 종료하고 나머지는 유지,
+        아니면 모든 브라우저 종료.
+        """
+        if BROWSER_KEEP_ALIVE:
+            self.lifecycle.end_cycle(self.driver_pool)
+        else:
+            self.close_driver()
+
     def close_driver(self):
-        """WebDriver 종료"""
-        if self._driver:
-            self._driver.quit()
-            self._driver = None
+        """풀의 모든 WebDriver 종료"""
+        if self.driver_pool.close_all():
             logging.info("Selenium WebDriver 종료")
 
     def check_post_deleted(self, url):
         """
-        네이버 카페 게시글 삭제 여부 확인
+        네이버 카페 게시글 삭제 여부 확인 (HTTP 응답으로 먼저 판정, 판정 불가면 Selenium)
 
         Args:
             url: 카페 글 URL (예: https://cafe.naver.com/fox5282/4668750)
@@ -507,15 +736,47 @@ class NaverScraper:
         if not url or ('cafe.naver.com' not in url and 'blog.naver.com' not in url):
             return None, "유효하지 않은 URL"
 
+        result = self._probe_post_deleted(url)
+        if result[0] is not None:
+            return result
+
+        self.deletion_probe.record_browser_check()
+        try:
+            with self.driver_pool.driver() as driver:
+                return self._check_post_deleted_guarded(driver, url)
+        except Exception as e:
+            logging.info(f"삭제 확인 실패 ({url}): {str(e)}")
+            return None, str(e)
+
+    def _probe_post_deleted(self, url):
+        """HTTP 응답으로 삭제 여부 판정 (src.deletion_probe) — 판정 불가/오류면 (None, 사유)"""
         try:
-            driver = self._init_driver()
+            return self.deletion_probe.probe(url, budget=self.pacing.for_url(url))
+        except Exception as e:
+            logging.info(f"삭제 확인 HTTP 판정 실패 ({url}): {str(e)}")
+            return None, str(e)
 
-            driver.get(url)
-            time.sleep(1.5)  # alert 대기
+    def _check_post_deleted_guarded(self, driver, url):
+        """워치독 감시 아래 삭제 여부 확인 (멈추면 브라우저가 종료되고 확인 실패로 반환)"""
+        with self.watchdog.guard('deletion_check', driver, self._selenium_op_timeout(WAIT_ALERT_TIMEOUT), url):
+            return self._check_post_deleted_with(driver, url)
 
-            try:
+    def _check_post_deleted_with(self, driver, url):
+        """대여한 드라이버로 게시글 삭제 여부 확인 (check_post_deleted 참고)"""
+        try:
+            self._load_page(driver, url)
+            if 'cafe.naver.com' in url:
+                # 카페: alert가 뜨거나 iframe 안에 본문이 보이면 진행 (아니면 WAIT_ALERT_TIMEOUT 까지 alert 대기)
+                alert = self.waiter.alert_or_frame_content(
+                    driver, CAFE_ARTICLE_FRAME, CAFE_ARTICLE_SELECTORS, WAIT_ALERT_TIMEOUT)
+            else:
+                # 블로그: alert가 뜨거나 페이지 렌더링이 끝나면(DOM 변경 멈춤) 바로 진행
+                alert = self.waiter.alert_or_settled(driver, WAIT_ALERT_TIMEOUT)
+
+            if alert is None:
+                self.lean.record_page(driver, 'lean')
+            else:
                 # JavaScript alert 확인 (카페 방식)
-                alert = driver.switch_to.alert
                 alert_text = alert.text
                 alert.accept()  # alert 닫기
 
@@ -523,23 +784,95 @@ class NaverScraper:
                     return True, alert_text
                 return False, None
 
-            except NoAlertPresentException:
-                # 블로그: alert 없이 페이지로 비공개/제한 표시
-                if 'blog.naver.com' in url:
-                    page_source = driver.page_source
-                    if '비공개 블로그입니다' in page_source or '접근이 제한' in page_source:
-                        return True, "비공개 블로그"
-                return False, None
+            # 블로그: alert 없이 페이지로 비공개/제한 표시
+            if 'blog.naver.com' in url:
+                page_source = driver.page_source
+                if '비공개 블로그입니다' in page_source or '접근이 제한' in page_source:
+                    return True, "비공개 블로그"
+            return False, None
 
         except UnexpectedAlertPresentException:
             return True, "삭제되었거나 존재하지 않는 게시글"
-        except Exception as e:
+        except NoAlertPresentException:
+            # alert가 확인 직후 닫힌 경우 — 판정 불가 (드라이버는 정상이므로 재사용)
+            return None, "삭제 확인 alert 사라짐"
+        # 그 밖의 예외(WebDriverException, 워치독 강제 종료 등)는 그대로 전파 — 드라이버 풀이 해당 드라이버를 폐기
+
+    def check_posts_deleted_parallel(self, urls, probe=True) -> dict:
+        """
+        여러 URL의 삭제 여부를 확인 (중복 URL은 1회만 확인)
+        HTTP 응답으로 먼저 판정하고, 판정 불가한 URL만 드라이버 풀 크기만큼 병렬로 Selenium 확인
+        URL마다 카페/블로그 페이싱 예산 간격을 지켜 요청 (확인 실패가 이어지면 간격 증가)
+
+        Args:
+            urls: URL 목록
+            probe: False면 HTTP 판정 없이 바로 Selenium 확인 (이미 HTTP 판정이 불가했던 URL)
+
+        Returns:
+            {url: (is_deleted, message), ...}
+        """
+        unique_urls = list(dict.fromkeys(u for u in urls if u))
+
+        results = {}
+        pending = []
+        for url in unique_urls:
+            if 'cafe.naver.com' not in url and 'blog.naver.com' not in url:
+                results[url] = (None, "유효하지 않은 URL")
+                continue
+            result = self._probe_post_deleted(url) if probe else (None, None)
+            if result[0] is None:
+                pending.append(url)
+            else:
+                results[url] = result
+        if not pending:
+            return results
+        self.deletion_probe.record_browser_check(len(pending))
+
+        def check(driver, url):
+            if not url or ('cafe.naver.com' not in url and 'blog.naver.com' not in url):
+                return None, "유효하지 않은 URL"
+            budget = self.pacing.for_url(url)
+            budget.wait()
+            result = self._check_post_deleted_guarded(driver, url)
+            budget.record(result[0] is not None)
+            return result
+
+        def failed(url, e):
+            # 예외가 난 드라이버는 풀에서 폐기된 뒤 호출됨
             logging.info(f"삭제 확인 실패 ({url}): {str(e)}")
             return None, str(e)
 
+        try:
+            verdicts = self.driver_pool.map(check, pending, on_error=failed)
+        except Exception as e:
+            # 드라이버 생성 자체가 실패한 경우 — 전부 확인 실패로 처리
+            logging.info(f"삭제 확인 드라이버 준비 실패: {str(e)}")
+            verdicts = [(None, str(e))] * len(pending)
+        results.update(zip(pending, verdicts))
+        return results
+
+    def sweep_posts_deleted(self, urls) -> dict:
+        """
+        여러 URL의 삭제 여부를 카페 단위로 확인 (--check-deleted, src.cafe_sweep 참고)
+        카페 글 목록과 글별 HTTP 확인으로 판정하지 못한 URL만 Selenium 확인
+        (CAFE_SWEEP=false면 check_posts_deleted_parallel 과 같음)
+
+        Args:
+            urls: URL 목록
+
+        Returns:
+            {url: (is_deleted, message), ...}
+        """
+        if not self.cafe_sweep.enabled:
+            return self.check_posts_deleted_parallel(urls)
+        results, leftovers = self.cafe_sweep.sweep(urls)
+        if leftovers:
+            results.update(self.check_posts_deleted_parallel(leftovers, probe=False))
+        return results
+
     def batch_check_posts_deleted(self, urls):
         """
-        여러 게시글의 삭제 여부를 일괄 확인
+        여러 게시글의 삭제 여부를 일괄 확인 (드라이버 풀 크기만큼 병렬)
 
         Args:
             urls: URL 목록 [(url, row_id), ...]
@@ -550,8 +883,10 @@ class NaverScraper:
         results = []
 
         try:
+            # 레이트 리밋 방지를 위한 URL 간 대기는 페이싱 예산에서 처리
+            verdicts = self.check_posts_deleted_parallel([url for url, _ in urls])
             for url, row_id in urls:
-                is_deleted, message = self.check_post_deleted(url)
+                is_deleted, message = verdicts.get(url, (None, "유효하지 않은 URL"))
                 results.append({
                     'url': url,
                     'row': row_id,
@@ -559,9 +894,6 @@ class NaverScraper:
                     'message': message
                 })
 
-                # API 레이트 리밋 방지
-                time.sleep(random.uniform(0.5, 1.0))
-
         finally:
             # 작업 완료 후 드라이버 종료
             self.close_driver()
@@ -587,7 +919,6 @@ class NaverScraper:
                 ]
             }
         """
-        import re
         from src.config import CAFE_URL_MAP
 
         result = {
@@ -596,125 +927,51 @@ class NaverScraper:
             'popular_results': []
         }
 
-        def get_block(element):
-            node = element
-            while node:
-                classes = node.get('class') or []
-                if '_fsolid_head' in classes:
-                    return 'head'
-                if '_fsolid_body' in classes:
-                    return 'body'
-                node = node.parent
-            return 'single'
-
-        def get_cafe_name(ugc_item):
-            el = ugc_item.find('span', class_=lambda c: c and 'sds-comps-profile-info-title-text' in (
-                c if isinstance(c, str) else ' '.join(c)))
-            return el.get_text(strip=True) if el else None
-
-        def get_slug_from_url(url: str) -> str:
-            """cafe.naver.com/SLUG/... 에서 slug 추출"""
-            if 'cafe.naver.com/' in url:
-                return url.split('cafe.naver.com/')[1].split('/')[0].split('?')[0]
-            return ''
-
         def get_display_name(cafe_name: str, url: str) -> str:
-            """URL slug로 단축명 조회, 없으면 원래 카페명 반환"""
-            slug = get_slug_from_url(url)
+            """URL slug(cafe.naver.com/SLUG/...)로 단축명 조회, 없으면 원래 카페명 반환"""
+            slug = url.split('cafe.naver.com/')[1].split('/')[0].split('?')[0] if 'cafe.naver.com/' in url else ''
             return CAFE_URL_MAP.get(slug, cafe_name or '')
 
-        def get_published_at(ugc_item) -> str:
-            """ugcItem에서 발행일 추출 (YYYY.MM.DD 또는 상대시간)"""
-            subtext = ugc_item.find('span', class_=lambda c: c and 'profile-info-subtext' in (
-                c if isinstance(c, str) else ' '.join(c)))
-            if not subtext:
-                return ''
-            text = subtext.get_text(strip=True)
-            # YYYY.MM.DD. 형식
-            m = re.search(r'(\d{4}\.\d{2}\.\d{2})\.?', text)
-            if m:
-                return m.group(1)
-            # 상대시간 (N일 전, N시간 전, 어제 등)
-            m2 = re.search(r'(\d+[일시간분]+\s*전|어제|오늘)', text)
-            if m2:
-                return m2.group(1)
-            return text[:15]
-
         try:
             soup = self.get_search_results(keyword, delay=False)
             if not soup:
                 logging.warning(f"analyze_keyword_layout: '{keyword}' 검색 결과 없음")
                 return result
+            parsed = soup.parsed()
 
             # 상하단 구분 여부
-            has_head = soup.find(class_=lambda c: c and '_fsolid_head' in (
-                c if isinstance(c, str) else ' '.join(c)))
-            result['has_split_block'] = has_head is not None
+            result['has_split_block'] = parsed.has_split_block
 
             # 인기글 섹션 추출
             popular_url_set = set()
-            popular_items_raw = []
-            for h_el in soup.find_all('div', class_=lambda c: c and 'sds-comps-header-title' in (
-                    c if isinstance(c, str) else ' '.join(c))):
-                h2 = h_el.find('h2')
-                if not h2 or '인기글' not in h2.get_text():
-                    continue
-                section = h_el.parent.parent if h_el.parent else None
-                if not section:
+            for href, index in parsed.popular_links:
+                norm_url = self.normalize_url(href)
+                if norm_url in popular_url_set:
                     continue
-                for a_tag in section.find_all('a', attrs={'data-heatmap-target': '.link'}):
-                    href = a_tag.get('href', '')
-                    if not href:
-                        continue
-                    norm_url = self.normalize_url(href)
-                    if norm_url in popular_url_set:
-                        continue
-                    popular_url_set.add(norm_url)
-                    item_el = a_tag.find_parent('div', attrs={'data-template-id': 'ugcItem'})
-                    cafe_name = get_cafe_name(item_el) if item_el else None
-                    published_at = get_published_at(item_el) if item_el else ''
-                    popular_items_raw.append({
-                        'cafe_name': cafe_name,
-                        'display_name': get_display_name(cafe_name, href),
-                        'url': norm_url,
-                        'published_at': published_at,
-                    })
-
-            for idx, item in enumerate(popular_items_raw):
-                result['popular_results'].append({'rank': idx + 1, **item})
-
-            # 메인 결과: 인기글 섹션 제거 후 ugcItem 순서대로
-            analysis_soup = copy.copy(soup)
-            for h_el in analysis_soup.find_all('div', class_=lambda c: c and 'sds-comps-header-title' in (
-                    c if isinstance(c, str) else ' '.join(c))):
-                h2 = h_el.find('h2')
-                if h2 and '인기글' in h2.get_text():
-                    section = h_el.parent.parent if h_el.parent else None
-                    if section:
-                        section.decompose()
-                    break
-
-            rank = 1
-            for ugc_item in analysis_soup.find_all('div', attrs={'data-template-id': 'ugcItem'}):
-                if ugc_item.get('data-power-content-url'):
-                    continue
-                cafe_link = ugc_item.find('a', attrs={'data-heatmap-target': '.link'},
-                                          href=lambda h: h and 'cafe.naver.com' in h)
-                if not cafe_link:
-                    cafe_link = ugc_item.find('a', href=lambda h: h and 'cafe.naver.com' in h)
-                if not cafe_link:
-                    continue
-                href = cafe_link.get('href', '')
-                cafe_name = get_cafe_name(ugc_item)
-                result['main_results'].append({
-                    'rank': rank,
+                popular_url_set.add(norm_url)
+                item = parsed.items[index] if index is not None else {}
+                cafe_name = item.get('cafe_name')
+                result['popular_results'].append({
+                    'rank': len(result['popular_results']) + 1,
                     'cafe_name': cafe_name,
                     'display_name': get_display_name(cafe_name, href),
+                    'url': norm_url,
+                    'published_at': item.get('published_at', ''),
+                })
+
+            # 메인 결과: 첫 인기글 섹션을 뺀 ugcItem 순서대로
+            for item in parsed.items:
+                if item['power_content'] or item['in_first_popular'] or item['cafe_href'] is None:
+                    continue
+                href = item['cafe_href']
+                result['main_results'].append({
+                    'rank': len(result['main_results']) + 1,
+                    'cafe_name': item['cafe_name'],
+                    'display_name': get_display_name(item['cafe_name'], href),
                     'url': self.normalize_url(href),
-                    'block': get_block(ugc_item),
-                    'published_at': get_published_at(ugc_item),
+                    'block': item['block'],
+                    'published_at': item['published_at'],
                 })
-                rank += 1
 
             logging.info(
                 f"레이아웃 분석 완료 '{keyword}': split={result['has_split_block']}, "
@@ -764,107 +1021,115 @@ class NaverScraper:
         }
 
         try:
-            # 1. Selenium 드라이버 초기화
-            driver = self._init_driver()
-            if driver is None:
-                logging.warning(f"레이아웃 측정 '{keyword}': 드라이버 초기화 실패")
-                return result
-
-            # 2. 검색 페이지 로딩
-            search_url = f"https://search.naver.com/search.naver?query={keyword}"
-            driver.get(search_url)
-            time.sleep(2.5)  # 렌더링 대기
-
-            # 3. 페이지 높이 확인
-            scroll_height = driver.execute_script("return document.body.scrollHeight")
-            if scroll_height <= 0:
-                logging.warning(f"레이아웃 측정 '{keyword}': scrollHeight <= 0 (페이지 미렌더링)")
-                return result
+            # 검색 페이지를 여는 요청이므로 검색 예산 간격을 지킴 (드라이버 대여/워치독 감시 전에 대기)
+            self.pacing.wait('search')
+            # 1. 풀에서 Selenium 드라이버 대여 (측정 중 예외가 나면 해당 드라이버는 폐기)
+            with self.driver_pool.driver() as driver, \
+                    self.watchdog.guard('layout', driver, self._selenium_op_timeout(WAIT_RENDER_TIMEOUT, scripts=4), keyword):
+                return self._measure_layout_with(driver, keyword, target_urls, result)
+        except Exception as e:
+            logging.warning(f"레이아웃 측정 예외 '{keyword}': {e}")
+            return result
 
-            # 4. 키워드 단위: has_split_block (상하단 구분)
-            has_split_block = driver.execute_script("""
-                return document.querySelector('._fsolid_head') !== null;
-            """)
-            result['has_split_block'] = has_split_block
+    def _measure_layout_with(self, driver, keyword: str, target_urls: list, result: dict) -> dict:
+        """대여한 드라이버로 레이아웃 측정 (get_layout_metrics 참고). result를 채워 반환."""
+        # 2. 검색 페이지 로딩
+        search_url = f"https://search.naver.com/search.naver?query={keyword}"
+        # 레이아웃에 영향을 주는 CSS/폰트/이미지/미디어는 허용 (광고/트래킹만 차단)
+        self._load_page(driver, search_url, profile='layout')
+        # 렌더링 대기 — 결과 블록이 생기고 DOM 변경이 멈추면 바로 측정
+        rendered = self.waiter.rendered(driver, LAYOUT_READY_SELECTORS, WAIT_RENDER_TIMEOUT)
+        # 검색 결과 요소가 있으면 정상 응답 (카페글 블록이 없는 키워드도 있으므로 없다고 차단으로 보지는 않음)
+        self.pacing.budget('search').record(rendered or self.waiter.presence(
+            driver, SERP_RESULT_SELECTORS, 0, name='layout_results'))
+        self.lean.record_page(driver, 'layout')
+
+        # 3. 페이지 높이 확인
+        scroll_height = driver.execute_script("return document.body.scrollHeight")
+        if scroll_height <= 0:
+            logging.warning(f"레이아웃 측정 '{keyword}': scrollHeight <= 0 (페이지 미렌더링)")
+            return result
 
-            # 5. 키워드 단위: first_cafe_y_pct (첫 카페글 Y위치)
-            first_cafe_y_pct = driver.execute_script("""
+        # 4. 키워드 단위: has_split_block (상하단 구분)
+        has_split_block = driver.execute_script("""
+            return document.querySelector('._fsolid_head') !== null;
+        """)
+        result['has_split_block'] = has_split_block
+
+        # 5. 키워드 단위: first_cafe_y_pct (첫 카페글 Y위치)
+        first_cafe_y_pct = driver.execute_script("""
+            var pageHeight = document.body.scrollHeight;
+            // _fsolid_head, _fsolid_body 각각의 링크 중 cafe.naver.com URL 찾기
+            var headLinks = document.querySelectorAll('._fsolid_head a[href*="cafe.naver.com"]');
+            var bodyLinks = document.querySelectorAll('._fsolid_body a[href*="cafe.naver.com"]');
+            var allCafeLinks = Array.from(headLinks).concat(Array.from(bodyLinks));
+
+            if (allCafeLinks.length > 0) {
+                var rect = allCafeLinks[0].getBoundingClientRect();
+                var top = rect.top + window.scrollY;
+                return Math.round(top / pageHeight * 1000) / 10;
+            }
+            return null;
+        """)
+        result['first_cafe_y_pct'] = first_cafe_y_pct
+
+        # 6. 글 단위 측정: 정규화된 target_urls에 대해 block_position, post_y_pct 측정
+        if target_urls:
+            # JavaScript로 한 번에 모든 링크 측정 (성능상 유리)
+            all_links_data = driver.execute_script("""
                 var pageHeight = document.body.scrollHeight;
-                // _fsolid_head, _fsolid_body 각각의 링크 중 cafe.naver.com URL 찾기
-                var headLinks = document.querySelectorAll('._fsolid_head a[href*="cafe.naver.com"]');
-                var bodyLinks = document.querySelectorAll('._fsolid_body a[href*="cafe.naver.com"]');
-                var allCafeLinks = Array.from(headLinks).concat(Array.from(bodyLinks));
-
-                if (allCafeLinks.length > 0) {
-                    var rect = allCafeLinks[0].getBoundingClientRect();
-                    var top = rect.top + window.scrollY;
-                    return Math.round(top / pageHeight * 1000) / 10;
-                }
-                return null;
-            """)
-            result['first_cafe_y_pct'] = first_cafe_y_pct
-
-            # 6. 글 단위 측정: 정규화된 target_urls에 대해 block_position, post_y_pct 측정
-            if target_urls:
-                # JavaScript로 한 번에 모든 링크 측정 (성능상 유리)
-                all_links_data = driver.execute_script("""
-                    var pageHeight = document.body.scrollHeight;
-                    var linksData = [];
-
-                    function getBlockPosition(el) {
-                        var cur = el;
-                        while (cur) {
-                            var cls = cur.className || '';
-                            if (cls.indexOf('_fsolid_head') !== -1) return 'head';
-                            if (cls.indexOf('_fsolid_body') !== -1) return 'body';
-                            cur = cur.parentElement;
-                        }
-                        return 'single';
+                var linksData = [];
+
+                function getBlockPosition(el) {
+                    var cur = el;
+                    while (cur) {
+                        var cls = cur.className || '';
+                        if (cls.indexOf('_fsolid_head') !== -1) return 'head';
+                        if (cls.indexOf('_fsolid_body') !== -1) return 'body';
+                        cur = cur.parentElement;
                     }
+                    return 'single';
+                }
 
-                    function normalizeUrl(url) {
-                        // ?: 쿼리 파라미터 제거
-                        var base = url.split('?')[0];
-                        // JWT 토큰(=token) 제거
-                        if ((base.indexOf('cafe.naver.com') !== -1 || base.indexOf('blog.naver.com') !== -1) && base.indexOf('=') !== -1) {
-                            base = base.split('=')[0];
-                        }
-                        return base;
+                function normalizeUrl(url) {
+                    // ?: 쿼리 파라미터 제거
+                    var base = url.split('?')[0];
+                    // JWT 토큰(=token) 제거
+                    if ((base.indexOf('cafe.naver.com') !== -1 || base.indexOf('blog.naver.com') !== -1) && base.indexOf('=') !== -1) {
+                        base = base.split('=')[0];
                     }
+                    return base;
+                }
 
-                    // 모든 a 태그 순회
-                    var allLinks = document.querySelectorAll('a[href*="cafe.naver.com"], a[href*="blog.naver.com"]');
-                    allLinks.forEach(function(link) {
-                        var href = link.getAttribute('href') || '';
-                        var rect = link.getBoundingClientRect();
-                        var top = rect.top + window.scrollY;
-                        var yPct = Math.round(top / pageHeight * 1000) / 10;
-                        var blockPos = getBlockPosition(link);
-
-                        linksData.push({
-                            url: normalizeUrl(href),
-                            block_position: blockPos,
-                            post_y_pct: yPct > 0 ? yPct : null
-                        });
+                // 모든 a 태그 순회
+                var allLinks = document.querySelectorAll('a[href*="cafe.naver.com"], a[href*="blog.naver.com"]');
+                allLinks.forEach(function(link) {
+                    var href = link.getAttribute('href') || '';
+                    var rect = link.getBoundingClientRect();
+                    var top = rect.top + window.scrollY;
+                    var yPct = Math.round(top / pageHeight * 1000) / 10;
+                    var blockPos = getBlockPosition(link);
+
+                    linksData.push({
+                        url: normalizeUrl(href),
+                        block_position: blockPos,
+                        post_y_pct: yPct > 0 ? yPct : null
                     });
+                });
 
-                    return linksData;
-                """)
-
-                # 측정된 링크와 target_urls 매칭
-                for link_data in all_links_data:
-                    link_url = link_data['url']
-                    for target_url in target_urls:
-                        if self.normalize_url(target_url) == self.normalize_url(link_url):
-                            result['url_metrics'][target_url] = {
-                                'block_position': link_data['block_position'],
-                                'post_y_pct': link_data['post_y_pct']
-                            }
-                            break
-
-            logging.info(f"레이아웃 측정 완료 '{keyword}': has_split={result['has_split_block']}, first_pct={result['first_cafe_y_pct']}")
-            return result
+                return linksData;
+            """)
 
-        except Exception as e:
-            logging.warning(f"레이아웃 측정 예외 '{keyword}': {e}")
-            return result
\ No newline at end of file
+            # 측정된 링크와 target_urls 매칭
+            for link_data in all_links_data:
+                link_url = link_data['url']
+                for target_url in target_urls:
+                    if self.normalize_url(target_url) == self.normalize_url(link_url):
+                        result['url_metrics'][target_url] = {
+                            'block_position': link_data['block_position'],
+                            'post_y_pct': link_data['post_y_pct']
+                        }
+                        break
+
+        logging.info(f"레이아웃 측정 완료 '{keyword}': has_split={result['has_split_block']}, first_pct={result['first_cafe_y_pct']}")
+        return result
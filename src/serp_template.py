@@ -0,0 +1,131 @@
+"""
+검색 결과 페이지 템플릿 지문 + 버전별 메인 URL 추출기 선택
+- 지문: ParsedSerp 를 만들 때 함께 모은 표식(data-heatmap-target 값 종류, ugcItem, 섹션 제목 등)의 조합
+  (추가 탐색 없이 ParsedSerp.fingerprint 로 제공)
+- 추출기는 버전별로 등록하고, 각자 지문에 있어야 하는 표식을 가짐 → 조건에 맞는 첫 추출기(최신 우선)로 바로 추출
+  (.link 로 먼저 찾아보고 없으면 다시 폴백으로 찾는 시행착오 없음)
+- 지문 → 추출기 선택 결과는 캐시 (같은 템플릿이면 키워드마다 다시 판단하지 않음)
+- 최신 추출기로 처리할 수 없는 지문(네이버 HTML 구조 변경 의심)은 키워드마다가 아니라 회차마다 지문별 1회만 경고
+"""
+
+import logging
+import threading
+from typing import Callable, List, Optional
+
+
+class SerpExtractor:
+    """메인 노출 URL 추출기 1개 버전"""
+
+    def __init__(self, name: str, requires_any, extract: Callable, current: bool = True):
+        """
+        Args:
+            name: 버전 이름 (통계/로그용)
+            requires_any: 지문에 이 중 하나라도 있으면 사용 가능한 표식들
+            extract: (ParsedSerp) -> 메인 노출 href 목록
+            current: 현재 네이버 템플릿용 추출기 여부 (False면 구버전/폴백 — 선택되면 구조 변경 경고)
+        """
+        self.name = name
+        self.requires_any = frozenset(requires_any)
+        self.extract = extract
+        self.current = current
+
+    def matches(self, markers: frozenset) -> bool:
+        return bool(self.requires_any & markers)
+
+
+# 기본 추출기 (최신 우선)
+DEFAULT_EXTRACTORS = (
+    # data-heatmap-target=".link"/".imgtitlelink" (관련 경험 카페글 섹션 제외)
+    SerpExtractor('heatmap-link-v2', ('link', 'imgtitlelink'), lambda parsed: parsed.main_links),
+    # 구버전/변경된 템플릿: .series 를 뺀 모든 data-heatmap-target 링크 중 naver.com
+    SerpExtractor('heatmap-any-v1', ('heatmap',), lambda parsed: parsed.fallback_links, current=False),
+)
+
+
+class TemplateRegistry:
+    """지문별 추출기 선택 + 캐시 + 회차별 미확인 지문 경고 (스레드 안전)"""
+
+    def __init__(self, extractors=DEFAULT_EXTRACTORS):
+        self._lock = threading.Lock()
+        self._extractors: List[SerpExtractor] = list(extractors)
+        self._cache = {}
+        self._flagged = set()
+        self._stats = {
+            'dispatched': 0,
+            'cache_misses': 0,
+            'unknown': 0,
+        }
+        self._by_extractor = {}
+        self._unknown_fingerprints = {}
+
+    def register(self, extractor: SerpExtractor):
+        """새 버전 추출기 등록 (기존 추출기보다 우선, 지문 캐시 초기화)"""
+        with self._lock:
+            self._extractors.insert(0, extractor)
+            self._cache.clear()
+
+    def extractor_for(self, fingerprint: str) -> Optional[SerpExtractor]:
+        """지문에 맞는 추출기 (없으면 None, 결과는 캐시)"""
+        with self._lock:
+            if fingerprint in self._cache:
+                return self._cache[fingerprint]
+            self._stats['cache_misses'] += 1
+            markers = frozenset(fingerprint.split('+')) if fingerprint else frozenset()
+            extractor = next((e for e in self._extractors if e.matches(markers)), None)
+            self._cache[fingerprint] = extractor
+            return extractor
+
+    def extract_main_links(self, parsed) -> List[str]:
+        """ParsedSerp 의 지문으로 추출기를 골라 메인 노출 href 목록 반환 (맞는 추출기가 없으면 빈 목록)"""
+        fingerprint = parsed.fingerprint
+        extractor = self.extractor_for(fingerprint)
+        known = extractor is not None and extractor.current
+        with self._lock:
+            self._stats['dispatched'] += 1
+            name = extractor.name if extractor else None
+            self._by_extractor[name] = self._by_extractor.get(name, 0) + 1
+            if not known:
+                self._stats['unknown'] += 1
+                self._unknown_fingerprints[fingerprint] = self._unknown_fingerprints.get(fingerprint, 0) + 1
+                first_in_cycle = fingerprint not in self._flagged
+                self._flagged.add(fingerprint)
+            else:
+                first_in_cycle = False
+        if first_in_cycle:
+            logging.warning(
+                f"검색 결과 템플릿 미확인 지문 '{fingerprint or '(표식 없음)'}' — 네이버 HTML 구조 변경 의심, "
+                f"{'추출기 ' + name + ' 사용' if extractor else '맞는 추출기 없음'} (이번 회차에는 다시 경고하지 않음)"
+            )
+        return extractor.extract(parsed) if extractor else []
+
+    def start_cycle(self):
+        """순찰 회차 시작 — 미확인 지문 경고를 다시 1회씩 허용"""
+        with self._lock:
+            self._flagged.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            {
+                'dispatched', 'cache_misses', 'unknown',
+                'by_extractor': {추출기 이름(없으면 None): 건수},
+                'unknown_fingerprints': {지문: 건수},
+            }
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['by_extractor'] = dict(self._by_extractor)
+            stats['unknown_fingerprints'] = dict(self._unknown_fingerprints)
+        return stats
+
+    def log_stats(self):
+        s = self.stats()
+        if not s['dispatched']:
+            return
+        by_extractor = ', '.join(f"{name or '없음'} {count}건" for name, count in s['by_extractor'].items())
+        logging.info(
+            f"검색 결과 템플릿 통계: 추출 {s['dispatched']}건 ({by_extractor}), "
+            f"지문 판정 {s['cache_misses']}회, 미확인 지문 {s['unknown']}건"
+        )
+        for fingerprint, count in s['unknown_fingerprints'].items():
+            logging.info(f"  미확인 지문 '{fingerprint or '(표식 없음)'}': {count}건")
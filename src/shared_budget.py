@@ -0,0 +1,199 @@
+"""
+프로세스 간 공유 요청 예산 (SQLite 토큰 버킷)
+같은 PC에서 여러 순찰 프로세스(GUI 카페/블로그 모드, 순위 분석, 스케줄러)가 동시에 돌 때
+예산(search / cafe / blog)별 전체 요청 속도가 SHARED_BUDGET_RATES 를 넘지 않도록 조정.
+SQLite의 BEGIN IMMEDIATE 잠금으로 프로세스 간 토큰 차감을 직렬화하고,
+프로세스별 사용량을 함께 기록 (main.py --budget-stats 로 확인).
+"""
+
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from src.config import SHARED_BUDGET_PATH, SHARED_BUDGET_RATES, SHARED_BUDGET_BURST
+from src.process_tree import pid_alive
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS consumption (
+    pid INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    label TEXT NOT NULL,
+    requests INTEGER NOT NULL,
+    waited_seconds REAL NOT NULL,
+    first_at REAL NOT NULL,
+    last_at REAL NOT NULL,
+    PRIMARY KEY (pid, name)
+);
+"""
+
+# 토큰이 없을 때 한 번에 기다리는 최대 시간 (다른 프로세스가 속도를 바꿔도 빨리 반영되도록)
+_MAX_SLEEP = 1.0
+
+
+class SharedRequestBudget:
+    """SQLite 파일로 공유하는 예산별 토큰 버킷"""
+
+    def __init__(self, path: str = SHARED_BUDGET_PATH, rates: Optional[Dict[str, float]] = None,
+                 burst: float = SHARED_BUDGET_BURST, label: Optional[str] = None, prune_on_open: bool = True):
+        """
+        Args:
+            path: SQLite 파일 경로 (같은 파일을 쓰는 프로세스끼리 예산 공유)
+            rates: {예산 이름: 초당 허용 요청 수}
+            burst: 버킷 크기 (쉬었다가 한 번에 보낼 수 있는 요청 수)
+            label: 통계에 표시할 프로세스 이름 (기본: 실행 스크립트 이름)
+            prune_on_open: True면 파일을 열 때 오래된 프로세스 사용량 기록 정리 (프로세스마다 1회)
+        """
+        self.path = path
+        self.rates = dict(rates or SHARED_BUDGET_RATES)
+        self.burst = max(1.0, burst)
+        self.label = label or os.path.basename(sys.argv[0] or 'python')
+        self.pid = os.getpid()
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+        if prune_on_open:
+            try:
+                self.prune()
+            except sqlite3.Error as e:
+                logging.warning(f"공유 요청 예산 사용 기록 정리 실패: {e}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 연결 (트랜잭션은 직접 BEGIN IMMEDIATE 로 시작)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def _refill(self, conn, name: str, now: float) -> float:
+        """버킷을 현재 시각 기준으로 채운 토큰 수 반환 (트랜잭션 안에서 호출)"""
+        row = conn.execute('SELECT tokens, updated_at FROM buckets WHERE name = ?', (name,)).fetchone()
+        if row is None:
+            return self.burst
+        tokens, updated_at = row
+        return min(self.burst, tokens + max(0.0, now - updated_at) * self.rates[name])
+
+    def acquire(self, name: str) -> float:
+        """
+        예산 name에서 토큰 1개를 차감 (없으면 생길 때까지 대기)
+
+        Args:
+            name: 예산 이름 (rates 에 없는 이름이면 대기 없이 통과)
+
+        Returns:
+            대기한 시간 (초)
+        """
+        if self.rates.get(name, 0) <= 0:
+            return 0.0
+        started = time.monotonic()
+        while True:
+            granted, tokens = self._take(name, started)
+            if granted:
+                return time.monotonic() - started
+            time.sleep(min(_MAX_SLEEP, (1.0 - tokens) / self.rates[name]))
+
+    def try_acquire(self, name: str) -> bool:
+        """예산 name에 토큰이 지금 있으면 1개 차감하고 True (대기 없음 — 헤지 요청 등 생략 가능한 요청용)"""
+        if self.rates.get(name, 0) <= 0:
+            return True
+        return self._take(name, time.monotonic())[0]
+
+    def _take(self, name: str, started: float) -> Tuple[bool, float]:
+        """토큰 1개 차감 시도 (한 트랜잭션). 반환값: (받았는지, 남은 토큰 수)"""
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            now = time.time()
+            tokens = self._refill(conn, name, now)
+            granted = tokens >= 1.0
+            if granted:
+                tokens -= 1.0
+                conn.execute(
+                    'INSERT INTO consumption (pid, name, label, requests, waited_seconds, first_at, last_at) '
+                    'VALUES (?, ?, ?, 1, ?, ?, ?) '
+                    'ON CONFLICT(pid, name) DO UPDATE SET requests = requests + 1, '
+                    'waited_seconds = waited_seconds + excluded.waited_seconds, last_at = excluded.last_at',
+                    (self.pid, name, self.label, time.monotonic() - started, now, now),
+                )
+            conn.execute(
+                'INSERT INTO buckets (name, tokens, updated_at) VALUES (?, ?, ?) '
+                'ON CONFLICT(name) DO UPDATE SET tokens = excluded.tokens, updated_at = excluded.updated_at',
+                (name, tokens, now),
+            )
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        return granted, tokens
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            {
+                'buckets': {예산 이름: {'tokens', 'rate', 'burst'}},
+                'processes': [{'pid', 'label', 'name', 'requests', 'waited_seconds', 'last_at', 'alive'}, ...],
+            }
+        """
+        conn = self._connect()
+        now = time.time()
+        buckets = {}
+        for name, rate in self.rates.items():
+            buckets[name] = {'tokens': round(self._refill(conn, name, now), 2), 'rate': rate, 'burst': self.burst}
+        processes = []
+        for pid, name, label, requests, waited, last_at in conn.execute(
+                'SELECT pid, name, label, requests, waited_seconds, last_at FROM consumption ORDER BY last_at DESC'):
+            processes.append({
+                'pid': pid, 'label': label, 'name': name, 'requests': requests,
+                'waited_seconds': round(waited, 2), 'last_at': last_at, 'alive': pid_alive(pid),
+            })
+        return {'buckets': buckets, 'processes': processes}
+
+    def prune(self, older_than: float = 7 * 86400) -> int:
+        """오래된(종료된) 프로세스 사용량 기록 삭제. 반환값: 삭제한 행 수"""
+        conn = self._connect()
+        cur = conn.execute('DELETE FROM consumption WHERE last_at < ?', (time.time() - older_than,))
+        return cur.rowcount
+
+    def print_stats(self):
+        """현재 토큰 잔량과 프로세스별 사용량 출력 (main.py --budget-stats)"""
+        stats = self.stats()
+        print(f"공유 요청 예산: {self.path}")
+        print(f"{'예산':<8} {'토큰':>6} {'초당':>6} {'버킷':>6}")
+        for name, b in stats['buckets'].items():
+            print(f"{name:<8} {b['tokens']:>6} {b['rate']:>6} {b['burst']:>6}")
+        if not stats['processes']:
+            print("프로세스 사용 기록 없음")
+            return
+        print(f"\n{'PID':>7} {'프로세스':<16} {'예산':<7} {'요청':>7} {'대기(초)':>9}  마지막 요청          상태")
+        for p in stats['processes']:
+            last = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(p['last_at']))
+            alive = {True: '실행 중', False: '종료', None: '-'}[p['alive']]
+            print(f"{p['pid']:>7} {p['label']:<16} {p['name']:<7} {p['requests']:>7} "
+                  f"{p['waited_seconds']:>9}  {last}  {alive}")
+
+
+_shared_budget = None
+_shared_budget_lock = threading.Lock()
+
+
+def get_shared_budget() -> Optional[SharedRequestBudget]:
+    """프로세스 공용 SharedRequestBudget (파일을 열 수 없으면 None — 공유 없이 동작)"""
+    global _shared_budget
+    with _shared_budget_lock:
+        if _shared_budget is None:
+            try:
+                _shared_budget = SharedRequestBudget()
+            except (OSError, sqlite3.Error) as e:
+                logging.warning(f"공유 요청 예산 파일을 열 수 없어 프로세스 단독 페이싱으로 동작: {e}")
+                _shared_budget = False
+        return _shared_budget or None
@@ -0,0 +1,296 @@
+"""
+검색 요청용 HTTP 전송 계층
+- keep-alive 커넥션 풀 재사용 (TCP/TLS 핸드셰이크 절약)
+- 요청마다 빈 쿠키 상태 유지 ("처음 방문자" 상태 보장)
+- gzip/deflate(및 brotli 설치 시 br) 압축 응답 허용
+- 전송 바이트 수 / 커넥션 재사용률 집계
+- 스트리밍 수신 중 바이트 마커 검사 (봇 차단 조기 판정, 필요한 구간 수신 후 조기 종료)
+"""
+
+import logging
+import threading
+import time
+import weakref
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar
+from requests.utils import get_encoding_from_headers
+from urllib3.util.request import ACCEPT_ENCODING
+
+from src.config import HTTP_POOL_SIZE
+
+
+class _RejectAllCookiesPolicy(DefaultCookiePolicy):
+    """응답 쿠키를 저장하지도, 요청에 싣지도 않는 쿠키 정책"""
+
+    def set_ok(self, cookie, request):
+        return False
+
+    def return_ok(self, cookie, request):
+        return False
+
+
+class SearchTransport:
+    """커넥션 풀은 공유하되 쿠키는 요청 간에 공유하지 않는 HTTP 클라이언트"""
+
+    def __init__(self, pool_size: int = HTTP_POOL_SIZE):
+        """
+        Args:
+            pool_size: 호스트당 유지할 keep-alive 커넥션 수
+        """
+        self._adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session = requests.Session()
+        self.session.mount('https://', self._adapter)
+        self.session.mount('http://', self._adapter)
+        # 세션 쿠키 저장소는 항상 비어 있음 → 매 요청이 새 세션과 동일한 쿠키 상태
+        self.session.cookies = RequestsCookieJar(policy=_RejectAllCookiesPolicy())
+
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._wire_bytes = 0
+        self._decoded_bytes = 0
+        self._streamed = 0
+        self._stream_stopped_early = 0
+        self._stream_drained = 0
+        self._drained_bytes = 0
+        self._stream_without_markers = 0
+        # 스트리밍 요청이 쓴 소켓 — 같은 소켓이면 재사용 (urllib3 커넥션 카운터는 닫힌 뒤 다시 맺은 연결을 세지 않음)
+        self._stream_sockets = weakref.WeakSet()
+        self._stream_socket_reused = 0
+
+    @property
+    def accept_encoding(self) -> str:
+        """urllib3가 해제할 수 있는 압축 방식 (brotli 패키지가 있으면 br 포함)"""
+        return ACCEPT_ENCODING
+
+    @staticmethod
+    def body_encoding(response: requests.Response) -> str:
+        """응답 헤더의 charset (없거나 requests 기본값 ISO-8859-1이면 UTF-8)"""
+        encoding = get_encoding_from_headers(response.headers)
+        if not encoding or encoding.upper() == 'ISO-8859-1':
+            encoding = 'utf-8'
+        return encoding
+
+    @classmethod
+    def decode_body(cls, response: requests.Response) -> str:
+        """
+        응답 본문을 문자열로 변환.
+        requests의 response.text 는 헤더에 charset이 없으면 전체 본문으로 인코딩을 추정하므로
+        헤더 charset(없으면 UTF-8)으로 바로 디코딩.
+        """
+        return response.content.decode(cls.body_encoding(response), errors='replace')
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> requests.Response:
+        """
+        GET 요청 (쿠키 없이, 풀링된 커넥션 사용)
+
+        Args:
+            url: 요청 URL
+            headers: 요청 헤더 (Accept-Encoding 미지정 시 압축 허용 헤더 추가)
+            **kwargs: requests.Session.get 에 그대로 전달 (timeout 등)
+        """
+        headers = dict(headers or {})
+        headers.setdefault('Accept-Encoding', self.accept_encoding)
+        response = self.session.get(url, headers=headers, **kwargs)
+        if not kwargs.get('stream'):
+            self.record(response)
+        return response
+
+    def get_streaming(self, url: str, accept_markers: Iterable[bytes], stop_markers: Iterable[bytes] = (),
+                      headers: Optional[Dict[str, str]] = None, chunk_size: int = 16 * 1024,
+                      total_timeout: Optional[float] = None, drain_bytes: int = 0,
+                      **kwargs) -> Tuple[bytes, Set[bytes], str]:
+        """
+        응답 본문을 청크 단위로 받으면서 바이트 마커를 검사하는 GET 요청.
+        accept_markers 중 하나라도 나온 뒤 stop_markers 가 나오면 나머지 본문은 결과에 넣지 않음.
+        나머지가 drain_bytes 이하면 마저 받아 버리고 커넥션을 풀에 반환, 넘으면 커넥션을 닫음
+        (닫힌 커넥션은 다음 요청에서 TCP/TLS 연결을 새로 맺음 — 재사용률은 stats() 로 확인)
+
+        Args:
+            url: 요청 URL
+            accept_markers: 정상 페이지 판정용 바이트 마커 (압축 해제된 본문 기준)
+            stop_markers: 이 마커 이후 본문은 필요 없음을 나타내는 바이트 마커
+            headers: 요청 헤더
+            chunk_size: 한 번에 읽을 바이트 수
+            total_timeout: 본문 전체 수신 제한 시간 (초, None이면 제한 없음)
+                           -- timeout 의 read 값은 청크 사이 대기 시간이라 느리게 흘러오는 응답은 막지 못함
+            drain_bytes: 조기 종료 후 커넥션 재사용을 위해 마저 받을 최대 바이트 수 (압축 해제 기준, 0이면 바로 닫음)
+            **kwargs: requests.Session.get 에 그대로 전달 (timeout 등)
+
+        Returns:
+            (본문 bytes, 발견된 accept_markers 집합, 본문 인코딩)
+            -- 집합이 비어 있으면 정상 페이지 마커가 전혀 없는 것 (파싱 없이 차단 판정 가능)
+
+        Raises:
+            requests.HTTPError: 4xx/5xx 응답 (본문을 읽기 전에 발생)
+            requests.Timeout: 연결/응답 대기 또는 total_timeout 초과
+        """
+        accept_markers = tuple(accept_markers)
+        stop_markers = tuple(stop_markers)
+        overlap = max(len(m) for m in accept_markers + stop_markers) - 1
+
+        started = time.monotonic()
+        response = self.get(url, headers=headers, stream=True, **kwargs)
+        self._note_socket(response)
+        body = bytearray()
+        found = set()
+        stopped_early = False
+        drained = None
+        try:
+            response.raise_for_status()
+            chunks = response.iter_content(chunk_size=chunk_size)
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                # 청크 경계에 걸친 마커도 찾도록 직전 청크 끝부분과 이어서 검사
+                window = bytes(body[-overlap:]) + chunk if overlap > 0 else chunk
+                body.extend(chunk)
+                for marker in accept_markers:
+                    if marker not in found and marker in window:
+                        found.add(marker)
+                if found and any(marker in window for marker in stop_markers):
+                    stopped_early = True
+                    break
+                if total_timeout is not None and time.monotonic() - started > total_timeout:
+                    raise requests.exceptions.ReadTimeout(
+                        f"본문 수신 {total_timeout:.0f}초 초과 ({len(body)} bytes 수신)")
+            if stopped_early and drain_bytes > 0:
+                drained = self._drain(chunks, drain_bytes, started, total_timeout)
+        finally:
+            try:
+                wire_bytes = response.raw.tell()
+            except Exception:
+                wire_bytes = len(body)
+            response.close()
+            with self._lock:
+                self._requests += 1
+                self._wire_bytes += wire_bytes
+                self._decoded_bytes += len(body)
+                self._streamed += 1
+                if stopped_early:
+                    self._stream_stopped_early += 1
+                    if drained is not None:
+                        self._stream_drained += 1
+                        self._drained_bytes += drained
+                elif not found:
+                    self._stream_without_markers += 1
+
+        return bytes(body), found, self.body_encoding(response)
+
+    def _note_socket(self, response: requests.Response):
+        """응답을 받은 소켓이 이전 스트리밍 요청에서 쓴 소켓인지 기록 (새 TCP/TLS 연결 여부)"""
+        connection = getattr(response.raw, '_connection', None)
+        sock = getattr(connection, 'sock', None)
+        if sock is None:
+            return
+        with self._lock:
+            if sock in self._stream_sockets:
+                self._stream_socket_reused += 1
+            else:
+                self._stream_sockets.add(sock)
+
+    @staticmethod
+    def _drain(chunks, limit: int, started: float, total_timeout: Optional[float]) -> Optional[int]:
+        """
+        남은 본문을 끝까지 읽어 버림 (끝까지 읽은 응답만 close() 시 커넥션이 풀로 돌아감)
+
+        Returns:
+            읽어 버린 바이트 수 — limit/total_timeout 을 넘거나 오류가 나면 None (커넥션은 닫힘)
+        """
+        drained = 0
+        try:
+            for chunk in chunks:
+                drained += len(chunk)
+                if drained > limit or (total_timeout is not None and time.monotonic() - started > total_timeout):
+                    return None
+        except requests.RequestException:
+            return None
+        return drained
+
+    def record(self, response: requests.Response, wire_bytes: Optional[int] = None):
+        """
+        응답 1건의 전송량을 통계에 반영
+
+        Args:
+            response: 본문까지 읽은 응답
+            wire_bytes: 실제 수신 바이트 수 (None이면 urllib3 응답 객체에서 조회)
+        """
+        if wire_bytes is None:
+            try:
+                wire_bytes = response.raw.tell()
+            except Exception:
+                wire_bytes = len(response.content)
+        try:
+            decoded_bytes = len(response.content)
+        except Exception:
+            decoded_bytes = wire_bytes
+
+        with self._lock:
+            self._requests += 1
+            self._wire_bytes += wire_bytes
+            self._decoded_bytes += decoded_bytes
+
+    def stats(self) -> dict:
+        """
+        전송 통계 반환 (커넥션 수는 urllib3 호스트별 커넥션 풀 카운터 합계)
+
+        Returns:
+            {
+                'requests': 요청 수,
+                'wire_bytes': 실제 수신 바이트 (압축 상태),
+                'decoded_bytes': 압축 해제 후 바이트,
+                'compression_ratio': wire_bytes / decoded_bytes,
+                'new_connections': 새로 연 커넥션 수,
+                'connection_reuse_rate': 커넥션 재사용 비율 (0~1, 닫힌 뒤 다시 맺은 연결은 세지 않음 —
+                                         스트리밍 요청은 stream_socket_reuse_rate 가 실제 재사용 비율),
+                'streamed': 스트리밍 수신 요청 수,
+                'stream_stopped_early': 필요한 구간만 받고 조기 종료한 수,
+                'stream_drained': 조기 종료 후 나머지를 받아 커넥션을 풀에 돌려준 수 (나머지는 닫음),
+                'drained_bytes': 커넥션 재사용을 위해 받아 버린 바이트 (압축 해제 기준),
+                'stream_socket_reuse_rate': 스트리밍 요청 중 이전 소켓(TCP/TLS 연결)을 그대로 쓴 비율 (0~1),
+                'stream_without_markers': 정상 페이지 마커 없이 끝난 수 (파싱 없이 차단 판정),
+            }
+        """
+        pool_container = self._adapter.poolmanager.pools
+        pools = [pool for pool in (pool_container.get(key) for key in pool_container.keys()) if pool is not None]
+        with self._lock:
+            pool_requests = sum(getattr(p, 'num_requests', 0) for p in pools)
+            new_connections = sum(getattr(p, 'num_connections', 0) for p in pools)
+            return {
+                'requests': self._requests,
+                'wire_bytes': self._wire_bytes,
+                'decoded_bytes': self._decoded_bytes,
+                'compression_ratio': round(self._wire_bytes / self._decoded_bytes, 3) if self._decoded_bytes else None,
+                'new_connections': new_connections,
+                'connection_reuse_rate': round(1 - new_connections / pool_requests, 3) if pool_requests else None,
+                'streamed': self._streamed,
+                'stream_stopped_early': self._stream_stopped_early,
+                'stream_drained': self._stream_drained,
+                'drained_bytes': self._drained_bytes,
+                'stream_socket_reuse_rate': (round(self._stream_socket_reused / self._streamed, 3)
+                                             if self._streamed else None),
+                'stream_without_markers': self._stream_without_markers,
+            }
+
+    def log_stats(self):
+        """전송 통계를 로그로 출력"""
+        s = self.stats()
+        logging.info(
+            f"검색 전송 통계: 요청 {s['requests']}건, 수신 {s['wire_bytes']:,}B "
+            f"(압축 해제 {s['decoded_bytes']:,}B), 새 커넥션 {s['new_connections']}개, "
+            f"재사용률 {s['connection_reuse_rate']}"
+        )
+        if s['streamed']:
+            logging.info(
+                f"스트리밍 수신 {s['streamed']}건: 조기 종료 {s['stream_stopped_early']}건 "
+                f"(나머지 수신 후 커넥션 재사용 {s['stream_drained']}건/{s['drained_bytes']:,}B, "
+                f"커넥션 닫음 {s['stream_stopped_early'] - s['stream_drained']}건), "
+                f"마커 없음(파싱 생략) {s['stream_without_markers']}건, 소켓 재사용률 {s['stream_socket_reuse_rate']}"
+            )
+
+    def close(self):
+        """풀링된 커넥션 정리"""
+        self.session.close()
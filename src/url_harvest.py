@@ -0,0 +1,157 @@
+"""
+검색 결과 페이지 전체 URL 수집 (NaverScraper.extract_urls — 경쟁 글 추적용 전체 SERP 수집)
+기존 방식은 a 태그 속성 / nocr 요소 / 다중 클래스 div / 키워드 텍스트 주변(부모, 조부모)을 각각 전체 트리에서 다시 찾고,
+찾은 요소마다 하위 링크를 다시 find_all 해서 큰 페이지에서는 요소 수의 제곱에 비례해 느려짐.
+
+여기서는 트리를 한 번만 전위 순회하며
+- 요소마다 전위 번호와 하위 트리 끝 번호를 기록 → "요소 X 안의 링크" = href 링크 목록의 연속 구간
+- 이미 결과에 낸 링크는 건너뛰기 포인터로 다시 보지 않음 (같은 링크를 다시 내도 결과는 그대로이므로)
+이라서 전체 작업량이 노드 수에 비례. 결과 URL 과 순서는 기존 방식과 동일.
+"""
+
+import logging
+import time
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+
+from bs4 import NavigableString, Tag
+
+from src.config import EXTRACT_URLS_BUDGET
+
+# 주변 링크를 찾을 텍스트 키워드 (기존 순서 유지 — 결과 순서에 영향)
+TEXT_KEYWORDS = ("cafe", "blog", "카페", "블로그", "지식인", "포스트", "뉴스")
+
+# 순회 중 제한 시간 확인 간격 (노드 수)
+_BUDGET_CHECK_EVERY = 2048
+
+
+class _LinkRanges:
+    """전위 번호순 href 링크 목록 + 이미 낸 링크 건너뛰기 (경로 압축 포인터)"""
+
+    def __init__(self, positions: List[int], hrefs: List[str]):
+        self.positions = positions
+        self.hrefs = hrefs
+        self._next = list(range(len(positions) + 1))
+
+    def _find(self, i: int) -> int:
+        root = i
+        while self._next[root] != root:
+            root = self._next[root]
+        while self._next[i] != root:
+            self._next[i], i = root, self._next[i]
+        return root
+
+    def take(self, start: int, end: int, naver_only: bool, out: List[str]):
+        """전위 번호 (start, end) 구간(start 요소 자신 제외)의 아직 안 낸 링크 href 를 out 에 추가"""
+        i = self._find(bisect_right(self.positions, start))
+        while i < len(self.positions) and self.positions[i] < end:
+            href = self.hrefs[i]
+            if not naver_only or 'naver.com' in href:
+                out.append(href)
+            self._next[i] = i + 1
+            i = self._find(i + 1)
+
+    def take_one(self, position: int, out: List[str]):
+        """전위 번호 position 인 링크 href 를 out 에 추가"""
+        i = bisect_right(self.positions, position) - 1
+        out.append(self.hrefs[i])
+        if self._find(i) == i:
+            self._next[i] = i + 1
+
+
+def harvest_urls(soup, budget: Optional[float] = EXTRACT_URLS_BUDGET) -> Tuple[List[str], bool]:
+    """
+    BeautifulSoup 트리에서 네이버 URL 후보를 기존 extract_urls 와 같은 순서로 수집 (정규화/중복 제거 전)
+
+    Args:
+        soup: BeautifulSoup (html.parser) 트리
+        budget: 페이지당 제한 시간 (초, None/0이면 무제한) — 넘으면 그때까지 모은 URL 만 반환
+
+    Returns:
+        (URL 목록, 제한 시간 안에 끝까지 수집했는지 여부)
+    """
+    deadline = time.monotonic() + budget if budget else None
+    attr_urls = []                                   # 1) a 태그 속성
+    nocr = []                                        # 2) nocr 요소 (전위 번호, a[href] 여부)
+    containers = []                                  # 3) 클래스 2개 이상 div
+    keyword_parents = {k: [] for k in TEXT_KEYWORDS}  # 4) 키워드 텍스트의 부모 요소 전위 번호
+    link_positions, link_hrefs = [], []
+    ends = [0]       # 전위 번호 → 하위 트리 끝 번호 (0번은 문서 자체)
+    parents = [-1]   # 전위 번호 → 부모 전위 번호
+
+    # 단일 전위 순회 (명시적 스택)
+    stack = [(0, iter(soup.contents))]
+    visited = 0
+    while stack:
+        parent_index, children = stack[-1]
+        node = next(children, None)
+        if node is None:
+            stack.pop()
+            ends[parent_index] = len(ends)
+            continue
+        visited += 1
+        if deadline and visited % _BUDGET_CHECK_EVERY == 0 and time.monotonic() > deadline:
+            logging.warning(f"extract_urls 제한 시간 초과 — 트리 순회 중 중단 (노드 {visited}개)")
+            return attr_urls, False
+
+        if isinstance(node, NavigableString):
+            if node:
+                text = node.lower()
+                for keyword in TEXT_KEYWORDS:
+                    if keyword in text:
+                        keyword_parents[keyword].append(parent_index)
+            continue
+        if not isinstance(node, Tag):
+            continue
+
+        index = len(ends)
+        ends.append(0)
+        parents.append(parent_index)
+        attrs = node.attrs
+        if node.name == 'a':
+            for value in attrs.values():
+                if isinstance(value, str) and ('http://' in value or 'https://' in value) and 'naver.com' in value:
+                    attr_urls.append(value)
+            if 'href' in attrs:
+                link_positions.append(index)
+                link_hrefs.append(attrs['href'])
+        if 'nocr' in attrs:
+            nocr.append((index, node.name == 'a' and 'href' in attrs))
+        if node.name == 'div' and len(attrs.get('class') or ()) >= 2:
+            containers.append(index)
+        stack.append((index, iter(node.contents)))
+
+    urls = attr_urls
+    links = _LinkRanges(link_positions, link_hrefs)
+
+    def over_budget(step: str) -> bool:
+        if deadline and time.monotonic() > deadline:
+            logging.warning(f"extract_urls 제한 시간 초과 — {step} 전에 중단")
+            return True
+        return False
+
+    # 2) nocr: a[href] 자신, 아니면 하위 a[href] 전부
+    if over_budget('nocr 요소'):
+        return urls, False
+    for index, is_link in nocr:
+        if is_link:
+            links.take_one(index, urls)
+        else:
+            links.take(index, ends[index], False, urls)
+
+    # 3) 다중 클래스 div 안의 naver.com 링크
+    if over_budget('컨테이너'):
+        return urls, False
+    for index in containers:
+        links.take(index, ends[index], True, urls)
+
+    # 4) 키워드 텍스트의 부모 / 조부모 요소 안의 naver.com 링크 (키워드 순서대로)
+    if over_budget('키워드 텍스트'):
+        return urls, False
+    for keyword in TEXT_KEYWORDS:
+        for parent_index in keyword_parents[keyword]:
+            links.take(parent_index, ends[parent_index], True, urls)
+            grandparent_index = parents[parent_index]
+            if grandparent_index >= 0:
+                links.take(grandparent_index, ends[grandparent_index], True, urls)
+    return urls, True
@@ -0,0 +1,251 @@
+"""
+게시글 삭제 확인 결과 캐시 (SQLite, 회차/프로세스 간 유지)
+정규화 URL 기준으로 마지막 판정을 보관해 같은 글을 다시 확인하지 않음.
+- 같은 회차 안에서 이미 확인한 URL은 다른 키워드에서 다시 나와도 재확인하지 않음
+- 살아있는 글은 처음 살아있음을 확인한 뒤 지난 기간 x VERDICT_TTL_RATIO 동안 재확인 생략
+  (최근 글은 자주, 오래 살아있던 글은 드물게 — VERDICT_TTL_MIN_HOURS ~ VERDICT_TTL_MAX_HOURS)
+- 노출되던 검색 결과에서 빠진 글은 invalidate() 로 캐시를 지워 이번 회차에 바로 재확인
+판정 불가(None) 결과는 저장하지 않음.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from src.config import (
+    VERDICT_CACHE, VERDICT_CACHE_PATH, VERDICT_TTL_MIN_HOURS, VERDICT_TTL_MAX_HOURS, VERDICT_TTL_RATIO,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verdicts (
+    url TEXT PRIMARY KEY,
+    is_deleted INTEGER NOT NULL,
+    message TEXT,
+    first_alive_at REAL,
+    checked_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+# 최대 TTL 의 이 배수만큼 확인되지 않은 항목은 회차 시작 시 삭제 (DB 에서 빠진 글)
+_PRUNE_FACTOR = 4
+
+
+class DeletionVerdictCache:
+    """정규화 URL → 마지막 삭제 판정 (살아있던 기간에 비례해 늘어나는 TTL)"""
+
+    def __init__(self, path: str = VERDICT_CACHE_PATH, enabled: bool = VERDICT_CACHE,
+                 ttl_min_hours: float = VERDICT_TTL_MIN_HOURS, ttl_max_hours: float = VERDICT_TTL_MAX_HOURS,
+                 ttl_ratio: float = VERDICT_TTL_RATIO, normalize: Optional[Callable[[str], str]] = None):
+        """
+        Args:
+            path: SQLite 파일 경로
+            enabled: False면 캐시 없이 매번 확인 (같은 호출 안의 중복 URL만 1회 확인)
+            ttl_min_hours / ttl_max_hours: 살아있는 글의 재확인 간격 범위 (시간)
+            ttl_ratio: 살아있던 기간 대비 재확인 간격 비율
+            normalize: URL 정규화 함수 (기본: NaverScraper.normalize_url)
+        """
+        if normalize is None:
+            from src.scraper import NaverScraper
+            normalize = NaverScraper.normalize_url
+        self.path = path
+        self.enabled = enabled
+        self.ttl_min = ttl_min_hours * 3600
+        self.ttl_max = max(self.ttl_min, ttl_max_hours * 3600)
+        self.ttl_ratio = ttl_ratio
+        self.normalize = normalize
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._cycle_started = time.time()
+        self._hits = 0
+        self._misses = 0
+        self._deduped = 0
+        self._invalidated = 0
+        self._stored = 0
+        if self.enabled:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                self._connect().executescript(_SCHEMA)
+            except (OSError, sqlite3.Error) as e:
+                logging.warning(f"삭제 확인 캐시 파일을 열 수 없어 캐시 없이 동작: {e}")
+                self.enabled = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 연결 (WAL — 다른 프로세스가 읽는 중에도 기록 가능)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def ttl_for(self, alive_seconds: float) -> float:
+        """살아있던 기간(초)에 대한 재확인 간격(초)"""
+        return min(self.ttl_max, max(self.ttl_min, alive_seconds * self.ttl_ratio))
+
+    def start_cycle(self):
+        """회차 시작 — 이 시각 이후 확인한 결과는 TTL 과 무관하게 이번 회차 동안 재사용"""
+        self._cycle_started = time.time()
+        if not self.enabled:
+            return
+        try:
+            cutoff = self._cycle_started - self.ttl_max * _PRUNE_FACTOR
+            self._connect().execute('DELETE FROM verdicts WHERE checked_at < ?', (cutoff,))
+        except sqlite3.Error as e:
+            logging.warning(f"삭제 확인 캐시 정리 실패: {e}")
+
+    def get(self, url: str) -> Optional[Tuple[bool, Optional[str]]]:
+        """유효한 캐시 판정 (is_deleted, message) — 없거나 만료됐으면 None"""
+        if not self.enabled or not url:
+            return None
+        key = self.normalize(url)
+        if not key:
+            return None
+        now = time.time()
+        row = self._connect().execute(
+            'SELECT is_deleted, message FROM verdicts WHERE url = ? AND (expires_at > ? OR checked_at >= ?)',
+            (key, now, self._cycle_started),
+        ).fetchone()
+        if row is None:
+            return None
+        return bool(row[0]), row[1]
+
+    def put_many(self, verdicts: Dict[str, Tuple[Optional[bool], Optional[str]]]):
+        """확인 결과 저장 (판정 불가 None 은 건너뜀, 한 트랜잭션으로 기록)"""
+        if not self.enabled:
+            return
+        now = time.time()
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            stored = 0
+            for url, (is_deleted, message) in verdicts.items():
+                key = self.normalize(url) if url else ''
+                if is_deleted is None or not key:
+                    continue
+                if is_deleted:
+                    first_alive_at, ttl = None, self.ttl_max
+                else:
+                    row = conn.execute(
+                        'SELECT first_alive_at FROM verdicts WHERE url = ? AND is_deleted = 0', (key,)
+                    ).fetchone()
+                    first_alive_at = row[0] if row and row[0] is not None else now
+                    ttl = self.ttl_for(now - first_alive_at)
+                conn.execute(
+                    'INSERT INTO verdicts (url, is_deleted, message, first_alive_at, checked_at, expires_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?) '
+                    'ON CONFLICT(url) DO UPDATE SET is_deleted = excluded.is_deleted, message = excluded.message, '
+                    'first_alive_at = excluded.first_alive_at, checked_at = excluded.checked_at, '
+                    'expires_at = excluded.expires_at',
+                    (key, int(is_deleted), message, first_alive_at, now, now + ttl),
+                )
+                stored += 1
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        with self._lock:
+            self._stored += stored
+
+    def invalidate(self, url: str) -> bool:
+        """
+        캐시 판정을 만료시켜 다음 확인 때 실제로 재확인 (노출되던 검색 결과에서 빠진 글)
+        이번 회차에 이미 확인한 결과는 유지 (같은 회차 중복 확인 방지)
+
+        Returns:
+            만료시킨 항목이 있으면 True
+        """
+        if not self.enabled or not url:
+            return False
+        key = self.normalize(url)
+        if not key:
+            return False
+        # 살아있던 기간(first_alive_at)은 유지해 재확인 후에도 TTL 이 처음부터 다시 시작되지 않도록 함
+        cur = self._connect().execute(
+            'UPDATE verdicts SET expires_at = 0 WHERE url = ? AND checked_at < ? AND expires_at > 0',
+            (key, self._cycle_started),
+        )
+        if cur.rowcount:
+            with self._lock:
+                self._invalidated += 1
+        return cur.rowcount > 0
+
+    def resolve(self, urls: List[str], check: Callable[[List[str]], dict]) -> Tuple[dict, Set[str]]:
+        """
+        캐시에 없는 URL만 check 로 확인하고 결과를 캐시에 저장
+
+        Args:
+            urls: URL 목록 (중복/빈 값 허용)
+            check: URL 목록 → {url: (is_deleted, message)} (예: NaverScraper.check_posts_deleted_parallel)
+
+        Returns:
+            ({url: (is_deleted, message), ...} — 입력의 모든 URL 포함,
+             캐시 판정을 그대로 쓴 URL 집합 — 이번에 실제로 확인하지 않았으므로 확인 시각을 갱신하지 않을 대상)
+        """
+        results = {}
+        cached_urls = set()
+        # 정규화 URL 이 같은 URL 들은 대표 URL 하나만 확인
+        pending = {}
+        for url in dict.fromkeys(u for u in urls if u):
+            cached = self.get(url)
+            if cached is not None:
+                results[url] = cached
+                cached_urls.add(url)
+                continue
+            pending.setdefault(self.normalize(url) or url, []).append(url)
+
+        checked = check([group[0] for group in pending.values()]) if pending else {}
+        fresh = {}
+        for group in pending.values():
+            fresh[group[0]] = checked.get(group[0], (None, "삭제 확인 결과 없음"))
+            for url in group:
+                results[url] = fresh[group[0]]
+        if fresh:
+            try:
+                self.put_many(fresh)
+            except sqlite3.Error as e:
+                logging.warning(f"삭제 확인 캐시 저장 실패: {e}")
+
+        with self._lock:
+            self._hits += len(cached_urls)
+            self._misses += len(pending)
+            self._deduped += sum(len(group) - 1 for group in pending.values())
+        return results, cached_urls
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            {'enabled', 'hits', 'misses', 'deduped', 'invalidated', 'stored', 'hit_ratio', 'entries'}
+        """
+        with self._lock:
+            stats = {
+                'enabled': self.enabled,
+                'hits': self._hits,
+                'misses': self._misses,
+                'deduped': self._deduped,
+                'invalidated': self._invalidated,
+                'stored': self._stored,
+            }
+        looked_up = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round(stats['hits'] / looked_up, 3) if looked_up else 0.0
+        stats['entries'] = 0
+        if self.enabled:
+            try:
+                stats['entries'] = self._connect().execute('SELECT COUNT(*) FROM verdicts').fetchone()[0]
+            except sqlite3.Error:
+                pass
+        return stats
+
+    def log_stats(self):
+        s = self.stats()
+        if not s['enabled'] or not (s['hits'] + s['misses']):
+            return
+        logging.info(
+            f"삭제 확인 캐시: 조회 {s['hits'] + s['misses']}건 중 {s['hits']}건({s['hit_ratio']:.0%}) 재확인 생략, "
+            f"실제 확인 {s['misses']}건, 같은 글 중복 {s['deduped']}건, 검색 결과 이탈로 재확인 {s['invalidated']}건 "
+            f"(보관 {s['entries']}건)"
+        )
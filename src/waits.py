@@ -0,0 +1,191 @@
+"""
+Selenium 조건 대기 모듈
+고정 sleep 대신 명시적 조건(alert 표시, document.readyState, 요소 존재, DOM 변경 멈춤)이
+충족되는 즉시 진행하고, 조건마다 최대 대기 시간(timeout)을 둠.
+조건별 실제 대기 시간/타임아웃 횟수를 집계.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Iterable
+
+from selenium.common.exceptions import (
+    NoAlertPresentException, UnexpectedAlertPresentException, WebDriverException,
+)
+
+from src.config import WAIT_POLL_INTERVAL, WAIT_DOM_QUIET_MS
+
+# 최초 호출 시 MutationObserver를 설치하고, 마지막 DOM 변경 이후 경과 시간(ms)과 readyState 반환
+_DOM_QUIET_SCRIPT = """
+if (!window.__kwDomWatch) {
+    window.__kwDomWatch = {last: performance.now()};
+    new MutationObserver(function () { window.__kwDomWatch.last = performance.now(); })
+        .observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+}
+return [document.readyState, performance.now() - window.__kwDomWatch.last];
+"""
+
+# iframe(같은 출처) 문서 로딩이 끝났고 선택자 중 하나와 일치하는 요소가 있는지 (접근 불가면 false)
+_FRAME_CONTENT_SCRIPT = """
+var frame = document.getElementById(arguments[0]);
+var doc = null;
+try { doc = frame && frame.contentDocument; } catch (e) { return false; }
+if (!doc || doc.readyState !== 'complete') { return false; }
+return arguments[1].some(function (css) { return doc.querySelector(css) !== null; });
+"""
+
+
+class PageWaiter:
+    """조건 충족 시 즉시 반환하는 Selenium 대기 도우미 (조건별 대기 시간 집계)"""
+
+    def __init__(self, poll_interval: float = WAIT_POLL_INTERVAL, dom_quiet_ms: int = WAIT_DOM_QUIET_MS):
+        """
+        Args:
+            poll_interval: 조건 확인 간격 (초)
+            dom_quiet_ms: DOM 변경이 이 시간(ms) 동안 없으면 렌더링 완료로 판단
+        """
+        self.poll_interval = poll_interval
+        self.dom_quiet_ms = dom_quiet_ms
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def _record(self, name: str, waited: float, timed_out: bool):
+        with self._lock:
+            s = self._stats.setdefault(name, {'calls': 0, 'timeouts': 0, 'waited_seconds': 0.0, 'max_seconds': 0.0})
+            s['calls'] += 1
+            s['waited_seconds'] += waited
+            s['max_seconds'] = max(s['max_seconds'], waited)
+            if timed_out:
+                s['timeouts'] += 1
+
+    def until(self, name: str, driver, condition: Callable, timeout: float):
+        """
+        condition(driver)가 참 값을 반환할 때까지 대기.
+
+        Args:
+            name: 통계용 조건 이름
+            driver: WebDriver
+            condition: (driver) -> 값. 참 값이면 대기 종료 (WebDriverException은 미충족으로 간주)
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            condition 의 반환값 (타임아웃이면 None)
+        """
+        started = time.monotonic()
+        deadline = started + timeout
+        value = None
+        while True:
+            try:
+                value = condition(driver)
+            except UnexpectedAlertPresentException:
+                # 조건 확인 중 alert가 뜬 경우 — 호출 측에서 처리
+                self._record(name, time.monotonic() - started, False)
+                raise
+            except WebDriverException:
+                value = None
+            if value or time.monotonic() >= deadline:
+                break
+            time.sleep(min(self.poll_interval, max(0.0, deadline - time.monotonic())))
+        self._record(name, time.monotonic() - started, not value)
+        return value or None
+
+    # ─────────────────────────────────────────
+    # 조건
+    # ─────────────────────────────────────────
+    @staticmethod
+    def _alert(driver):
+        try:
+            return driver.switch_to.alert
+        except NoAlertPresentException:
+            return None
+
+    @staticmethod
+    def _any_present(driver, selectors):
+        return any(driver.execute_script('return document.querySelector(arguments[0]) !== null', css)
+                   for css in selectors)
+
+    @staticmethod
+    def _frame_content(driver, frame_id, selectors):
+        return driver.execute_script(_FRAME_CONTENT_SCRIPT, frame_id, list(selectors))
+
+    def _dom_quiet(self, driver):
+        ready_state, quiet_ms = driver.execute_script(_DOM_QUIET_SCRIPT)
+        return ready_state == 'complete' and quiet_ms >= self.dom_quiet_ms
+
+    # ─────────────────────────────────────────
+    # 조합 대기
+    # ─────────────────────────────────────────
+    def _alert_or(self, name: str, driver, done: Callable, timeout: float):
+        """alert가 뜨거나 done(driver)가 참이 될 때까지 대기. 반환값: alert 객체 (alert가 없으면 None)"""
+        def condition(d):
+            # alert가 떠 있는 상태에서 스크립트를 실행하면 alert가 닫히므로 alert를 먼저 확인
+            alert = self._alert(d)
+            if alert is not None:
+                return alert
+            return 'done' if done(d) else None
+
+        value = self.until(name, driver, condition, timeout)
+        return value if value not in (None, 'done') else None
+
+    def alert_or_settled(self, driver, timeout: float):
+        """
+        alert가 뜨거나 (문서 로딩 완료 + DOM 변경 멈춤) 중 먼저 오는 쪽까지 대기 (블로그 글).
+        블로그는 삭제/비공개 안내가 본문 문서에 바로 그려지므로 DOM이 조용해지면 판정 가능.
+
+        Returns:
+            alert 객체 (alert가 없으면 None)
+        """
+        return self._alert_or('alert_or_settled', driver, self._dom_quiet, timeout)
+
+    def alert_or_frame_content(self, driver, frame_id: str, selectors: Iterable[str], timeout: float):
+        """
+        alert가 뜨거나 iframe(frame_id) 안에 본문 요소가 생길 때까지 대기 (카페 글).
+        카페 글은 iframe 안에서 비동기 API 응답 뒤에 삭제 alert를 띄우므로 상위 문서의 DOM이
+        조용해져도 판정할 수 없음 — 본문이 보이지 않으면 timeout 까지 alert를 기다림.
+
+        Returns:
+            alert 객체 (alert가 없으면 None)
+        """
+        selectors = tuple(selectors)
+        return self._alert_or('alert_or_frame_content', driver,
+                              lambda d: self._frame_content(d, frame_id, selectors), timeout)
+
+    def presence(self, driver, selectors: Iterable[str], timeout: float, name: str = 'presence') -> bool:
+        """CSS 선택자 중 하나라도 일치하는 요소가 생길 때까지 대기"""
+        selectors = tuple(selectors)
+        return bool(self.until(name, driver, lambda d: self._any_present(d, selectors), timeout))
+
+    def dom_quiet(self, driver, timeout: float) -> bool:
+        """문서 로딩 완료 후 DOM 변경이 dom_quiet_ms 동안 없을 때까지 대기 (MutationObserver)"""
+        return bool(self.until('dom_quiet', driver, self._dom_quiet, timeout))
+
+    def rendered(self, driver, selectors: Iterable[str], timeout: float) -> bool:
+        """
+        레이아웃 측정용: 결과 요소가 생기고 DOM 변경이 멈출 때까지 대기.
+        두 단계가 timeout 하나를 나눠 쓰므로 최악의 경우에도 timeout 을 넘지 않음.
+        """
+        deadline = time.monotonic() + timeout
+        found = self.presence(driver, selectors, timeout, name='render_presence')
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            self.dom_quiet(driver, remaining)
+        return found
+
+    def stats(self) -> dict:
+        """조건별 {'calls', 'timeouts', 'waited_seconds', 'max_seconds', 'avg_seconds'}"""
+        with self._lock:
+            stats = {name: dict(s) for name, s in self._stats.items()}
+        for s in stats.values():
+            s['avg_seconds'] = round(s['waited_seconds'] / s['calls'], 3) if s['calls'] else None
+            s['waited_seconds'] = round(s['waited_seconds'], 2)
+            s['max_seconds'] = round(s['max_seconds'], 2)
+        return stats
+
+    def log_stats(self):
+        """조건별 대기 통계를 로그로 출력"""
+        for name, s in self.stats().items():
+            logging.info(
+                f"대기 통계 [{name}]: {s['calls']}회, 평균 {s['avg_seconds']}초, "
+                f"최대 {s['max_seconds']}초, 타임아웃 {s['timeouts']}회"
+            )
@@ -0,0 +1,256 @@
+"""
+워치독 (멈춘 Selenium/HTTP 작업 감시)
+- 작업별 제한 시간: 페이지 로딩 / 스크립트 실행은 chromedriver 타임아웃, HTTP는 연결/응답/전체 수신 타임아웃
+- chromedriver 자체가 멈춰 제한 시간 + 유예 시간이 지나도 응답이 없으면
+  chromedriver → Chrome 프로세스 트리를 강제 종료 (드라이버 풀이 폐기 후 새로 생성)
+- 이전 실행이 비정상 종료되며 남긴 Chrome 프로세스/프로필 폴더 정리
+  (이 모듈로 띄운 Chrome은 --user-data-dir 폴더 이름에 표식과 실행 프로세스 pid가 들어 있음)
+- 개입(제한 시간 초과, 강제 종료, 정리) 내역을 작업별로 집계
+"""
+
+import glob
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Optional
+
+from selenium.common.exceptions import TimeoutException
+
+from src.config import WATCHDOG_KILL_GRACE
+from src.process_tree import find_processes, kill_tree, pid_alive, process_cmdline
+
+# Chrome 프로필 폴더 이름 표식: kwexp-chrome-<실행 프로세스 pid>-<임의 문자열>
+PROFILE_DIR_MARKER = 'kwexp-chrome-'
+_PROFILE_OWNER_RE = re.compile(re.escape(PROFILE_DIR_MARKER) + r'(\d+)-')
+
+
+class WatchdogTimeout(Exception):
+    """워치독이 멈춘 작업의 브라우저를 강제 종료함"""
+
+
+class Watchdog:
+    """작업 제한 시간 감시 + 멈춘 브라우저 강제 종료 (스레드 안전)"""
+
+    def __init__(self, grace: float = WATCHDOG_KILL_GRACE, check_interval: float = 1.0,
+                 driver_pid=None, recent: int = 20):
+        """
+        Args:
+            grace: 작업 제한 시간을 넘긴 뒤 강제 종료까지 기다리는 시간 (초)
+            check_interval: 감시 스레드 확인 주기 (초)
+            driver_pid: 드라이버의 chromedriver pid 조회 함수 (driver) -> pid or None
+            recent: 최근 개입 내역 보관 건수
+        """
+        self.grace = grace
+        self.check_interval = check_interval
+        self._driver_pid = driver_pid or (lambda driver: driver.service.process.pid)
+
+        self._lock = threading.Lock()
+        self._active = {}
+        self._next_token = 0
+        self._thread = None
+        self._recent = deque(maxlen=recent)
+        self._stats = {
+            'guarded': 0,
+            'timeouts': 0,
+            'kills': 0,
+            'orphans_reaped': 0,
+        }
+        self._by_operation = {}
+
+    # ----- Chrome 프로필 폴더 (고아 프로세스 식별용) -----
+
+    @staticmethod
+    def make_profile_dir() -> str:
+        """이 프로세스 표식이 들어간 Chrome --user-data-dir 폴더 생성"""
+        return tempfile.mkdtemp(prefix=f'{PROFILE_DIR_MARKER}{os.getpid()}-')
+
+    @staticmethod
+    def remove_profile_dir(path: Optional[str]):
+        """Chrome 종료 후 프로필 폴더 삭제 (실패 무시 — 남으면 다음 실행의 reap_orphans 가 정리)"""
+        if path:
+            shutil.rmtree(path, ignore_errors=True)
+
+    @staticmethod
+    def _orphan_owner(text: str) -> Optional[int]:
+        """프로필 표식에서 실행 프로세스 pid를 꺼내, 이미 종료된 프로세스면 pid 반환 (아니면 None)"""
+        match = _PROFILE_OWNER_RE.search(text)
+        if not match:
+            return None
+        owner = int(match.group(1))
+        # 조회 불가(None)나 같은 pid 재사용으로 살아있는 것처럼 보이면 건드리지 않음
+        if owner == os.getpid() or pid_alive(owner) is not False:
+            return None
+        return owner
+
+    def reap_orphans(self) -> int:
+        """
+        종료된 이전 실행이 남긴 Chrome 프로세스(와 부모 chromedriver), 프로필 폴더 정리.
+        반환값: 종료한 프로세스 트리 수
+        """
+        reaped = 0
+        try:
+            processes = find_processes(PROFILE_DIR_MARKER)
+        except Exception as e:
+            logging.info(f"고아 Chrome 프로세스 조회 실패 (무시): {e}")
+            processes = []
+        killed = set()
+        for pid, ppid, cmdline in processes:
+            if pid in killed or self._orphan_owner(cmdline) is None:
+                continue
+            # Chrome만 남기고 chromedriver가 살아 있으면 chromedriver부터 트리째 종료
+            parent_cmdline = process_cmdline(ppid) if ppid and ppid > 1 else None
+            root = ppid if parent_cmdline and 'chromedriver' in parent_cmdline else pid
+            if kill_tree(root):
+                reaped += 1
+                self._record('orphan', cmdline.split(' ', 1)[0], None, 'reaped')
+            killed.update({pid, root})
+
+        for path in glob.glob(os.path.join(tempfile.gettempdir(), PROFILE_DIR_MARKER + '*')):
+            if self._orphan_owner(os.path.basename(path)) is not None:
+                shutil.rmtree(path, ignore_errors=True)
+
+        if reaped:
+            with self._lock:
+                self._stats['orphans_reaped'] += reaped
+            logging.warning(f"워치독: 이전 실행이 남긴 Chrome 프로세스 {reaped}개 정리")
+        return reaped
+
+    # ----- 작업 감시 -----
+
+    def _ensure_thread(self):
+        """감시 스레드 시작 (첫 guard 때 한 번, lock 보유 상태에서 호출)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='watchdog', daemon=True)
+            self._thread.start()
+
+    @contextmanager
+    def guard(self, op: str, driver, timeout: float, target: str = ''):
+        """
+        드라이버 작업 감시 컨텍스트.
+        블록이 timeout + grace 초 안에 끝나지 않으면 드라이버 프로세스 트리를 강제 종료하고,
+        그로 인해 블록에서 난 예외는 WatchdogTimeout 으로 바꿔 전파.
+        chromedriver 자체 제한 시간 초과(TimeoutException)도 개입으로 기록.
+
+        Args:
+            op: 작업 이름 (page_load / deletion_check / layout 등, 통계 구분용)
+            driver: 작업에 쓰는 WebDriver
+            timeout: 작업 제한 시간 (초)
+            target: 기록용 대상 (URL 등)
+        """
+        started = time.monotonic()
+        entry = {
+            'op': op,
+            'target': target,
+            'driver': driver,
+            'started': started,
+            'kill_at': started + timeout + self.grace,
+            'killed': False,
+        }
+        with self._lock:
+            token = self._next_token
+            self._next_token += 1
+            self._active[token] = entry
+            self._stats['guarded'] += 1
+            self._ensure_thread()
+        try:
+            yield
+        except WatchdogTimeout:
+            raise
+        except TimeoutException as e:
+            # 중첩된 guard 에서는 가장 안쪽 작업으로 한 번만 기록
+            if not entry['killed'] and not getattr(e, '_watchdog_recorded', False):
+                e._watchdog_recorded = True
+                self._record(op, target, time.monotonic() - started, 'timeout')
+            raise
+        except Exception as e:
+            if entry['killed']:
+                raise WatchdogTimeout(f"{op} {time.monotonic() - started:.0f}초 무응답 — 브라우저 강제 종료") from e
+            raise
+        finally:
+            with self._lock:
+                self._active.pop(token, None)
+
+    def _run(self):
+        """제한 시간을 넘긴 작업의 드라이버 강제 종료 (감시 스레드)"""
+        while True:
+            time.sleep(self.check_interval)
+            now = time.monotonic()
+            with self._lock:
+                overdue = [e for e in self._active.values() if not e['killed'] and now >= e['kill_at']]
+                for entry in overdue:
+                    entry['killed'] = True
+            for entry in overdue:
+                self._kill(entry, now - entry['started'])
+
+    def _kill(self, entry: dict, elapsed: float):
+        """멈춘 드라이버의 chromedriver/Chrome 트리 종료 (같은 드라이버의 다른 작업도 종료 처리)"""
+        driver = entry['driver']
+        with self._lock:
+            for other in self._active.values():
+                if other['driver'] is driver:
+                    other['killed'] = True
+        try:
+            pid = self._driver_pid(driver)
+        except Exception:
+            pid = None
+        killed = kill_tree(pid) if pid else 0
+        self._record(entry['op'], entry['target'], elapsed, 'killed' if killed else 'kill_failed')
+        logging.warning(
+            f"워치독: '{entry['op']}' {elapsed:.0f}초 무응답 ({entry['target']}) — "
+            f"chromedriver 프로세스 트리 강제 종료 (pid {pid}, {killed}개)"
+        )
+
+    def record(self, op: str, target: str, elapsed: Optional[float], action: str = 'timeout'):
+        """워치독 밖에서 감지한 개입 기록 (HTTP 제한 시간 초과 등)"""
+        self._record(op, target, elapsed, action)
+
+    def _record(self, op: str, target: str, elapsed: Optional[float], action: str):
+        with self._lock:
+            per_op = self._by_operation.setdefault(op, {'timeouts': 0, 'kills': 0, 'max_seconds': 0.0})
+            if action == 'timeout':
+                self._stats['timeouts'] += 1
+                per_op['timeouts'] += 1
+            elif action in ('killed', 'kill_failed'):
+                self._stats['kills'] += 1
+                per_op['kills'] += 1
+            if elapsed is not None:
+                per_op['max_seconds'] = max(per_op['max_seconds'], round(elapsed, 1))
+            self._recent.append({
+                'op': op,
+                'target': target,
+                'seconds': round(elapsed, 1) if elapsed is not None else None,
+                'action': action,
+                'at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            })
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            {
+                'guarded', 'timeouts', 'kills', 'orphans_reaped',
+                'by_operation': {작업 이름: {'timeouts', 'kills', 'max_seconds'}},
+                'recent': [{'op', 'target', 'seconds', 'action', 'at'}, ...],
+            }
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['by_operation'] = {op: dict(s) for op, s in self._by_operation.items()}
+            stats['recent'] = list(self._recent)
+        return stats
+
+    def log_stats(self):
+        s = self.stats()
+        if not (s['timeouts'] or s['kills'] or s['orphans_reaped']):
+            return
+        logging.info(
+            f"워치독 통계: 감시 {s['guarded']}건, 제한 시간 초과 {s['timeouts']}건, "
+            f"강제 종료 {s['kills']}건, 고아 프로세스 정리 {s['orphans_reaped']}건"
+        )
+        for op, o in s['by_operation'].items():
+            logging.info(f"  [{op}] 초과 {o['timeouts']}건, 강제 종료 {o['kills']}건, 최장 {o['max_seconds']}초")
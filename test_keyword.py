@@ -47,6 +47,9 @@ def main():
     # 모니터링 실행
     scraper = NaverScraper()
     scraper.reset_driver()
+    # 아래 디버그 출력에 HTML 트리가 필요하므로 파싱 워커(PARSE_WORKERS)/브라우저 추출 없이 직접 파싱
+    scraper.parse_pool.workers = 0
+    scraper.browser_extractor.enabled = False
 
     soup = scraper.get_search_results(TARGET_KEYWORD, page=1)
     if not soup:
@@ -55,6 +58,8 @@ def main():
 
     search_urls = scraper.extract_main_urls(soup)
     popular_urls = scraper.extract_popular_post_urls(soup)
+    # 디버그 출력은 BeautifulSoup 기준 (HTML_PARSER_BACKEND 가 lxml/selectolax 여도 같은 트리로 변환)
+    soup = soup.to_soup()
 
     # HTML 저장
     with open('debug_search.html', 'w', encoding='utf-8') as f: